@@ -55,3 +55,28 @@ pub export fn publicExportTest(a: ?*u32, b: *myStruct) void {
         assert self.printer.print(function).replace("\r\n", "\n") == """
 fn testFuncParams(abc: ?usize, comptime len: u32) !void {}
 """.strip()
+
+    def test_function_doc_comment_print(self):
+        function = FunctionDeclaration(
+            name="documented",
+            body="{}",
+            return_type=self.file.content[0].return_type,
+            doc_comment="Does nothing.\n\nReally.",
+        )
+        assert self.printer.print(function) == (
+            "/// Does nothing.\n///\n/// Really.\nfn documented() usize {}"
+        )
+
+    def test_function_signature_print(self):
+        function: FunctionDeclaration = cast(FunctionDeclaration, self.file.content[8])
+        assert function.calling_convention == ".c"
+        assert [param.is_noalias for param in function.params] == [True, True, False]
+        assert self.printer.print(function) == (
+            "extern fn memcpy(noalias dest: [*]u8, noalias src: [*]const u8, n: usize) "
+            "callconv(.c) ?[*]u8;"
+        )
+
+        built = FunctionDeclaration(name="f", body=None, return_type=function.return_type)
+        assert built.calling_convention is None
+        built.calling_convention = ".naked"
+        assert self.printer.print(built) == "fn f() callconv(.naked) ?[*]u8;"
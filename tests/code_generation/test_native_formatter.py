@@ -0,0 +1,31 @@
+import pytest
+
+from zyntex.code_generation.premade import NativeFormatter
+from zyntex.code_generation import PrinterDispatcher
+from zyntex.parsing import SourceCode
+
+
+class TestNativeFormatter:
+
+    @classmethod
+    def setup_class(cls):
+        cls.dispatcher = PrinterDispatcher()
+        cls.dispatcher.add(SourceCode, NativeFormatter)
+
+    def test_formats_source_code(self):
+        code = SourceCode("//! Module docs.\n/// Adds.\npub   fn add(a:i32,b:i32) i32 { return a+b; } // sum\n")
+        assert self.dispatcher.print(code) == (
+            "//! Module docs.\n"
+            "/// Adds.\n"
+            "pub fn add(a: i32, b: i32) i32 {\n"
+            "    return a + b;\n"
+            "} // sum\n"
+        )
+
+    def test_formats_translation_unit(self):
+        unit = SourceCode("const  x =  5;").unit
+        assert NativeFormatter(self.dispatcher).print(unit) == "const x = 5;\n"
+
+    def test_rejects_invalid_source(self):
+        with pytest.raises(RuntimeError):
+            self.dispatcher.print(SourceCode("const x = 5"))
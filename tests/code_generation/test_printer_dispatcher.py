@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from zyntex.code_generation import IPrinter, PrinterDispatcher
+from zyntex.code_generation.premade import IDefaultPrintable
+from zyntex.parsing import SourceCode
+
+
+class Base:
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+class BasePrinter(IPrinter):
+    def print(self, target: Base) -> str:
+        return "base"
+
+
+class DerivedPrinter(IPrinter):
+    def print(self, target: Derived) -> str:
+        return "derived"
+
+
+class TestPrinterDispatcher:
+
+    def test_resolves_subclasses_through_mro(self):
+        dispatcher = PrinterDispatcher()
+        dispatcher.add(Base, BasePrinter)
+        assert dispatcher.print(Derived()) == "base"
+
+        dispatcher.add(Derived, DerivedPrinter)
+        assert dispatcher.print(Derived()) == "derived"
+        assert dispatcher.print(Base()) == "base"
+
+        dispatcher.remove(Derived)
+        assert dispatcher.print(Derived()) == "base"
+
+    def test_raises_for_unregistered_types(self):
+        dispatcher = PrinterDispatcher()
+        dispatcher.add(Derived, DerivedPrinter)
+        with pytest.raises(KeyError):
+            dispatcher.print(Base())
+
+        dispatcher.remove(Derived)
+        with pytest.raises(KeyError):
+            dispatcher.print(Derived())
+
+    def test_prints_many_targets(self, tmp_path):
+        dispatcher = IDefaultPrintable.default_dispatcher
+        sources = [SourceCode(f"const value{index}: u8 = {index};") for index in range(8)]
+        expected = [f"const value{index}: u8 = {index};" for index in range(8)]
+
+        assert dispatcher.print_many(sources, workers=4) == expected
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert dispatcher.print_many(iter(sources), executor=executor) == expected
+
+        destinations = [str(tmp_path / f"file{index}.zig") for index in range(8)]
+        dispatcher.write_many(sources, destinations)
+        for destination, output in zip(destinations, expected):
+            with open(destination, encoding="utf-8") as fp:
+                assert fp.read() == output
+
+        with pytest.raises(ValueError):
+            dispatcher.write_many(sources, destinations[:1])
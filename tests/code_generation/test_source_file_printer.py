@@ -1,3 +1,4 @@
+from io import StringIO
 from pathlib import Path
 
 from zyntex.code_generation.premade import SourceFilePrinter, VariablePrinter, TestPrinter
@@ -16,6 +17,7 @@ class TestSourceFilePrinter:
         cls.dispatcher = PrinterDispatcher()
         cls.dispatcher.add(TestDeclaration, TestPrinter)
         cls.dispatcher.add(VariableDeclaration, VariablePrinter)
+        cls.dispatcher.add(SourceFile, SourceFilePrinter)
         cls.printer = SourceFilePrinter(cls.dispatcher)
 
     def test_prints_source_file_with_default_configuration(self):
@@ -36,3 +38,12 @@ test "assert example" {
 }"""
 
         self.dispatcher.configuration.line_ending = "\n\n"
+
+    def test_streams_source_file(self):
+        chunks = list(self.dispatcher.iter_print(self.file))
+        assert len(chunks) == 5
+        assert "".join(chunks) == self.printer.print(self.file)
+
+        output = StringIO()
+        self.dispatcher.write(self.file, output)
+        assert output.getvalue() == self.printer.print(self.file)
@@ -17,4 +17,5 @@ export fn privateExportTest() usize {}
 
 const myStruct = struct {};
 
-fn testFuncParams(abc: ?usize, comptime len: u32) !void {}
\ No newline at end of file
+fn testFuncParams(abc: ?usize, comptime len: u32) !void {}
+extern "c" fn memcpy(noalias dest: [*]u8, noalias src: [*]const u8, n: usize) callconv(.c) ?[*]u8;
@@ -6,4 +6,10 @@ extern const externPrivateVariable: ?*[2]usize;
 pub extern var externPublicVariable: *?*void;
 
 pub export var exportPublicVariable: u32 = 15;
-export const exportPrivateVariable: i32 = -25;
\ No newline at end of file
+export const exportPrivateVariable: i32 = -25;
+
+const sliceVariable: [:0]const u8 = "abc";
+var manyPointerVariable: [*]align(4) u8 = undefined;
+var cPointerVariable: [*c]const [4:0]u8 = undefined;
+const allocatorVariable: ?std.mem.Allocator = null;
+const errorUnionVariable: anyerror!*const u32 = undefined;
\ No newline at end of file
@@ -41,3 +41,15 @@ class TestVariablePrinter:
 
         export_private = cast(VariableDeclaration, self.file.content[6])
         assert self.printer.print(export_private) == "export const exportPrivateVariable: i32 = -25;"
+
+    def test_structural_types(self):
+        expected = [
+            "const sliceVariable: [:0]const u8 = \"abc\";",
+            "var manyPointerVariable: [*]align(4) u8 = undefined;",
+            "var cPointerVariable: [*c]const [4:0]u8 = undefined;",
+            "const allocatorVariable: ?std.mem.Allocator = null;",
+            "const errorUnionVariable: anyerror!*const u32 = undefined;",
+        ]
+        assert len(self.file.content[7:]) == len(expected)
+        for variable, line in zip(self.file.content[7:], expected):
+            assert self.printer.print(cast(VariableDeclaration, variable)) == line
@@ -1,6 +1,6 @@
 from typing import cast
 
-from zyntex.parsing.syntax import FunctionDeclaration
+from zyntex.parsing.syntax import FunctionDeclaration, LazyInit
 from zyntex.parsing.bindings import PrimitiveType
 from zyntex.parsing import SourceCode
 
@@ -94,6 +94,14 @@ fn testFunc(a: usize, b: usize, comptime c: u32) usize {    _ = c;\n    return a
         assert function_decl.params[0].type.pointer_type.type == PrimitiveType.u32
         assert function_decl.params[0].type.absolute_type == PrimitiveType.u32
 
+    def test_function_extern_library(self):
+        code = SourceCode('pub extern "c" fn testing() void;')
+        function_decl: FunctionDeclaration = cast(FunctionDeclaration, code.content[0])
+        assert function_decl.is_public is True
+        assert function_decl.is_extern is True
+        assert function_decl.is_export is False
+        assert function_decl.name == "testing"
+
     def test_function_export(self):
         code = SourceCode("pub export fn testExport() *void {}")
         assert len(code.content) == 1
@@ -109,3 +117,31 @@ fn testFunc(a: usize, b: usize, comptime c: u32) usize {    _ = c;\n    return a
         assert function_decl.return_type.pointer_type.type == PrimitiveType.void
         assert function_decl.return_type.absolute_type == PrimitiveType.void
         assert len(function_decl.params) == 0
+
+    def test_function_doc_comment(self):
+        code = SourceCode(
+            "/// Adds two numbers.\n///\n///Returns the sum.\npub fn add() void {}\nfn f() void {}"
+        )
+        assert len(code.content) == 2
+        function_decl: FunctionDeclaration = cast(FunctionDeclaration, code.content[0])
+        assert function_decl.name == "add"
+        assert function_decl.doc_comment == "Adds two numbers.\n\nReturns the sum."
+        assert cast(FunctionDeclaration, code.content[1]).doc_comment is None
+
+    def test_function_lazy_attributes(self):
+        code = SourceCode("pub fn testFunc() void {}")
+        function_decl: FunctionDeclaration = cast(FunctionDeclaration, code.content[0])
+        assert isinstance(vars(function_decl)["_name"], LazyInit)
+        assert function_decl.name == "testFunc"
+        assert vars(function_decl)["name"] == "testFunc"
+        assert "_name" not in vars(function_decl)
+
+        function_decl.name = "renamed"
+        function_decl.is_public = False
+        assert function_decl.name == "renamed"
+        assert vars(function_decl)["name"] == "renamed"
+        assert function_decl.is_public is False
+
+        created = FunctionDeclaration(name="created", body=None, return_type=function_decl.return_type)
+        assert created.name == "created"
+        assert created.params == []
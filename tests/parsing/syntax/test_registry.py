@@ -0,0 +1,46 @@
+from zyntex.parsing import SourceCode
+from zyntex.parsing.bindings import NodeTag
+from zyntex.parsing.syntax import (
+    ElementRegistry, VariableDeclaration, FunctionDeclaration, TestDeclaration, default_registry
+)
+
+
+class ComptimeBlock(VariableDeclaration):
+    @classmethod
+    def from_node(cls, node):
+        return cls(name="comptime", value=None, type_hint=None)
+
+
+class TestElementRegistry:
+
+    def test_default_registry(self):
+        assert default_registry.element_types == (
+            FunctionDeclaration, VariableDeclaration, TestDeclaration
+        )
+        code = SourceCode("extern fn puts(s: [*:0]const u8) c_int;\ntest {}\ncomptime {}")
+        assert [type(element) for element in code.content] == [FunctionDeclaration, TestDeclaration]
+
+        code = SourceCode("fn a() void {}\nfn b() void;\nvar c: u8 align(4) = 0;\ntest {}")
+        for node in code.unit.root_nodes():
+            element_type = default_registry.element_type(node)
+            assert element_type is None or element_type.is_node_valid(node)
+        assert [type(element) for element in code.content] == [
+            FunctionDeclaration, VariableDeclaration, TestDeclaration
+        ]
+
+    def test_custom_element(self):
+        default_registry.register(ComptimeBlock, (NodeTag.COMPTIME,))
+        try:
+            code = SourceCode("const a = 1;\ncomptime {}")
+            assert [type(element) for element in code.content] == [VariableDeclaration, ComptimeBlock]
+            assert ComptimeBlock in code.types
+        finally:
+            default_registry.unregister(ComptimeBlock)
+        assert ComptimeBlock not in default_registry.element_types
+
+    def test_predicate(self):
+        registry = ElementRegistry()
+        registry.register(TestDeclaration, (NodeTag.TEST_DECL,), lambda node: False)
+        registry.register(VariableDeclaration, (NodeTag.TEST_DECL,))
+        node = SourceCode("test {}").unit.root_nodes()[0]
+        assert registry.element_type(node) is VariableDeclaration
@@ -1,7 +1,7 @@
 from typing import cast
 
-from zyntex.parsing.syntax import VariableDeclaration
-from zyntex.parsing.bindings import PrimitiveType
+from zyntex.parsing.syntax import VariableDeclaration, TypeNode
+from zyntex.parsing.bindings import PrimitiveType, PointerSize
 from zyntex.parsing import SourceCode
 
 
@@ -84,3 +84,47 @@ class TestVariableDeclaration:
         assert variable_decl.is_extern is True
         assert variable_decl.value is None
         assert variable_decl.alignment is None
+
+    def test_variable_doc_comment(self):
+        code = SourceCode(
+            "/// A point.\npub const Point = struct {\n    x: u32,\n};\n// Not a doc.\nvar y = 1;"
+        )
+        assert len(code.content) == 2
+        container_decl: VariableDeclaration = cast(VariableDeclaration, code.content[0])
+        assert container_decl.name == "Point"
+        assert container_decl.doc_comment == "A point."
+        assert cast(VariableDeclaration, code.content[1]).doc_comment is None
+
+        code = SourceCode("/// First.\n// Plain comment.\n//// Also plain.\n\n///Second.\nvar z = 1;")
+        assert cast(VariableDeclaration, code.content[0]).doc_comment == "First.\nSecond."
+
+    def test_structural_type_hints(self):
+        code = SourceCode(
+            "const a: [:0]const u8 = \"\";\n"
+            "const b: ?std.mem.Allocator = null;\n"
+            "const c: error{Oops}![*]u8 = undefined;\n"
+        )
+        slice_type = cast(VariableDeclaration, code.content[0]).type_hint
+        assert slice_type.is_pointer() and slice_type.is_slice()
+        assert slice_type.pointer_size == PointerSize.SLICE
+        assert slice_type.sentinel == "0"
+        assert slice_type.pointer_type.is_const
+        assert slice_type.absolute_type == PrimitiveType.u8
+
+        optional_type = cast(VariableDeclaration, code.content[1]).type_hint
+        assert optional_type.optional_type.type == TypeNode.CustomType("std.mem.Allocator")
+
+        error_union_type = cast(VariableDeclaration, code.content[2]).type_hint
+        assert error_union_type.is_error_union
+        assert error_union_type.error_set.type == TypeNode.CustomType("error{Oops}")
+        assert error_union_type.pointer_size == PointerSize.MANY
+        assert error_union_type.absolute_type == PrimitiveType.u8
+
+    def test_expression_type_hints(self):
+        code = SourceCode("var x: @TypeOf(y) = y;\nvar p: struct { a: u8 } = .{ .a = 1 };")
+        type_of = cast(VariableDeclaration, code.content[0]).type_hint
+        assert type_of.type == TypeNode.CustomType("@TypeOf(y)")
+
+        struct_type = cast(VariableDeclaration, code.content[1]).type_hint
+        assert struct_type.type == TypeNode.CustomType("struct { a: u8 }")
+        assert struct_type.absolute_type == TypeNode.CustomType("struct { a: u8 }")
@@ -0,0 +1,64 @@
+import copy
+from typing import cast
+
+from zyntex.parsing.syntax import FunctionDeclaration, VariableDeclaration, TypeNode, InternTable
+from zyntex.parsing.bindings import PrimitiveType
+from zyntex.parsing import SourceCode, api_diff
+
+
+class TestApiDiff:
+
+    def test_structural_hash(self):
+        first = SourceCode("/// Docs.\npub fn add(a: u32, b: u32) u32 {\n    return a + b;\n}")
+        second = SourceCode("pub fn add(a: u32,b: u32) u32 { return a + b; } // Comment.")
+        third = SourceCode("pub fn add(a: u32, b: u32) u32 { return a - b; }")
+        first_fn = cast(FunctionDeclaration, first.content[0])
+        second_fn = cast(FunctionDeclaration, second.content[0])
+        third_fn = cast(FunctionDeclaration, third.content[0])
+
+        assert first_fn.structural_hash == second_fn.structural_hash
+        assert first_fn.structural_hash != third_fn.structural_hash
+        assert first_fn.signature_hash == third_fn.signature_hash
+        assert first_fn.return_type.structural_hash == third_fn.return_type.structural_hash
+        u32_type = TypeNode(type=PrimitiveType.u32)
+        assert first_fn.return_type.structural_hash == u32_type.structural_hash
+        assert FunctionDeclaration(name="f", body=None, return_type=u32_type).structural_hash is None
+        first_fn.name = "renamed"
+        assert first_fn.structural_hash == second_fn.structural_hash
+
+    def test_interned_structural_hash(self):
+        table = InternTable()
+        first = SourceCode("fn a() ?u8 {}", intern_table=table)
+        second = SourceCode("fn b() ?u8 {}", intern_table=table)
+        shared = cast(FunctionDeclaration, first.content[0]).return_type
+        assert shared is cast(FunctionDeclaration, second.content[0]).return_type
+        optional_u8 = TypeNode(optional_type=TypeNode(type=PrimitiveType.u8))
+        assert shared.structural_hash == optional_u8.structural_hash
+
+        changed = copy.copy(shared)
+        changed.optional_type = TypeNode(type=PrimitiveType.u16)
+        assert changed.structural_hash != shared.structural_hash
+        assert shared.structural_hash == optional_u8.structural_hash
+
+    def test_api_diff(self):
+        old = SourceCode(
+            "pub fn kept() void {}\n"
+            "pub fn body() void {}\n"
+            "pub fn changed(a: u8) void {}\n"
+            "pub const removed = 1;\n"
+            "fn private() void {}\n"
+        )
+        new = SourceCode(
+            "pub fn kept() void {}\n"
+            "pub fn body() void { _ = 1; }\n"
+            "pub fn changed(a: u16) void {}\n"
+            "pub const added: u8 = 2;\n"
+            "fn private(a: u8) void {}\n"
+        )
+        diff = api_diff(old.content, new.content)
+        assert [cast(VariableDeclaration, e).name for e in diff.removed] == ["removed"]
+        assert [cast(VariableDeclaration, e).name for e in diff.added] == ["added"]
+        assert [cast(FunctionDeclaration, e[1]).name for e in diff.changed] == ["changed"]
+
+        assert len(api_diff(old.content, new.content, public_only=False).changed) == 2
+        assert not api_diff(old.content, old.content)
@@ -1,8 +1,13 @@
+import copy
+import ctypes
 from typing import cast
 
-from zyntex.parsing.syntax import FunctionDeclaration
-from zyntex.parsing.bindings import PrimitiveType
+import pytest
+
+from zyntex.parsing.syntax import FunctionDeclaration, VariableDeclaration, InternTable, TypeNode
+from zyntex.parsing.bindings import PrimitiveType, NodeTag, ASTToken
 from zyntex.parsing import SourceCode
+from zyntex.code_generation.premade import DefaultCodePrinter
 
 
 class TestSourceCode:
@@ -18,3 +23,63 @@ class TestSourceCode:
         assert function_decl.return_type.is_type()
         assert not function_decl.return_type.is_const
         assert function_decl.return_type.absolute_type == PrimitiveType.void
+
+    def test_diagnostics(self):
+        code = SourceCode("pub fn main() void {")
+        assert code.diagnostics == ["1:21: error: expected statement, found 'EOF'"]
+        assert SourceCode("fn testing() void {}").diagnostics == []
+
+    def test_intern_table(self):
+        table = InternTable()
+        first = SourceCode("const a: ?[]const Allocator = null;", intern_table=table)
+        second = SourceCode("var counter: ?[]const Allocator = null;\nvar counter: u8 = 0;", intern_table=table)
+        first_type = cast(VariableDeclaration, first.content[0]).type_hint
+        second_type = cast(VariableDeclaration, second.content[0]).type_hint
+        assert first_type is second_type
+        assert first_type.absolute_type is second_type.absolute_type
+        assert first_type is not cast(VariableDeclaration, second.content[1]).type_hint
+
+        names = [cast(VariableDeclaration, element).name for element in second.content]
+        assert names[0] is names[1]
+
+        spaced = SourceCode("const b: ? []const  Allocator = null;", intern_table=table)
+        assert cast(VariableDeclaration, spaced.content[0]).type_hint is first_type
+
+        plain = cast(VariableDeclaration, SourceCode("const a: ?[]const Allocator = null;").content[0])
+        assert plain.type_hint is not first_type
+        assert plain.type_hint.absolute_type == first_type.absolute_type
+
+        # Shared types are read-only, copies are not.
+        with pytest.raises(AttributeError):
+            first_type.optional_type.is_const = True
+        with pytest.raises(AttributeError):
+            first_type.absolute_type.value = "Other"
+        copied = copy.copy(first_type)
+        copied.is_const = True
+        assert not first_type.is_const
+        plain.type_hint.is_const = True
+
+    def test_from_elements(self):
+        printer = DefaultCodePrinter().print
+        value = VariableDeclaration("value", "5", TypeNode(type=PrimitiveType.u8), is_const=True)
+        code = SourceCode.from_elements([value], printer, validate=True)
+        assert code.content == [value]
+        assert code.unit.source == "const value: u8 = 5;"
+        assert code.diagnostics == []
+        code.release()
+        assert code.content[0] is value
+        assert code.unit.source == "const value: u8 = 5;"
+
+        broken = VariableDeclaration("1value", "5", None, is_const=True)
+        with pytest.raises(ValueError):
+            SourceCode.from_elements([value, broken], printer, validate=True)
+        assert SourceCode.from_elements([broken], printer).content == [broken]
+
+    def test_bulk_slices(self):
+        unit = SourceCode("const a = 1;\nfn b() void {}").unit
+        assert [node.tag for node in unit.root_nodes()] == [NodeTag.SIMPLE_VAR_DECL, NodeTag.FN_DECL]
+
+        tokens = unit.lib.getTranslationUnitTokens(unit.ptr).to_array(ASTToken)
+        assert len(tokens) == unit.tokens_count()
+        assert memoryview(tokens).nbytes == len(tokens) * ctypes.sizeof(ASTToken)
+        assert [token.start for token in tokens] == [token.start for token in unit.tokens()]
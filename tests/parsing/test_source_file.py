@@ -1,9 +1,11 @@
 from typing import cast
 from pathlib import Path
 
-from zyntex.parsing.syntax import FunctionDeclaration
-from zyntex.parsing.bindings import PrimitiveType
-from zyntex.parsing import SourceFile
+import pytest
+
+from zyntex.parsing.syntax import FunctionDeclaration, InternTable
+from zyntex.parsing.bindings import PrimitiveType, ParseMode
+from zyntex.parsing import SourceFile, SourceCache
 
 
 class TestSourceFile:
@@ -21,6 +23,111 @@ class TestSourceFile:
         assert not function_decl.return_type.is_const
         assert function_decl.return_type.absolute_type == PrimitiveType.void
 
+    def test_diagnostics(self):
+        path = str(self.path_to_test_sources / "invalid.zig")
+        file = SourceFile(file_path=path)
+        assert len(file.errors) == 2
+        assert file.diagnostics == [
+            f"{path}:1:27: error: expected ';' after declaration",
+            f"{path}:3:14: error: expected return type expression, found '{{'",
+        ]
+        assert SourceFile(str(self.path_to_test_sources / "basic.zig")).diagnostics == []
+
+    def test_reload(self, tmp_path: Path):
+        path = tmp_path / "reloaded.zig"
+        path.write_text("fn first() void {}")
+        file = SourceFile(file_path=str(path))
+        unit = file.unit
+        assert [element.name for element in file.content] == ["first"]
+        stale = cast(FunctionDeclaration, file.content[0])
+        stale_node = unit.root_nodes()[0]
+
+        path.write_text("fn second() void {}\nfn third() void {}\nconst")
+        file.reload()
+        assert file.unit is unit
+        assert [element.name for element in file.content] == ["second", "third"]
+        assert stale.name == "first"
+        with pytest.raises(RuntimeError):
+            _ = stale.body
+        with pytest.raises(RuntimeError):
+            _ = stale_node.spelling
+        assert unit.root_nodes()[0].spelling == "second"
+        assert len(file.errors) == 1
+
+        path.unlink()
+        with pytest.raises(RuntimeError):
+            file.reload()
+        assert file.unit.nodes_count() == 1
+
+        unit.release()
+        with pytest.raises(RuntimeError):
+            unit.reset_from_source("const a = 1;")
+
+    def test_release(self):
+        file = SourceFile(file_path=str(self.path_to_test_sources / "basic.zig"))
+        function = cast(FunctionDeclaration, file.content[0])
+        assert function.name == "testing"
+        file.release()
+        assert file.released
+        assert function.name == "testing"
+        assert function.body == "{}"
+        assert cast(FunctionDeclaration, file.content[0]).body == "{}"
+
+    def test_declarations_mode(self, tmp_path: Path):
+        path = tmp_path / "implementation.zig"
+        path.write_text(
+            "pub fn add(a: u32, b: u32) u32 {\n    const sum = a + b;\n    return sum;\n}\n"
+            "pub const limit: u32 = 10;\n"
+        )
+        full = SourceFile(file_path=str(path))
+        declarations = SourceFile(file_path=str(path), mode="declarations")
+        assert declarations.mode == ParseMode.DECLARATIONS
+        assert declarations.unit.nodes_count() < full.unit.nodes_count()
+
+        function = cast(FunctionDeclaration, declarations.content[0])
+        assert function.name == "add"
+        assert [param.name for param in function.params] == ["a", "b"]
+        assert function.body is not None and function.body.split() == ["{", "}"]
+        assert len(declarations.content) == len(full.content)
+        assert declarations.diagnostics == []
+
+        declarations.reload()
+        assert declarations.unit.mode == ParseMode.DECLARATIONS
+
+    def test_cache(self, tmp_path: Path):
+        source = (self.path_to_test_sources / "basic.zig").read_text()
+        (tmp_path / "vendored.zig").write_text(source)
+        cache = SourceCache()
+        original = SourceFile(file_path=str(self.path_to_test_sources / "basic.zig"), cache=cache)
+        vendored = SourceFile(file_path=str(tmp_path / "vendored.zig"), cache=cache)
+        declarations = SourceFile(file_path=str(tmp_path / "vendored.zig"), cache=cache, mode="declarations")
+        assert len(cache) == 2
+        assert original.unit is vendored.unit
+        assert original.content is vendored.content
+        assert declarations.unit is not original.unit
+        assert vendored.path == str(tmp_path / "vendored.zig")
+
+        unit = original.unit
+        original.release()
+        assert not unit.released
+        vendored.release()
+        assert unit.released
+        assert len(cache) == 1
+        assert cast(FunctionDeclaration, vendored.content[0]).name == "testing"
+
+    def test_cache_keeps_path_and_intern_table(self, tmp_path: Path):
+        path = tmp_path / "latin1.zig"
+        path.write_bytes(b"const x: u8 = 1; // caf\xe9\n")
+        cache = SourceCache()
+        table = InternTable()
+        plain = SourceFile(file_path=str(path), cache=cache)
+        interned = SourceFile(file_path=str(path), cache=cache, intern_table=table)
+        assert len(plain.content) == 1
+        assert plain.unit.path == str(path)
+        assert plain.unit is not interned.unit
+        assert interned.unit.intern_table is table
+        assert SourceFile(file_path=str(path), cache=cache, intern_table=table).unit is interned.unit
+
     @property
     def path_to_test_sources(self) -> Path:
         return Path(__file__).resolve().parent / "test_sources"
@@ -1,4 +1,9 @@
-from zyntex.parsing import SourceModule
+import pytest
+from typing import cast
+from threading import Event
+
+from zyntex.parsing.syntax import FunctionDeclaration
+from zyntex.parsing import SourceModule, SourceCache, SkippedFile, SkipReason, ScanOptions
 from pathlib import Path
 
 
@@ -20,6 +25,204 @@ class TestSourceModule:
         assert files[0].path == str(self.path_to_test_sources / "test_module" / "src.zig")
         assert files[1].path == str(self.path_to_test_sources / "test_module" / "inside" / "src2.zig")
 
+    def test_threading_lazy_usage(self):
+        module = SourceModule(
+            dir_path=str(self.path_to_test_sources / "test_module"),
+            use_threading=True,
+            lazy_parsing=True,
+        )
+        files = module.files
+        assert len(files) == 2
+        assert files[0].path == str(self.path_to_test_sources / "test_module" / "src.zig")
+        assert files[1].path == str(self.path_to_test_sources / "test_module" / "inside" / "src2.zig")
+        assert all(len(file.errors) == 0 for file in files)
+
+    def test_threading_content(self):
+        module = SourceModule(
+            dir_path=str(self.path_to_test_sources / "test_module"), use_threading=True, max_workers=2
+        )
+        sequential = SourceModule(dir_path=str(self.path_to_test_sources / "test_module"))
+        for threaded_file, sequential_file in zip(module.files, sequential.files):
+            assert threaded_file.unit.source == sequential_file.unit.source
+            assert len(threaded_file.content) == len(sequential_file.content)
+
+    def test_max_live_units(self):
+        module = SourceModule(
+            dir_path=str(self.path_to_test_sources / "test_module"), max_live_units=1
+        )
+        first, second = module.files
+        assert first.released and second.released
+
+        first_content = first.content
+        first_names = [element.name for element in first_content]
+        assert not first.released
+        second_names = [element.name for element in second.content]
+        assert first.released and not second.released
+        assert len(module.live_units) == 1
+
+        # Released files are parsed again on access.
+        assert [element.name for element in first.content] == first_names
+        assert second.released
+        assert second_names == [element.name for element in second.content]
+
+        with pytest.raises(ValueError):
+            SourceModule(dir_path=".", max_live_units=0)
+
+    def test_max_live_units_keeps_elements(self, tmp_path: Path):
+        for index in range(2):
+            (tmp_path / f"f{index}.zig").write_text(
+                f"/// Docs.\npub fn f{index}(a: u8) callconv(.c) u8 {{ return a; }}"
+            )
+        first, second = SourceModule(dir_path=str(tmp_path), max_live_units=1).files
+        element = cast(FunctionDeclaration, first.content[0])
+        assert second.content
+        assert first.released
+
+        # The element was materialized before the unit was released.
+        assert element.name == "f0"
+        assert element.doc_comment == "Docs."
+        assert [param.name for param in element.params] == ["a"]
+        assert element.calling_convention == ".c"
+        assert element.body == "{ return a; }"
+        assert element.signature_hash == cast(FunctionDeclaration, first.content[0]).signature_hash
+
+    def test_discovery(self, tmp_path: Path):
+        for relative_path in (
+                "main.zig", "build.zig", "notes.txt", "src/lib.zig", "src/generated/table.zig",
+                "src/generated/keep.zig", ".zig-cache/o/cached.zig", "zig-out/out.zig", "deps/dep.zig",
+        ):
+            (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / relative_path).write_text("const a = 1;")
+        (tmp_path / ".gitignore").write_text("# Vendored\n/deps/\n")
+        (tmp_path / "src" / ".gitignore").write_text("generated/*\n!generated/keep.zig\n")
+
+        module = SourceModule(dir_path=str(tmp_path), lazy_parsing=True)
+        relative = [Path(p).relative_to(tmp_path).as_posix() for p in module.paths]
+        assert relative == ["build.zig", "main.zig", "src/lib.zig", "src/generated/keep.zig"]
+        assert [file.path for file in module.files] == module.paths
+
+        module = SourceModule(
+            dir_path=str(tmp_path), use_threading=True, lazy_parsing=True,
+            options=ScanOptions(exclude=["build.zig", "src/"], use_gitignore=False),
+        )
+        relative = [Path(file.path).relative_to(tmp_path).as_posix() for file in module.files]
+        assert relative == [
+            "main.zig", ".zig-cache/o/cached.zig", "deps/dep.zig", "zig-out/out.zig"
+        ]
+        module.options.include = ("src/**/*.zig",)
+        module.options.exclude = ()
+        assert len(module.paths) == 3
+
+    def test_discovery_symlinks(self, tmp_path: Path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "lib.zig").write_text("const a = 1;")
+        try:
+            (tmp_path / "src" / "loop").symlink_to(tmp_path, target_is_directory=True)
+        except OSError:
+            pytest.skip("Symbolic links are not available.")
+
+        module = SourceModule(dir_path=str(tmp_path), lazy_parsing=True)
+        assert module.paths == [str(tmp_path / "src" / "lib.zig")]
+
+    def test_largest_first(self, tmp_path: Path):
+        sizes = {"a.zig": 1, "b.zig": 400, "c.zig": 20}
+        for name, count in sizes.items():
+            (tmp_path / name).write_text("const value: u32 = 1;\n" * count)
+        module = SourceModule(dir_path=str(tmp_path), use_threading=True, max_workers=2)
+        assert module._schedule(module.paths) == [1, 2, 0]
+
+        for cache in (None, SourceCache()):
+            module.cache = cache
+            files = module.files
+            assert [Path(file.path).name for file in files] == list(sizes)
+            assert [len(file.content) for file in files] == list(sizes.values())
+            assert all(file.unit.parse_time > 0 for file in files)
+
+        module.options.largest_first = False
+        assert module._schedule(module.paths) == [0, 1, 2]
+
+    def test_budgets(self, tmp_path: Path):
+        for name, count in {"a.zig": 1, "huge.zig": 5000, "b.zig": 2}.items():
+            (tmp_path / name).write_text("const value: u32 = 1;\n" * count)
+
+        module = SourceModule(dir_path=str(tmp_path), options=ScanOptions(max_file_size=1024))
+        result = module.scan()
+        assert [Path(file.path).name for file in result.files] == ["a.zig", "b.zig"]
+        assert result.skipped == [SkippedFile(str(tmp_path / "huge.zig"), SkipReason.TOO_LARGE)]
+        assert [Path(path).name for path in module.paths] == ["a.zig", "b.zig"]
+
+        cancel = Event()
+        cancel.set()
+        for use_threading in (False, True):
+            module = SourceModule(dir_path=str(tmp_path), use_threading=use_threading)
+            result = module.scan(cancel=cancel)
+            assert result.files == []
+            assert [skipped.reason for skipped in result.skipped] == [SkipReason.CANCELLED] * 3
+
+        module = SourceModule(
+            dir_path=str(tmp_path), max_workers=2, options=ScanOptions(file_timeout=1e-9)
+        )
+        result = module.scan()
+        assert len(result.files) + len(result.skipped) == 3
+        assert all(skipped.reason == SkipReason.TIMEOUT for skipped in result.skipped)
+        module.options.file_timeout = 60
+        assert len(module.scan().files) == 3
+
+    def test_scan_callbacks(self, tmp_path: Path):
+        for name, count in {"a.zig": 1, "huge.zig": 5000, "b.zig": 2, "c.zig": 3}.items():
+            (tmp_path / name).write_text("const value: u32 = 1;\n" * count)
+
+        module = SourceModule(
+            dir_path=str(tmp_path), use_threading=True, options=ScanOptions(max_file_size=1024)
+        )
+        parsed: list[str] = []
+        progress: list[tuple] = []
+        result = module.scan(
+            on_file_parsed=lambda file: parsed.append(Path(file.path).name),
+            on_progress=lambda processed, total: progress.append((processed, total)),
+        )
+        assert sorted(parsed) == ["a.zig", "b.zig", "c.zig"]
+        assert [Path(file.path).name for file in result.files] == ["a.zig", "b.zig", "c.zig"]
+        # Files finished during discovery are reported before the total is known.
+        assert [processed for processed, _ in progress] == [1, 2, 3, 4]
+        assert progress[0] == (1, None) and progress[-1] == (4, 4)
+
+        cancel = Event()
+        module = SourceModule(dir_path=str(tmp_path))
+        result = module.scan(cancel=cancel, on_file_parsed=lambda file: cancel.set())
+        assert [Path(file.path).name for file in result.files] == ["a.zig"]
+        assert [Path(skipped.path).name for skipped in result.skipped] == ["b.zig", "c.zig", "huge.zig"]
+
+    def test_scan_streams_during_discovery(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        for name in ("a.zig", "b.zig", "c.zig"):
+            (tmp_path / name).write_text("const value: u32 = 1;\n")
+        module = SourceModule(
+            dir_path=str(tmp_path), use_threading=True, options=ScanOptions(largest_first=False)
+        )
+        created = Event()
+        create_file = module._create_file
+
+        def create_and_signal(path: str):
+            file = create_file(path)
+            created.set()
+            return file
+
+        parsed: list[str] = []
+        reported_during_discovery: list[list[str]] = []
+
+        def discover(*_):
+            yield str(tmp_path / "a.zig")
+            assert created.wait(timeout=5)
+            yield str(tmp_path / "b.zig")
+            reported_during_discovery.append(list(parsed))
+            yield str(tmp_path / "c.zig")
+
+        monkeypatch.setattr(module, "_create_file", create_and_signal)
+        monkeypatch.setattr(module, "_discover", discover)
+        result = module.scan(on_file_parsed=lambda file: parsed.append(Path(file.path).name))
+        assert reported_during_discovery == [["a.zig"]]
+        assert [Path(file.path).name for file in result.files] == ["a.zig", "b.zig", "c.zig"]
+
     @property
     def path_to_test_sources(self) -> Path:
         return Path(__file__).resolve().parent / "test_sources"
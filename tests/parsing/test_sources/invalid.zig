@@ -0,0 +1,5 @@
+const std = @import("std")
+
+pub fn abc() {
+
+}
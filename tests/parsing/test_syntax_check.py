@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from zyntex.parsing import check_syntax
+
+
+class TestSyntaxCheck:
+
+    def test_basic_usage(self):
+        paths = [
+            str(self.path_to_test_sources / "basic.zig"),
+            str(self.path_to_test_sources / "invalid.zig"),
+            str(self.path_to_test_sources / "missing.zig"),
+        ]
+        assert check_syntax(paths) == [0, 2, None]
+        assert check_syntax(paths, workers=1) == [0, 2, None]
+
+    def test_empty_input(self):
+        assert check_syntax([]) == []
+
+    @property
+    def path_to_test_sources(self) -> Path:
+        return Path(__file__).resolve().parent / "test_sources"
@@ -15,11 +15,17 @@ pub fn build(b: *std.Build) void {
             .root_source_file = .{
                 .src_path = .{ .owner = b, .sub_path = "src/c_api.zig" },
             },
+            // Native threads must be created through pthreads when the library
+            // is loaded into a glibc process (e.g. the Python interpreter).
+            .link_libc = target.os_tag == .linux,
         });
         const lib = b.addLibrary(.{
             .name = "clib",
             .linkage = .dynamic,
             .root_module = module,
+            // The self-hosted backend (used for debug builds) mishandles
+            // thread-local storage in shared libraries used from native threads.
+            .use_llvm = true,
         });
         b.installArtifact(lib);
     }
@@ -0,0 +1,39 @@
+const std = @import("std");
+
+/// Calls `func(context, i)` for every `i` in `0..count`, spreading the calls over
+/// up to `thread_count` threads (the calling thread included). Zero picks the CPU count.
+/// Workers pull the next index from a shared counter, so long items do not block short ones.
+pub fn forEachIndex(
+    count: usize,
+    thread_count: usize,
+    context: anytype,
+    comptime func: fn (@TypeOf(context), usize) void,
+) void {
+    const Context = @TypeOf(context);
+    const Worker = struct {
+        fn run(next_index: *std.atomic.Value(usize), total: usize, ctx: Context) void {
+            while (true) {
+                const index = next_index.fetchAdd(1, .monotonic);
+                if (index >= total) return;
+                func(ctx, index);
+            }
+        }
+    };
+
+    var next_index = std.atomic.Value(usize).init(0);
+    const requested = if (thread_count == 0) std.Thread.getCpuCount() catch 1 else thread_count;
+    const workers = @max(@min(requested, count), 1);
+
+    const threads = std.heap.page_allocator.alloc(std.Thread, workers - 1) catch {
+        return Worker.run(&next_index, count, context);
+    };
+    defer std.heap.page_allocator.free(threads);
+
+    var spawned: usize = 0;
+    for (threads) |*thread| {
+        thread.* = std.Thread.spawn(.{}, Worker.run, .{ &next_index, count, context }) catch break;
+        spawned += 1;
+    }
+    Worker.run(&next_index, count, context);
+    for (threads[0..spawned]) |thread| thread.join();
+}
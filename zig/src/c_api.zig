@@ -1,6 +1,8 @@
 const std = @import("std");
 const structs = @import("structs.zig");
 const TranslationUnit = @import("translation_unit.zig");
+const ParseMode = TranslationUnit.ParseMode;
+const batch = @import("batch.zig");
 
 const allocator = std.heap.page_allocator;
 const Ast = std.zig.Ast;
@@ -10,6 +12,14 @@ pub const ErrorReport = structs.ErrorReport;
 pub const NodeParam = structs.NodeParam;
 pub const ASTToken = structs.ASTToken;
 pub const ASTNode = structs.ASTNode;
+pub const DocComment = structs.DocComment;
+pub const NodeModifier = structs.NodeModifier;
+pub const TypeRecord = structs.TypeRecord;
+pub const TypeKind = structs.TypeKind;
+pub const TypeFlag = structs.TypeFlag;
+pub const SignatureHeader = structs.SignatureHeader;
+pub const SignatureParam = structs.SignatureParam;
+pub const ParamFlag = structs.ParamFlag;
 
 // A generic slice struct used for FFI-compatible data transfer.
 pub const GenericSlice = extern struct {
@@ -33,17 +43,115 @@ pub fn toSlice(comptime T: type, gs: GenericSlice) []const T {
 }
 
 pub export fn createTranslationUnit(file_path: [*:0]const u8) callconv(.c) ?*TranslationUnit {
+    return createTranslationUnitWithMode(file_path, @intFromEnum(ParseMode.full));
+}
+
+// Like `createTranslationUnit`, but parses in the given `TranslationUnit.ParseMode`.
+// The mode is kept when the unit is reset. Returns null for unknown modes.
+pub export fn createTranslationUnitWithMode(file_path: [*:0]const u8, mode: u8) callconv(.c) ?*TranslationUnit {
+    const parse_mode = std.meta.intToEnum(ParseMode, mode) catch return null;
     const unit_ptr = allocator.create(TranslationUnit) catch return null;
-    unit_ptr.* = TranslationUnit.initFromFile(file_path) catch return null;
+    unit_ptr.* = TranslationUnit.initFromFile(file_path, parse_mode) catch {
+        allocator.destroy(unit_ptr);
+        return null;
+    };
     return unit_ptr;
 }
 
+const CreateUnitsContext = struct {
+    paths: [*]const [*:0]const u8,
+    mode: u8,
+    out: [*]?*TranslationUnit,
+
+    fn run(self: CreateUnitsContext, index: usize) void {
+        self.out[index] = createTranslationUnitWithMode(self.paths[index], self.mode);
+    }
+};
+
+// Parses every file on `thread_count` threads (0 = CPU count) and stores the units
+// in `out`, aligned with `paths`. Files that failed to parse are set to null.
+// Returns the number of successfully created units.
+pub export fn createTranslationUnitsBatch(
+    paths: [*]const [*:0]const u8,
+    count: usize,
+    thread_count: usize,
+    out: [*]?*TranslationUnit,
+) callconv(.c) usize {
+    return createTranslationUnitsBatchWithMode(paths, count, thread_count, @intFromEnum(ParseMode.full), out);
+}
+
+// Like `createTranslationUnitsBatch`, but every file is parsed in the given mode.
+pub export fn createTranslationUnitsBatchWithMode(
+    paths: [*]const [*:0]const u8,
+    count: usize,
+    thread_count: usize,
+    mode: u8,
+    out: [*]?*TranslationUnit,
+) callconv(.c) usize {
+    const context = CreateUnitsContext{ .paths = paths, .mode = mode, .out = out };
+    batch.forEachIndex(count, thread_count, context, CreateUnitsContext.run);
+
+    var created: usize = 0;
+    for (out[0..count]) |unit| {
+        if (unit != null) created += 1;
+    }
+    return created;
+}
+
 pub export fn createTranslationUnitFromSource(source: [*:0]const u8) callconv(.c) ?*TranslationUnit {
+    return createTranslationUnitFromSourceWithMode(source, @intFromEnum(ParseMode.full));
+}
+
+// Like `createTranslationUnitFromSource`, but parses in the given `TranslationUnit.ParseMode`.
+pub export fn createTranslationUnitFromSourceWithMode(source: [*:0]const u8, mode: u8) callconv(.c) ?*TranslationUnit {
+    const parse_mode = std.meta.intToEnum(ParseMode, mode) catch return null;
     const unit_ptr = allocator.create(TranslationUnit) catch return null;
-    unit_ptr.* = TranslationUnit.initFromSource(source) catch return null;
+    unit_ptr.* = TranslationUnit.initFromSource(source, parse_mode) catch {
+        allocator.destroy(unit_ptr);
+        return null;
+    };
     return unit_ptr;
 }
 
+// Reparses an existing unit from a file, keeping the memory of the previous parse.
+// Returns false on failure, in which case the unit holds an empty tree.
+pub export fn resetTranslationUnit(unit: *TranslationUnit, file_path: [*:0]const u8) callconv(.c) bool {
+    unit.resetFromFile(file_path) catch return false;
+    return true;
+}
+
+// Reparses an existing unit from source, keeping the memory of the previous parse.
+// Returns false on failure, in which case the unit holds an empty tree.
+pub export fn resetTranslationUnitFromSource(unit: *TranslationUnit, source: [*:0]const u8) callconv(.c) bool {
+    unit.resetFromSource(source) catch return false;
+    return true;
+}
+
+const CheckSyntaxContext = struct {
+    paths: [*]const [*:0]const u8,
+    out: [*]i64,
+
+    fn run(self: CheckSyntaxContext, index: usize) void {
+        const errors_count = TranslationUnit.checkFileSyntax(self.paths[index]) catch {
+            self.out[index] = -1;
+            return;
+        };
+        self.out[index] = @intCast(errors_count);
+    }
+};
+
+// Writes the parse errors count of every file into `out`, or -1 if the file
+// could not be read. Files are parsed on `thread_count` threads (0 = CPU count).
+pub export fn checkSyntaxBatch(
+    paths: [*]const [*:0]const u8,
+    count: usize,
+    thread_count: usize,
+    out: [*]i64,
+) callconv(.c) void {
+    const context = CheckSyntaxContext{ .paths = paths, .out = out };
+    batch.forEachIndex(count, thread_count, context, CheckSyntaxContext.run);
+}
+
 pub export fn getTranslationUnitNodesCount(unit: *TranslationUnit) callconv(.c) usize {
     return unit.tree.nodes.len;
 }
@@ -57,6 +165,10 @@ pub export fn getTranslationUnitRootNodes(unit: *TranslationUnit) callconv(.c) G
     return makeSlice(Ast.Node.Index, indexes.ptr, indexes.len);
 }
 
+pub export fn getTranslationUnitRootNodeStructs(unit: *TranslationUnit) callconv(.c) GenericSlice {
+    return makeSlice(ASTNode, unit.root_nodes.ptr, unit.root_nodes.len);
+}
+
 pub export fn getTranslationUnitNodeFromIndex(unit: *TranslationUnit, index: u32) callconv(.c) ASTNode {
     return unit.nodes[index];
 }
@@ -77,10 +189,26 @@ pub export fn getTranslationUnitErrors(unit: *TranslationUnit) callconv(.c) Gene
     return makeSlice(ErrorReport, unit.errors.ptr, unit.errors.len);
 }
 
+pub export fn renderTranslationUnitErrors(unit: *TranslationUnit) callconv(.c) GenericSlice {
+    const rendered = unit.renderErrors() catch return .{ .ptr = null, .len = 0 };
+    if (rendered.len == 0) return .{ .ptr = null, .len = 0 };
+    return makeSlice(u8, rendered.ptr, rendered.len);
+}
+
+// Formats the unit like `zig fmt`. Returns an empty slice if the source has parse errors.
+pub export fn renderTranslationUnit(unit: *TranslationUnit) callconv(.c) GenericSlice {
+    const rendered = unit.renderSource() catch return .{ .ptr = null, .len = 0 };
+    return makeSlice(u8, rendered.ptr, rendered.len);
+}
+
 pub export fn getTranslationUnitSource(unit: *TranslationUnit) callconv(.c) GenericSlice {
     return makeSlice(u8, unit.tree.source.ptr, unit.tree.source.len);
 }
 
+pub export fn getTranslationUnitParseTime(unit: *TranslationUnit) callconv(.c) u64 {
+    return unit.parse_ns;
+}
+
 pub export fn freeTranslationUnit(unit: *TranslationUnit) callconv(.c) void {
     unit.deinit();
     allocator.destroy(unit);
@@ -176,6 +304,194 @@ pub export fn getNodeType(unit: *TranslationUnit, node: ASTNode) callconv(.c) AS
     }
 }
 
+// Hashes the tag and text of every token between `first` and `last`. Whitespace and
+// comments never reach the token stream, and doc comments are skipped, so only the
+// structure of the code affects the result.
+fn hashTokenRange(tree: *const Ast, first: Ast.TokenIndex, last: Ast.TokenIndex) u64 {
+    var hasher = std.hash.Wyhash.init(0);
+    var token = first;
+    while (token <= last) : (token += 1) {
+        const tag = tree.tokenTag(token);
+        if (tag == .doc_comment or tag == .container_doc_comment) continue;
+        hasher.update(&.{@intFromEnum(tag)});
+        hasher.update(tree.tokenSlice(token));
+    }
+    return hasher.final();
+}
+
+fn hashNode(tree: *const Ast, node: Ast.Node.Index) u64 {
+    return hashTokenRange(tree, tree.firstToken(node), tree.lastToken(node));
+}
+
+// Stable hash of the node's tokens. Nodes that differ only in formatting or comments
+// hash equally.
+pub export fn getNodeStructuralHash(unit: *TranslationUnit, node: ASTNode) callconv(.c) u64 {
+    return hashNode(unit.tree, @enumFromInt(node.index));
+}
+
+const TypeRecordWriter = struct {
+    tree: *const Ast,
+    out: [*]TypeRecord,
+    capacity: usize,
+    count: usize = 0,
+
+    fn push(self: *TypeRecordWriter, record: TypeRecord) void {
+        if (self.count < self.capacity) self.out[self.count] = record;
+        self.count += 1;
+    }
+
+    fn text(value: []const u8) GenericSlice {
+        return makeSlice(u8, value.ptr, value.len);
+    }
+
+    fn optionalSource(self: *TypeRecordWriter, node: Ast.Node.OptionalIndex) GenericSlice {
+        const index = node.unwrap() orelse return .{ .ptr = null, .len = 0 };
+        return text(self.tree.getNodeSource(index));
+    }
+
+    /// Writes a whole type expression, marking inferred error sets (`!T`) on its root.
+    fn writeRoot(self: *TypeRecordWriter, node: Ast.Node.Index) void {
+        const first_token = self.tree.firstToken(node);
+        var flags: u8 = 0;
+        if (first_token > 0 and self.tree.tokenTag(first_token - 1) == .bang) flags |= TypeFlag.inferred_error;
+        self.write(node, flags);
+    }
+
+    fn write(self: *TypeRecordWriter, node: Ast.Node.Index, flags: u8) void {
+        const tree = self.tree;
+        var record: TypeRecord = .{
+            .kind = TypeKind.unknown,
+            .flags = flags,
+            .pointer_size = 0,
+            .text = text(tree.getNodeSource(node)),
+            .sentinel = .{ .ptr = null, .len = 0 },
+        };
+
+        switch (tree.nodeTag(node)) {
+            .identifier => {
+                record.kind = TypeKind.identifier;
+                record.text = text(tree.tokenSlice(tree.nodeMainToken(node)));
+                self.push(record);
+            },
+            .field_access => {
+                record.kind = TypeKind.identifier;
+                self.push(record);
+            },
+            .optional_type => {
+                record.kind = TypeKind.optional;
+                self.push(record);
+                self.write(tree.nodeData(node).node, 0);
+            },
+            .error_union => {
+                const error_set, const payload = tree.nodeData(node).node_and_node;
+                record.kind = TypeKind.error_union;
+                self.push(record);
+                self.write(error_set, 0);
+                self.write(payload, 0);
+            },
+            .array_type, .array_type_sentinel => {
+                const array = tree.fullArrayType(node).?;
+                record.kind = TypeKind.array;
+                record.text = text(tree.getNodeSource(array.ast.elem_count));
+                record.sentinel = self.optionalSource(array.ast.sentinel);
+                self.push(record);
+                self.write(array.ast.elem_type, 0);
+            },
+            .ptr_type_aligned, .ptr_type_sentinel, .ptr_type, .ptr_type_bit_range => {
+                const pointer = tree.fullPtrType(node).?;
+                // Qualifiers without a structural representation keep the whole source.
+                if (pointer.ast.align_node != .none or pointer.ast.addrspace_node != .none or
+                    pointer.ast.bit_range_start != .none or pointer.volatile_token != null or
+                    pointer.allowzero_token != null)
+                {
+                    return self.push(record);
+                }
+                record.kind = TypeKind.pointer;
+                record.pointer_size = @intFromEnum(pointer.size);
+                record.sentinel = self.optionalSource(pointer.ast.sentinel);
+                if (pointer.const_token != null) record.flags |= TypeFlag.@"const";
+                self.push(record);
+                self.write(pointer.ast.child_type, 0);
+            },
+            else => self.push(record),
+        }
+    }
+};
+
+// Serializes the whole type expression of a type node into `out` as preorder `TypeRecord`s.
+// Returns the number of records the expression needs. If it is larger than `capacity`,
+// only the first `capacity` records are written and the call should be repeated.
+pub export fn getNodeTypeRecords(
+    unit: *TranslationUnit,
+    node: ASTNode,
+    out: [*]TypeRecord,
+    capacity: usize,
+) callconv(.c) usize {
+    const index: Ast.Node.Index = @enumFromInt(node.index);
+    var writer: TypeRecordWriter = .{ .tree = unit.tree, .out = out, .capacity = capacity };
+    writer.writeRoot(index);
+    return writer.count;
+}
+
+// Writes the whole prototype of a function in one call: its header into `out`, its params
+// into `params` and the type records of the return type and every param into `records`.
+// Returns false if the node is not a function. If `params_count` or `records_count` of the
+// header is larger than the matching capacity, the buffers were too small and the call
+// should be repeated. Params without a type, like `anytype` and `...`, are skipped.
+// The header also carries the structural hash of the prototype without the body.
+pub export fn getFunctionSignature(
+    unit: *TranslationUnit,
+    node: ASTNode,
+    out: *SignatureHeader,
+    params: [*]SignatureParam,
+    params_capacity: usize,
+    records: [*]TypeRecord,
+    records_capacity: usize,
+) callconv(.c) bool {
+    const tree = unit.tree;
+    const index: Ast.Node.Index = @enumFromInt(node.index);
+    var buffer: [1]Ast.Node.Index = undefined;
+    const fn_proto = tree.fullFnProto(&buffer, index) orelse return false;
+    const proto = if (tree.nodeTag(index) == .fn_decl) tree.nodeData(index).node_and_node[0] else index;
+
+    var writer: TypeRecordWriter = .{ .tree = tree, .out = records, .capacity = records_capacity };
+    if (fn_proto.ast.return_type.unwrap()) |return_type| writer.writeRoot(return_type);
+    const return_type_records = writer.count;
+
+    var params_count: usize = 0;
+    var iterator = fn_proto.iterate(tree);
+    while (iterator.next()) |param| {
+        const type_expr = param.type_expr orelse continue;
+        const first_record = writer.count;
+        writer.writeRoot(type_expr);
+        defer params_count += 1;
+        if (params_count >= params_capacity) continue;
+
+        var flags: u8 = 0;
+        if (param.comptime_noalias) |token| {
+            flags |= if (tree.tokenTag(token) == .keyword_comptime) ParamFlag.@"comptime" else ParamFlag.@"noalias";
+        }
+        const name = if (param.name_token) |token| tree.tokenSlice(token) else "";
+        params[params_count] = .{
+            .name = makeSlice(u8, name.ptr, name.len),
+            .flags = flags,
+            .type_records = @intCast(writer.count - first_record),
+        };
+    }
+
+    const name = if (fn_proto.name_token) |token| tree.tokenSlice(token) else "";
+    out.* = .{
+        .name = makeSlice(u8, name.ptr, name.len),
+        .modifiers = getNodeModifiers(unit, node),
+        .calling_convention = writer.optionalSource(fn_proto.ast.callconv_expr),
+        .params_count = @intCast(params_count),
+        .records_count = @intCast(writer.count),
+        .return_type_records = @intCast(return_type_records),
+        .signature_hash = hashNode(tree, proto),
+    };
+    return true;
+}
+
 pub export fn getNodeAlign(unit: *TranslationUnit, node: ASTNode) callconv(.c) GenericSlice {
     const tag: Tag = @enumFromInt(node.tag_index);
     switch (tag) {
@@ -237,6 +553,31 @@ pub export fn getNodeBody(unit: *TranslationUnit, node: ASTNode) callconv(.c) Ge
     }
 }
 
+fn compareDocComment(token: u32, doc_comment: DocComment) std.math.Order {
+    return std.math.order(token, doc_comment.last_token);
+}
+
+pub export fn getNodeDocComment(unit: *TranslationUnit, node: ASTNode) callconv(.c) GenericSlice {
+    const tag: Tag = @enumFromInt(node.tag_index);
+    if (tag == .root) return .{ .ptr = null, .len = 0 };
+
+    const first_token = unit.tree.firstToken(@enumFromInt(node.index));
+    if (first_token == 0) return .{ .ptr = null, .len = 0 };
+
+    const position = std.sort.binarySearch(
+        DocComment,
+        unit.doc_comments,
+        first_token - 1,
+        compareDocComment,
+    ) orelse return .{ .ptr = null, .len = 0 };
+
+    const doc_comment = unit.doc_comments[position];
+    const start = unit.tree.tokenStart(doc_comment.first_token);
+    const last_token_slice = unit.tree.tokenSlice(doc_comment.last_token);
+    const end = unit.tree.tokenStart(doc_comment.last_token) + last_token_slice.len;
+    return makeSlice(u8, unit.tree.source[start..].ptr, end - start);
+}
+
 pub export fn getNodeParamsCount(unit: *TranslationUnit, node: ASTNode) callconv(.c) usize {
     var buffer: [1]Ast.Node.Index = undefined;
     const full_fn_proto = unit.tree.fullFnProto(&buffer, @enumFromInt(node.index)) orelse return 0;
@@ -272,50 +613,28 @@ pub export fn getNodeParams(
     return i;
 }
 
-pub export fn isNodeExtern(unit: *TranslationUnit, node: ASTNode) callconv(.c) bool {
-    const tag: Tag = @enumFromInt(node.tag_index);
-    const token = switch (tag) {
-        .root => return false,
-        .fn_proto_simple,
-        .fn_proto_multi,
-        .fn_proto_one,
-        .fn_proto,
-        .fn_decl,
-        .global_var_decl,
-        .local_var_decl,
-        .simple_var_decl,
-        .aligned_var_decl,
-        => if (node.main_token > 0) node.main_token - 1 else node.main_token,
-        else => node.main_token,
-    };
-    return std.mem.eql(u8, unit.tree.tokenSlice(token), "extern");
-}
-
-pub export fn isNodeExport(unit: *TranslationUnit, node: ASTNode) callconv(.c) bool {
-    const tag: Tag = @enumFromInt(node.tag_index);
-    const token = switch (tag) {
-        .root => return false,
-        .fn_proto_simple,
-        .fn_proto_multi,
-        .fn_proto_one,
-        .fn_proto,
-        .fn_decl,
-        .global_var_decl,
-        .local_var_decl,
-        .simple_var_decl,
-        .aligned_var_decl,
-        => if (node.main_token > 0) node.main_token - 1 else node.main_token,
-        else => node.main_token,
+fn modifierFromToken(tag: std.zig.Token.Tag) ?u32 {
+    return switch (tag) {
+        .keyword_pub => NodeModifier.public,
+        .keyword_extern => NodeModifier.@"extern",
+        .keyword_export => NodeModifier.@"export",
+        .keyword_inline => NodeModifier.@"inline",
+        .keyword_noinline => NodeModifier.@"noinline",
+        .keyword_threadlocal => NodeModifier.@"threadlocal",
+        else => null,
     };
-    return std.mem.eql(u8, unit.tree.tokenSlice(token), "export");
 }
 
-pub export fn isNodePublic(unit: *TranslationUnit, node: ASTNode) callconv(.c) bool {
+// Collects the modifier keywords of a node into a `NodeModifier` bitmask.
+// For declarations, every keyword placed before the `fn`/`const`/`var` token is checked,
+// so all modifier flags of a node can be answered with a single call.
+pub export fn getNodeModifiers(unit: *TranslationUnit, node: ASTNode) callconv(.c) u32 {
     const tag: Tag = @enumFromInt(node.tag_index);
-    var token: u32 = node.main_token;
+    const tree = unit.tree;
+    var modifiers: u32 = 0;
 
     switch (tag) {
-        .root => return false,
+        .root => return 0,
         .fn_proto_simple,
         .fn_proto_multi,
         .fn_proto_one,
@@ -326,22 +645,43 @@ pub export fn isNodePublic(unit: *TranslationUnit, node: ASTNode) callconv(.c) b
         .simple_var_decl,
         .aligned_var_decl,
         => {
-            if (isNodeExport(unit, node) or isNodeExtern(unit, node)) {
-                if (token > 1) token -= 2;
-            } else if (token > 0) token -= 1;
+            var token = node.main_token;
+            while (token > 0) {
+                token -= 1;
+                const token_tag = tree.tokenTag(token);
+                if (modifierFromToken(token_tag)) |modifier| {
+                    modifiers |= modifier;
+                } else if (token_tag != .string_literal or token == 0 or tree.tokenTag(token - 1) != .keyword_extern) {
+                    // String literals are only allowed as the library name of `extern "c"`.
+                    break;
+                }
+            }
         },
-        else => {},
+        else => modifiers |= modifierFromToken(tree.tokenTag(node.main_token)) orelse 0,
     }
-    return std.mem.eql(u8, unit.tree.tokenSlice(token), "pub");
-}
 
-pub export fn isNodeConst(unit: *TranslationUnit, node: ASTNode) callconv(.c) bool {
-    const tag: Tag = @enumFromInt(node.tag_index);
-    const token_index = switch (tag) {
+    const const_token = switch (tag) {
         .identifier => if (node.main_token > 0) node.main_token - 1 else node.main_token,
         else => node.main_token,
     };
-    return std.mem.eql(u8, unit.tree.tokenSlice(token_index), "const");
+    if (tree.tokenTag(const_token) == .keyword_const) modifiers |= NodeModifier.@"const";
+    return modifiers;
+}
+
+pub export fn isNodeExtern(unit: *TranslationUnit, node: ASTNode) callconv(.c) bool {
+    return getNodeModifiers(unit, node) & NodeModifier.@"extern" != 0;
+}
+
+pub export fn isNodeExport(unit: *TranslationUnit, node: ASTNode) callconv(.c) bool {
+    return getNodeModifiers(unit, node) & NodeModifier.@"export" != 0;
+}
+
+pub export fn isNodePublic(unit: *TranslationUnit, node: ASTNode) callconv(.c) bool {
+    return getNodeModifiers(unit, node) & NodeModifier.public != 0;
+}
+
+pub export fn isNodeConst(unit: *TranslationUnit, node: ASTNode) callconv(.c) bool {
+    return getNodeModifiers(unit, node) & NodeModifier.@"const" != 0;
 }
 
 pub export fn isNodeContainer(node: ASTNode) callconv(.c) bool {
@@ -23,3 +23,79 @@ pub const NodeParam = extern struct {
     type: ASTNode,
     is_comptime: bool,
 };
+
+pub const DocComment = extern struct {
+    first_token: u32,
+    last_token: u32,
+};
+
+/// Bit flags returned by `getNodeModifiers`.
+pub const NodeModifier = struct {
+    pub const public: u32 = 1 << 0;
+    pub const @"extern": u32 = 1 << 1;
+    pub const @"export": u32 = 1 << 2;
+    pub const @"const": u32 = 1 << 3;
+    pub const @"inline": u32 = 1 << 4;
+    pub const @"noinline": u32 = 1 << 5;
+    pub const @"threadlocal": u32 = 1 << 6;
+};
+
+/// A single type expression layer, as written by `getNodeTypeRecords`.
+/// Records are stored in preorder; `TypeKind` decides how many children follow.
+pub const TypeRecord = extern struct {
+    kind: u8,
+    flags: u8,
+    /// `std.builtin.Type.Pointer.Size` of pointer records.
+    pointer_size: u8,
+    /// Name of an identifier, length of an array, or source of an unsupported expression.
+    text: GenericSlice,
+    sentinel: GenericSlice,
+};
+
+pub const TypeKind = struct {
+    /// No children. `text` holds the name, including field access like `std.mem.Allocator`.
+    pub const identifier: u8 = 0;
+    pub const optional: u8 = 1;
+    pub const array: u8 = 2;
+    pub const pointer: u8 = 3;
+    /// Followed by the error set and the payload type.
+    pub const error_union: u8 = 4;
+    /// No children. `text` holds the source of the expression.
+    pub const unknown: u8 = 5;
+};
+
+pub const TypeFlag = struct {
+    /// Set on pointers to const.
+    pub const @"const": u8 = 1 << 0;
+    /// Set on the root record of a return type with an inferred error set (`!T`).
+    pub const inferred_error: u8 = 1 << 1;
+};
+
+/// Header written by `getFunctionSignature`.
+/// Params and type records of the signature are written into separate buffers.
+pub const SignatureHeader = extern struct {
+    name: GenericSlice,
+    /// `NodeModifier` flags of the function.
+    modifiers: u32,
+    /// Source of the `callconv(...)` argument, empty if there is none.
+    calling_convention: GenericSlice,
+    /// Number of params and records the signature needs, even if the buffers were too small.
+    params_count: u32,
+    records_count: u32,
+    /// The return type records come first, followed by the records of each param in order.
+    return_type_records: u32,
+    /// Structural hash of the prototype alone, so changes to the body are not visible.
+    signature_hash: u64,
+};
+
+pub const SignatureParam = extern struct {
+    name: GenericSlice,
+    /// `ParamFlag` flags of the parameter.
+    flags: u8,
+    type_records: u32,
+};
+
+pub const ParamFlag = struct {
+    pub const @"comptime": u8 = 1 << 0;
+    pub const @"noalias": u8 = 1 << 1;
+};
@@ -2,47 +2,230 @@ const std = @import("std");
 const structs = @import("structs.zig");
 
 const Ast = std.zig.Ast;
-const GPA = std.heap.GeneralPurposeAllocator(.{ .safety = true });
 
 pub const TranslationUnit = @This();
 
+pub const ParseMode = enum(u8) {
+    /// The whole source is parsed.
+    full = 0,
+    /// Function bodies are blanked out before parsing, so no nodes are built for them.
+    /// Byte offsets and line numbers of everything else are unchanged.
+    declarations = 1,
+};
+
 tree: *Ast,
 buffer: [:0]const u8,
-gpa_allocator: GPA,
+/// Owns everything the unit allocates. Resetting the unit keeps its capacity,
+/// so reparsing a file of a similar size does not ask the OS for new pages.
+arena: std.heap.ArenaAllocator,
+mode: ParseMode,
+/// Time spent parsing the current source, in nanoseconds. Reading the file is not included.
+parse_ns: u64,
 
 errors: []const structs.ErrorReport,
 tokens: []const structs.ASTToken,
 nodes: []const structs.ASTNode,
+root_nodes: []const structs.ASTNode,
+doc_comments: []const structs.DocComment,
+rendered_errors: ?[]const u8,
+rendered_source: ?[]const u8,
+
+pub fn initFromFile(file_path: [*:0]const u8, mode: ParseMode) !TranslationUnit {
+    var tu: TranslationUnit = undefined;
+    tu.mode = mode;
+    tu.arena = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    errdefer tu.arena.deinit();
+
+    try tu.parseOwned(try tu.readFile(file_path));
+    return tu;
+}
+
+pub fn initFromSource(source: [*:0]const u8, mode: ParseMode) !TranslationUnit {
+    var tu: TranslationUnit = undefined;
+    tu.mode = mode;
+    tu.arena = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    errdefer tu.arena.deinit();
+
+    // Make a copy on the heap, since AST keeps a reference to the source.
+    try tu.parseOwned(try tu.arena.allocator().dupeZ(u8, std.mem.span(source)));
+    return tu;
+}
+
+/// Reparses the unit from a file, reusing the memory of the previous parse.
+/// On failure the unit is left holding an empty tree, so it stays usable.
+pub fn resetFromFile(self: *TranslationUnit, file_path: [*:0]const u8) !void {
+    _ = self.arena.reset(.retain_capacity);
+    const source = self.readFile(file_path) catch |err| {
+        try self.parse("");
+        return err;
+    };
+    self.parseOwned(source) catch |err| {
+        _ = self.arena.reset(.retain_capacity);
+        try self.parse("");
+        return err;
+    };
+}
 
-pub fn initFromFile(file_path: [*:0]const u8) !TranslationUnit {
-    var file = try std.fs.cwd().openFile(std.mem.span(file_path), .{ .mode = .read_only });
-    defer file.close();
-    const file_stat = try file.stat();
+/// Reparses the unit from source, reusing the memory of the previous parse.
+/// On failure the unit is left holding an empty tree, so it stays usable.
+pub fn resetFromSource(self: *TranslationUnit, source: [*:0]const u8) !void {
+    _ = self.arena.reset(.retain_capacity);
+    const heap_source = self.arena.allocator().dupeZ(u8, std.mem.span(source)) catch |err| {
+        try self.parse("");
+        return err;
+    };
+    self.parseOwned(heap_source) catch |err| {
+        _ = self.arena.reset(.retain_capacity);
+        try self.parse("");
+        return err;
+    };
+}
 
-    var arena = std.heap.ArenaAllocator.init(std.heap.page_allocator);
-    defer arena.deinit();
-    const allocator = arena.allocator();
+fn readFile(self: *TranslationUnit, file_path: [*:0]const u8) ![:0]u8 {
+    return std.fs.cwd().readFileAllocOptions(
+        self.arena.allocator(),
+        std.mem.span(file_path),
+        std.math.maxInt(u32),
+        null,
+        std.mem.Alignment.@"1",
+        0,
+    );
+}
 
-    const buffer = try file.readToEndAllocOptions(
+/// Parses the file and returns its error count without building a unit.
+/// Tokens and nodes are not copied, and all memory is released before returning.
+pub fn checkFileSyntax(file_path: [*:0]const u8) !usize {
+    const allocator = std.heap.smp_allocator;
+    const source = try std.fs.cwd().readFileAllocOptions(
         allocator,
-        file_stat.size,
+        std.mem.span(file_path),
+        std.math.maxInt(u32),
         null,
-        std.mem.Alignment.@"2",
+        std.mem.Alignment.@"1",
         0,
     );
-    return try initFromSource(buffer);
+    defer allocator.free(source);
+
+    var tree = try std.zig.Ast.parse(allocator, source, .zig);
+    defer tree.deinit(allocator);
+    return tree.errors.len;
 }
 
-pub fn initFromSource(source: [*:0]const u8) !TranslationUnit {
-    var tu: TranslationUnit = undefined;
-    tu.gpa_allocator = GPA{};
-    const allocator = tu.gpa_allocator.allocator();
+/// Replaces the contents of every function body with spaces, keeping line breaks,
+/// so the parser builds no nodes for them while everything else stays at the same position.
+fn blankFunctionBodies(source: [:0]u8) void {
+    var tokenizer = std.zig.Tokenizer.init(source);
+    while (true) {
+        switch (tokenizer.next().tag) {
+            .eof => return,
+            .keyword_fn => {
+                const body_start = findFunctionBody(&tokenizer) orelse continue;
+                const body_end = skipBlock(&tokenizer) orelse return;
+                for (source[body_start + 1 .. body_end]) |*char| {
+                    if (char.* != '\n') char.* = ' ';
+                }
+            },
+            else => {},
+        }
+    }
+}
 
-    // Make a copy on the heap, since AST keeps a reference to the source.
-    const heap_source = try allocator.dupeZ(u8, std.mem.span(source));
+/// Scans the prototype following a `fn` keyword. Returns the offset of the body's `{`,
+/// or null if the prototype has no body, like function types and extern functions.
+fn findFunctionBody(tokenizer: *std.zig.Tokenizer) ?usize {
+    var depth: usize = 0;
+    var seen_params = false;
+    var previous: std.zig.Token.Tag = .keyword_fn;
+    // Set while inside the parens of `union(enum)`, `enum(u8)` or `packed struct(u32)`.
+    var container_paren = false;
+    while (true) {
+        const token = tokenizer.next();
+        switch (token.tag) {
+            .eof => return null,
+            .l_paren, .l_bracket => {
+                if (depth == 0 and token.tag == .l_paren) {
+                    container_paren = previous == .keyword_union or
+                        previous == .keyword_enum or previous == .keyword_struct;
+                }
+                depth += 1;
+            },
+            .r_paren, .r_bracket => {
+                if (depth == 0) return null;
+                depth -= 1;
+                if (depth == 0 and token.tag == .r_paren) {
+                    seen_params = true;
+                    // Braces after container parens open the container, not the body.
+                    if (container_paren) {
+                        container_paren = false;
+                        previous = .keyword_struct;
+                        continue;
+                    }
+                }
+            },
+            .l_brace => {
+                const opens_type = switch (previous) {
+                    .keyword_error, .keyword_struct, .keyword_enum, .keyword_union, .keyword_opaque => true,
+                    else => false,
+                };
+                if (depth == 0 and seen_params and !opens_type) return token.loc.start;
+                depth += 1;
+            },
+            .r_brace => {
+                if (depth == 0) return null;
+                depth -= 1;
+            },
+            .semicolon, .comma, .equal => if (depth == 0) return null,
+            else => {},
+        }
+        previous = token.tag;
+    }
+}
+
+/// Skips to the `}` closing an already opened block and returns its offset.
+fn skipBlock(tokenizer: *std.zig.Tokenizer) ?usize {
+    var depth: usize = 1;
+    while (true) {
+        const token = tokenizer.next();
+        switch (token.tag) {
+            .eof => return null,
+            .l_brace => depth += 1,
+            .r_brace => {
+                depth -= 1;
+                if (depth == 0) return token.loc.start;
+            },
+            else => {},
+        }
+    }
+}
+
+/// Parses a source owned by the unit, applying its parse mode first.
+fn parseOwned(self: *TranslationUnit, source: [:0]u8) !void {
+    self.parse_ns = 0;
+    var timer = std.time.Timer.start() catch null;
+    if (self.mode == .declarations) blankFunctionBodies(source);
+    try self.parse(source);
+    if (timer) |*t| self.parse_ns = t.read();
+}
+
+fn parse(self: *TranslationUnit, source: [:0]const u8) !void {
+    const allocator = self.arena.allocator();
+    // The parser grows its lists many times, which would leave every outgrown buffer
+    // behind in the arena. It works on a scratch allocator, and only the final tree
+    // is copied to the arena.
+    const scratch = std.heap.smp_allocator;
+
+    var scratch_tree = try std.zig.Ast.parse(scratch, source, .zig);
+    defer scratch_tree.deinit(scratch);
 
     const ast_ptr = try allocator.create(std.zig.Ast);
-    ast_ptr.* = try std.zig.Ast.parse(allocator, heap_source, .zig);
+    ast_ptr.* = .{
+        .source = source,
+        .tokens = (try scratch_tree.tokens.toMultiArrayList().clone(allocator)).slice(),
+        .nodes = (try scratch_tree.nodes.toMultiArrayList().clone(allocator)).slice(),
+        .extra_data = try allocator.dupe(u32, scratch_tree.extra_data),
+        .mode = scratch_tree.mode,
+        .errors = try allocator.dupe(Ast.Error, scratch_tree.errors),
+    };
 
     const internal_errors: []const std.zig.Ast.Error = ast_ptr.errors;
     const count = internal_errors.len;
@@ -61,12 +244,29 @@ pub fn initFromSource(source: [*:0]const u8) !TranslationUnit {
 
     const tokens_count = ast_ptr.tokens.len;
     const tokens_copy = try allocator.alloc(structs.ASTToken, tokens_count);
+
+    // Consecutive `///` lines are collected as a single range, so a declaration
+    // can later look up its doc comment by the token that precedes it.
+    var doc_comments: std.ArrayList(structs.DocComment) = .empty;
+    defer doc_comments.deinit(scratch);
+    var doc_comment_start: ?u32 = null;
+
     for (0..tokens_count) |i| {
         const original_token = ast_ptr.tokens.get(i);
         tokens_copy[i] = .{
             .tag_index = @intFromEnum(original_token.tag),
             .start = original_token.start,
         };
+
+        if (original_token.tag == .doc_comment) {
+            if (doc_comment_start == null) doc_comment_start = @intCast(i);
+        } else if (doc_comment_start) |first_token| {
+            try doc_comments.append(scratch, .{
+                .first_token = first_token,
+                .last_token = @intCast(i - 1),
+            });
+            doc_comment_start = null;
+        }
     }
 
     const node_count = ast_ptr.nodes.len;
@@ -80,23 +280,76 @@ pub fn initFromSource(source: [*:0]const u8) !TranslationUnit {
         };
     }
 
-    tu.tree = ast_ptr;
-    tu.buffer = heap_source;
-    tu.errors = error_slice;
-    tu.tokens = tokens_copy;
-    tu.nodes = node_copy;
-    return tu;
+    const root_decls = ast_ptr.rootDecls();
+    const root_copy = try allocator.alloc(structs.ASTNode, root_decls.len);
+    for (root_decls, root_copy) |root_index, *root_node| {
+        root_node.* = node_copy[@intFromEnum(root_index)];
+    }
+
+    self.tree = ast_ptr;
+    self.buffer = source;
+    self.errors = error_slice;
+    self.tokens = tokens_copy;
+    self.nodes = node_copy;
+    self.root_nodes = root_copy;
+    self.doc_comments = try allocator.dupe(structs.DocComment, doc_comments.items);
+    self.rendered_errors = null;
+    self.rendered_source = null;
 }
 
-pub fn deinit(self: *TranslationUnit) void {
-    const allocator = self.gpa_allocator.allocator();
-    self.tree.deinit(allocator);
-    allocator.destroy(self.tree);
+/// Formats every parse error as a `line:column: error: message` line.
+/// Lines and columns are 1-based. The result is cached on the unit.
+pub fn renderErrors(self: *TranslationUnit) ![]const u8 {
+    if (self.rendered_errors) |rendered| return rendered;
+
+    var output: std.Io.Writer.Allocating = .init(self.arena.allocator());
+    defer output.deinit();
+    const writer = &output.writer;
+
+    const source = self.tree.source;
+    var line: usize = 0;
+    var line_start: usize = 0;
+    var scanned: usize = 0;
+
+    for (self.tree.errors) |parse_error| {
+        const offset = self.tree.tokenStart(parse_error.token) + self.tree.errorOffset(parse_error);
+        if (offset < scanned) {
+            line = 0;
+            line_start = 0;
+            scanned = 0;
+        }
+        while (scanned < offset) : (scanned += 1) {
+            if (source[scanned] == '\n') {
+                line += 1;
+                line_start = scanned + 1;
+            }
+        }
+
+        const kind = if (parse_error.is_note) "note" else "error";
+        try writer.print("{d}:{d}: {s}: ", .{ line + 1, offset - line_start + 1, kind });
+        try self.tree.renderError(parse_error, writer);
+        try writer.writeByte('\n');
+    }
 
-    allocator.free(self.buffer);
-    if (self.errors.len > 0) allocator.free(self.errors);
-    if (self.tokens.len > 0) allocator.free(self.tokens);
-    if (self.nodes.len > 0) allocator.free(self.nodes);
+    self.rendered_errors = try output.toOwnedSlice();
+    return self.rendered_errors.?;
+}
+
+/// Formats the whole tree the same way `zig fmt` does. The result is cached on the unit.
+/// Fails with `error.ParseErrors` if the source could not be parsed cleanly.
+pub fn renderSource(self: *TranslationUnit) ![]const u8 {
+    if (self.rendered_source) |rendered| return rendered;
+    if (self.tree.errors.len > 0) return error.ParseErrors;
+
+    // Rendering grows its buffer many times, so it is kept off the arena
+    // and only the final output is copied there.
+    const rendered = try self.tree.renderAlloc(std.heap.smp_allocator);
+    defer std.heap.smp_allocator.free(rendered);
 
-    _ = self.gpa_allocator.deinit();
+    self.rendered_source = try self.arena.allocator().dupe(u8, rendered);
+    return self.rendered_source.?;
+}
+
+pub fn deinit(self: *TranslationUnit) void {
+    self.arena.deinit();
 }
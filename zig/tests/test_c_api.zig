@@ -328,3 +328,241 @@ test "parser parses exports correctly" {
     try std.testing.expectEqual(c_api.getNodeParamsCount(tu, func_node_1), 1);
     try std.testing.expectEqual(c_api.getNodeParamsCount(tu, func_node_2), 0);
 }
+
+test "parser collects doc comments of declarations" {
+    const tu = c_api.createTranslationUnitFromSource(
+        \\/// Adds two numbers.
+        \\/// Returns their sum.
+        \\pub fn add(a: usize, b: usize) usize {
+        \\    return a + b;
+        \\}
+        \\
+        \\// Regular comment.
+        \\const undocumented = 1;
+        \\
+        \\/// The answer.
+        \\pub extern var answer: u32;
+    ).?;
+    defer c_api.freeTranslationUnit(tu);
+    const indexes: []const u32 = c_api.toSlice(u32, c_api.getTranslationUnitRootNodes(tu));
+    try std.testing.expectEqual(indexes.len, 3);
+
+    const func_node: ASTNode = c_api.getTranslationUnitNodeFromIndex(tu, indexes[0]);
+    const var_node: ASTNode = c_api.getTranslationUnitNodeFromIndex(tu, indexes[1]);
+    const extern_node: ASTNode = c_api.getTranslationUnitNodeFromIndex(tu, indexes[2]);
+
+    try std.testing.expectEqualStrings(
+        "/// Adds two numbers.\n/// Returns their sum.",
+        c_api.toSlice(u8, c_api.getNodeDocComment(tu, func_node)),
+    );
+    try std.testing.expectEqual(null, c_api.getNodeDocComment(tu, var_node).ptr);
+    try std.testing.expectEqualStrings(
+        "/// The answer.",
+        c_api.toSlice(u8, c_api.getNodeDocComment(tu, extern_node)),
+    );
+}
+
+test "parser renders errors with their locations" {
+    const tu: *TranslationUnit = c_api.createTranslationUnit("tests/test_sources/invalid.zig").?;
+    defer c_api.freeTranslationUnit(tu);
+
+    const rendered: []const u8 = c_api.toSlice(u8, c_api.renderTranslationUnitErrors(tu));
+    try std.testing.expectEqualStrings(
+        "1:27: error: expected ';' after declaration\n" ++
+            "3:14: error: expected return type expression, found '{'\n",
+        rendered,
+    );
+}
+
+test "parser renders no errors for valid code" {
+    const tu = c_api.createTranslationUnitFromSource("pub fn main() void {}").?;
+    defer c_api.freeTranslationUnit(tu);
+    try std.testing.expectEqual(null, c_api.renderTranslationUnitErrors(tu).ptr);
+}
+
+test "parser returns root nodes as structs" {
+    const tu = c_api.createTranslationUnitFromSource(
+        \\pub fn testFunc() void {}
+        \\pub const ABC = false;
+    ).?;
+    defer c_api.freeTranslationUnit(tu);
+
+    const indexes: []const u32 = c_api.toSlice(u32, c_api.getTranslationUnitRootNodes(tu));
+    const roots: []const ASTNode = c_api.toSlice(ASTNode, c_api.getTranslationUnitRootNodeStructs(tu));
+    try std.testing.expectEqual(indexes.len, roots.len);
+    for (indexes, roots) |index, root| {
+        try std.testing.expectEqual(c_api.getTranslationUnitNodeFromIndex(tu, index), root);
+    }
+}
+
+test "parser extracts a function signature in one call" {
+    const tu = c_api.createTranslationUnitFromSource(
+        \\pub extern "c" fn copy(noalias dest: [*]u8, comptime n: usize, x: anytype, src: ?*const u8) callconv(.c) !void;
+    ).?;
+    defer c_api.freeTranslationUnit(tu);
+    const root: ASTNode = c_api.toSlice(ASTNode, c_api.getTranslationUnitRootNodeStructs(tu))[0];
+
+    var signature: c_api.SignatureHeader = undefined;
+    var params: [1]c_api.SignatureParam = undefined;
+    var records: [2]c_api.TypeRecord = undefined;
+    try std.testing.expect(c_api.getFunctionSignature(tu, root, &signature, &params, params.len, &records, records.len));
+    try std.testing.expectEqual(3, signature.params_count);
+    try std.testing.expectEqual(7, signature.records_count);
+
+    var all_params: [3]c_api.SignatureParam = undefined;
+    var all_records: [7]c_api.TypeRecord = undefined;
+    try std.testing.expect(c_api.getFunctionSignature(tu, root, &signature, &all_params, 3, &all_records, 7));
+    try std.testing.expectEqualStrings("copy", c_api.toSlice(u8, signature.name));
+    try std.testing.expectEqualStrings(".c", c_api.toSlice(u8, signature.calling_convention));
+    try std.testing.expectEqual(c_api.NodeModifier.public | c_api.NodeModifier.@"extern", signature.modifiers);
+    try std.testing.expectEqual(1, signature.return_type_records);
+    try std.testing.expectEqual(c_api.TypeFlag.inferred_error, all_records[0].flags);
+
+    try std.testing.expectEqualStrings("dest", c_api.toSlice(u8, all_params[0].name));
+    try std.testing.expectEqual(c_api.ParamFlag.@"noalias", all_params[0].flags);
+    try std.testing.expectEqual(2, all_params[0].type_records);
+    try std.testing.expectEqualStrings("n", c_api.toSlice(u8, all_params[1].name));
+    try std.testing.expectEqual(c_api.ParamFlag.@"comptime", all_params[1].flags);
+    try std.testing.expectEqualStrings("src", c_api.toSlice(u8, all_params[2].name));
+    try std.testing.expectEqual(3, all_params[2].type_records);
+}
+
+test "parser rejects signatures of non-functions" {
+    const tu = c_api.createTranslationUnitFromSource("const a = 5;").?;
+    defer c_api.freeTranslationUnit(tu);
+    const root: ASTNode = c_api.toSlice(ASTNode, c_api.getTranslationUnitRootNodeStructs(tu))[0];
+
+    var signature: c_api.SignatureHeader = undefined;
+    var params: [1]c_api.SignatureParam = undefined;
+    var records: [1]c_api.TypeRecord = undefined;
+    try std.testing.expect(!c_api.getFunctionSignature(tu, root, &signature, &params, 1, &records, 1));
+}
+
+test "parser formats the source like zig fmt" {
+    const tu = c_api.createTranslationUnitFromSource(
+        "/// Entry point.\npub   fn main( ) void {  // keep me\n}\n",
+    ).?;
+    defer c_api.freeTranslationUnit(tu);
+
+    const rendered: []const u8 = c_api.toSlice(u8, c_api.renderTranslationUnit(tu));
+    try std.testing.expectEqualStrings("/// Entry point.\npub fn main() void { // keep me\n}\n", rendered);
+    // The second call returns the cached output.
+    try std.testing.expectEqual(@as(?*const anyopaque, rendered.ptr), c_api.renderTranslationUnit(tu).ptr);
+}
+
+test "parser does not format invalid code" {
+    const tu = c_api.createTranslationUnitFromSource("const x = 5").?;
+    defer c_api.freeTranslationUnit(tu);
+    try std.testing.expectEqual(null, c_api.renderTranslationUnit(tu).ptr);
+}
+
+test "parser checks syntax of many files at once" {
+    const paths = [_][*:0]const u8{
+        "tests/test_sources/simple.zig",
+        "tests/test_sources/invalid.zig",
+        "tests/test_sources/missing.zig",
+        "tests/test_sources/large.zig",
+    };
+    var out: [paths.len]i64 = undefined;
+    c_api.checkSyntaxBatch(&paths, paths.len, 2, &out);
+
+    try std.testing.expectEqual(0, out[0]);
+    try std.testing.expectEqual(2, out[1]);
+    try std.testing.expectEqual(-1, out[2]);
+    try std.testing.expectEqual(0, out[3]);
+}
+
+test "parser creates many translation units at once" {
+    const paths = [_][*:0]const u8{
+        "tests/test_sources/simple.zig",
+        "tests/test_sources/missing.zig",
+        "tests/test_sources/large.zig",
+    };
+    var units: [paths.len]?*TranslationUnit = undefined;
+    try std.testing.expectEqual(2, c_api.createTranslationUnitsBatch(&paths, paths.len, 0, &units));
+    defer for (units) |unit| {
+        if (unit) |tu| c_api.freeTranslationUnit(tu);
+    };
+
+    try std.testing.expectEqual(null, units[1]);
+    try std.testing.expectEqual(30, c_api.getTranslationUnitTokensCount(units[0].?));
+    try std.testing.expectEqual(8323, c_api.getTranslationUnitTokensCount(units[2].?));
+}
+
+test "parser collects node modifiers in one call" {
+    const tu = c_api.createTranslationUnitFromSource(
+        \\pub extern "c" fn a() void;
+        \\pub inline fn b() void {}
+        \\export fn c() void {}
+        \\pub threadlocal var d: u8 = 0;
+        \\const e = 1;
+    ).?;
+    defer c_api.freeTranslationUnit(tu);
+    const indexes: []const u32 = c_api.toSlice(u32, c_api.getTranslationUnitRootNodes(tu));
+    try std.testing.expectEqual(indexes.len, 5);
+
+    const Modifier = structs.NodeModifier;
+    var modifiers: [5]u32 = undefined;
+    for (indexes, 0..) |index, i| {
+        modifiers[i] = c_api.getNodeModifiers(tu, c_api.getTranslationUnitNodeFromIndex(tu, index));
+    }
+
+    try std.testing.expectEqual(Modifier.public | Modifier.@"extern", modifiers[0]);
+    try std.testing.expectEqual(Modifier.public | Modifier.@"inline", modifiers[1]);
+    try std.testing.expectEqual(Modifier.@"export", modifiers[2]);
+    try std.testing.expectEqual(Modifier.public | Modifier.@"threadlocal", modifiers[3]);
+    try std.testing.expectEqual(Modifier.@"const", modifiers[4]);
+}
+
+test "parser serializes type expressions in preorder" {
+    const tu = c_api.createTranslationUnitFromSource(
+        \\fn a() !?[:0]const std.mem.Allocator {}
+    ).?;
+    defer c_api.freeTranslationUnit(tu);
+    const indexes: []const u32 = c_api.toSlice(u32, c_api.getTranslationUnitRootNodes(tu));
+    const fn_node = c_api.getTranslationUnitNodeFromIndex(tu, indexes[0]);
+    const type_node = c_api.getNodeType(tu, fn_node);
+
+    var records: [3]structs.TypeRecord = undefined;
+    try std.testing.expectEqual(3, c_api.getNodeTypeRecords(tu, type_node, &records, 2));
+    try std.testing.expectEqual(3, c_api.getNodeTypeRecords(tu, type_node, &records, records.len));
+
+    const Kind = structs.TypeKind;
+    const Flag = structs.TypeFlag;
+    try std.testing.expectEqual(Kind.optional, records[0].kind);
+    try std.testing.expectEqual(Flag.inferred_error, records[0].flags);
+
+    try std.testing.expectEqual(Kind.pointer, records[1].kind);
+    try std.testing.expectEqual(Flag.@"const", records[1].flags);
+    try std.testing.expectEqual(@intFromEnum(std.builtin.Type.Pointer.Size.slice), records[1].pointer_size);
+    try std.testing.expectEqualStrings("0", c_api.toSlice(u8, records[1].sentinel));
+
+    try std.testing.expectEqual(Kind.identifier, records[2].kind);
+    try std.testing.expectEqualStrings("std.mem.Allocator", c_api.toSlice(u8, records[2].text));
+}
+
+test "parser hashes nodes ignoring formatting and comments" {
+    const tu = c_api.createTranslationUnitFromSource(
+        \\fn a(x: u8) void {}
+        \\/// Docs.
+        \\fn a( x : u8 ) void { // Comment.
+        \\}
+        \\fn a(x: u8) void { _ = x; }
+    ).?;
+    defer c_api.freeTranslationUnit(tu);
+    const indexes: []const u32 = c_api.toSlice(u32, c_api.getTranslationUnitRootNodes(tu));
+    var nodes: [3]ASTNode = undefined;
+    for (indexes, 0..) |index, i| nodes[i] = c_api.getTranslationUnitNodeFromIndex(tu, index);
+
+    try std.testing.expectEqual(c_api.getNodeStructuralHash(tu, nodes[0]), c_api.getNodeStructuralHash(tu, nodes[1]));
+    try std.testing.expect(c_api.getNodeStructuralHash(tu, nodes[0]) != c_api.getNodeStructuralHash(tu, nodes[2]));
+
+    var signatures: [3]c_api.SignatureHeader = undefined;
+    var params: [1]c_api.SignatureParam = undefined;
+    var records: [2]c_api.TypeRecord = undefined;
+    for (nodes, 0..) |node, i| {
+        try std.testing.expect(c_api.getFunctionSignature(tu, node, &signatures[i], &params, 1, &records, 2));
+    }
+    try std.testing.expectEqual(signatures[0].signature_hash, signatures[1].signature_hash);
+    try std.testing.expectEqual(signatures[0].signature_hash, signatures[2].signature_hash);
+}
@@ -5,7 +5,7 @@ const normalize = @import("helpers.zig").normalize;
 const TranslationUnit = @import("../src/translation_unit.zig");
 
 test "parsing simple valid code from source produces no errors" {
-    var tu = try TranslationUnit.initFromSource("pub fn main() void {}");
+    var tu = try TranslationUnit.initFromSource("pub fn main() void {}", .full);
     defer tu.deinit();
 
     try std.testing.expectEqual(tu.errors.len, 0);
@@ -16,7 +16,7 @@ test "parsing simple valid code from source produces no errors" {
 }
 
 test "parsing simple invalid code from string produces one error" {
-    var tu = try TranslationUnit.initFromSource("pub fn main() void {");
+    var tu = try TranslationUnit.initFromSource("pub fn main() void {", .full);
     defer tu.deinit();
 
     try std.testing.expectEqual(tu.errors.len, 1);
@@ -33,7 +33,7 @@ test "parsing simple invalid code from string produces one error" {
 }
 
 test "parsing simple valid code from file produces no errors" {
-    var tu = try TranslationUnit.initFromFile("tests/test_sources/simple.zig");
+    var tu = try TranslationUnit.initFromFile("tests/test_sources/simple.zig", .full);
     defer tu.deinit();
 
     const expected =
@@ -55,7 +55,7 @@ test "parsing simple valid code from file produces no errors" {
 }
 
 test "parsing large valid code from file produces no errors" {
-    var tu = try TranslationUnit.initFromFile("tests/test_sources/large.zig");
+    var tu = try TranslationUnit.initFromFile("tests/test_sources/large.zig", .full);
     defer tu.deinit();
 
     try std.testing.expectEqual(tu.tokens.len, 8323);
@@ -64,7 +64,7 @@ test "parsing large valid code from file produces no errors" {
 }
 
 test "parsing simple invalid code from file produces two errors" {
-    var tu = try TranslationUnit.initFromFile("tests/test_sources/invalid.zig");
+    var tu = try TranslationUnit.initFromFile("tests/test_sources/invalid.zig", .full);
     defer tu.deinit();
 
     const expected =
@@ -96,3 +96,73 @@ test "parsing simple invalid code from file produces two errors" {
     try std.testing.expectEqual(error_2.token_is_prev, false);
     try std.testing.expectEqual(error_2.token_index, 12);
 }
+
+test "parsing code with doc comments collects their token ranges" {
+    var tu = try TranslationUnit.initFromSource(
+        \\/// First line.
+        \\/// Second line.
+        \\const a = 1;
+        \\/// Another one.
+        \\const b = 2;
+    , .full);
+    defer tu.deinit();
+
+    try std.testing.expectEqual(tu.doc_comments.len, 2);
+    try std.testing.expectEqual(tu.doc_comments[0].first_token, 0);
+    try std.testing.expectEqual(tu.doc_comments[0].last_token, 1);
+    try std.testing.expectEqual(tu.doc_comments[1].first_token, 7);
+    try std.testing.expectEqual(tu.doc_comments[1].last_token, 7);
+}
+
+test "resetting a unit reparses it from new source" {
+    var tu = try TranslationUnit.initFromSource("const a = 1", .full);
+    defer tu.deinit();
+    try std.testing.expectEqual(tu.errors.len, 1);
+
+    try tu.resetFromSource("const a = 1;\nconst b = 2;");
+    try std.testing.expectEqual(tu.errors.len, 0);
+    try std.testing.expectEqualStrings(tu.buffer, "const a = 1;\nconst b = 2;");
+    try std.testing.expectEqual(tu.tree.rootDecls().len, 2);
+}
+
+test "resetting a unit from a missing file leaves an empty tree" {
+    var tu = try TranslationUnit.initFromSource("const a = 1;", .full);
+    defer tu.deinit();
+
+    try std.testing.expectError(error.FileNotFound, tu.resetFromFile("tests/test_sources/missing.zig"));
+    try std.testing.expectEqual(tu.errors.len, 0);
+    try std.testing.expectEqual(tu.tree.rootDecls().len, 0);
+}
+
+test "parsing declarations only blanks function bodies" {
+    const source =
+        \\const S = struct {
+        \\    fn method(self: S) error{Oops}!union(enum) { a: u8 } {
+        \\        _ = self; // "}"
+        \\        return .{ .a = 1 };
+        \\    }
+        \\};
+        \\extern fn external(callback: *const fn () callconv(.c) void) void;
+        \\pub fn main() callconv(.c) void {
+        \\    const x = struct { fn inner() void {} };
+        \\}
+    ;
+    var tu = try TranslationUnit.initFromSource(source, .declarations);
+    defer tu.deinit();
+
+    try std.testing.expectEqual(tu.errors.len, 0);
+    try std.testing.expectEqual(tu.tree.rootDecls().len, 3);
+    // Offsets and line numbers are kept.
+    try std.testing.expectEqual(tu.buffer.len, source.len);
+    try std.testing.expectEqual(std.mem.count(u8, tu.buffer, "\n"), std.mem.count(u8, source, "\n"));
+    // Container types in the return type are kept, the bodies are gone.
+    try std.testing.expect(std.mem.indexOf(u8, tu.buffer, "union(enum) { a: u8 } {") != null);
+    try std.testing.expect(std.mem.indexOf(u8, tu.buffer, "callconv(.c) void) void;") != null);
+    try std.testing.expect(std.mem.indexOf(u8, tu.buffer, "self;") == null);
+    try std.testing.expect(std.mem.indexOf(u8, tu.buffer, "return") == null);
+    try std.testing.expect(std.mem.indexOf(u8, tu.buffer, "inner") == null);
+
+    // Resetting keeps the mode.
+    try tu.resetFromSource("fn a() void { return; }");
+    try std.testing.expectEqualStrings(tu.buffer, "fn a() void {         }");
+}
@@ -5,6 +5,7 @@ from .function_printer import FunctionPrinter
 from .variable_printer import VariablePrinter
 from .test_printer import TestPrinter
 from .type_printer import TypePrinter
+from .native_formatter import NativeFormatter
 
 
 __all__ = (
@@ -15,5 +16,6 @@ __all__ = (
     "DefaultCodePrinter",
     "IDefaultPrintable",
     "SourceCodePrinter",
-    "SourceFilePrinter"
+    "SourceFilePrinter",
+    "NativeFormatter",
 )
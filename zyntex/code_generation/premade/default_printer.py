@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator, Optional
 
 from ..printer import IPrinter, PrinterDispatcher
 
@@ -21,6 +21,13 @@ class IDefaultPrintable(IPrinter, ABC):
     def target_type() -> type:
         """The NodeElement this printer handles."""
 
+    @staticmethod
+    def _print_doc_comment(doc_comment: Optional[str]) -> str:
+        """Renders a doc comment as `///` lines, each ending with a newline."""
+        if not doc_comment:
+            return ""
+        return "".join(f"///{f' {line}' if line else ''}\n" for line in doc_comment.splitlines())
+
 
 class DefaultCodePrinter(IPrinter):
     """Printer that combines all default printers into one."""
@@ -30,3 +37,6 @@ class DefaultCodePrinter(IPrinter):
 
     def print(self, target: Any) -> str:
         return self._dispatcher.print(target)
+
+    def iter_print(self, target: Any) -> Iterator[str]:
+        return self._dispatcher.iter_print(target)
@@ -14,13 +14,17 @@ class FunctionPrinter(IDefaultPrintable):
             ) if condition
         )
         args = ", ".join(
-            f"{'comptime ' if param.is_comptime else ''}{param.name}: "
+            f"{'comptime ' if param.is_comptime else ''}{'noalias ' if param.is_noalias else ''}"
+            f"{param.name}: "
             f"{self._dispatcher.print(param.type)}"
             for param in target.params
         )
         return_type = self._dispatcher.print(target.return_type)
+        if target.calling_convention is not None:
+            return_type = f"callconv({target.calling_convention}) {return_type}"
         body = f" {target.body}" if target.body is not None else ";"
-        return f"{modifiers}fn {target.name}({args}) {return_type}{body}"
+        doc_comment = self._print_doc_comment(target.doc_comment)
+        return f"{doc_comment}{modifiers}fn {target.name}({args}) {return_type}{body}"
 
     @staticmethod
     def target_type() -> type[FunctionDeclaration]:
@@ -0,0 +1,26 @@
+from typing import Union
+
+from ...parsing.bindings import PyTranslationUnit
+from ...parsing.source_code import SourceCode
+from ...parsing.source_file import SourceFile
+from ..printer import IPrinter
+
+
+class NativeFormatter(IPrinter):
+    """Printer that formats a whole source with Zig's own renderer, in a single native call.
+
+    Unlike `SourceFilePrinter`, it prints the parsed tree itself, so comments and
+    declarations without a high-level element are kept, and the output matches `zig fmt`.
+    Element changes made in Python are not reflected, and `PrinterConfiguration` is ignored.
+    It is not registered by default; add it for the types you want formatted natively::
+
+        dispatcher.add(SourceFile, NativeFormatter)
+
+    Raises a RuntimeError if the source has parsing errors.
+
+    .. versionadded:: 0.2.4
+    """
+
+    def print(self, target: Union[SourceFile, SourceCode, PyTranslationUnit]) -> str:
+        unit = target if isinstance(target, PyTranslationUnit) else target.unit
+        return unit.render()
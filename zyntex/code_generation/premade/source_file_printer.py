@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from ...parsing.source_file import SourceFile
 from .default_printer import IDefaultPrintable
 
@@ -6,9 +8,14 @@ class SourceFilePrinter(IDefaultPrintable):
     """Printer for Zig source file."""
 
     def print(self, target: SourceFile) -> str:
-        return f"{self._dispatcher.configuration.line_ending}".join(
-            self._dispatcher.print(content) for content in target.content
-        )
+        return "".join(self.iter_print(target))
+
+    def iter_print(self, target: SourceFile) -> Iterator[str]:
+        line_ending = self._dispatcher.configuration.line_ending
+        for index, content in enumerate(target.content):
+            if index:
+                yield line_ending
+            yield from self._dispatcher.iter_print(content)
 
     @staticmethod
     def target_type() -> type[SourceFile]:
@@ -1,5 +1,6 @@
 from typing import cast
 
+from ...parsing.bindings import PointerSize
 from ...parsing.syntax.type_node import TypeNode
 from .default_printer import IDefaultPrintable
 
@@ -11,27 +12,42 @@ class TypePrinter(IDefaultPrintable):
         result = ""
         current: TypeNode = target
         while True:
-            if current.is_error_union:
-                result += "!"
-            if current.is_type():
-                if current.is_const:
-                    result += "const "
-                result += current.type.value
-                break
+            result += self._prefix(current)
+            if current.type is not None:
+                return result + current.type.value
             if current.is_optional():
                 result += "?"
                 current = cast(TypeNode, current.optional_type)
-                continue
-            if current.is_pointer():
-                result += "*"
+            elif current.is_pointer():
+                result += self._pointer_prefix(current)
                 current = cast(TypeNode, current.pointer_type)
-                continue
-            if current.is_array():
+            elif current.is_array():
                 assert current.array_length, f"Array type ({current!r}) has no array_length."
-                result += f"[{current.array_length}]"
+                result += f"[{current.array_length}{self._sentinel(current)}]"
                 current = cast(TypeNode, current.array_type)
-                continue
-        return result
+            else:
+                raise NotImplementedError(f"Type node ({current!r}) is not supported.")
+
+    def _prefix(self, target: TypeNode) -> str:
+        prefix = "!" if target.is_error_union and target.error_set is None else ""
+        if target.is_const:
+            prefix += "const "
+        if target.error_set is not None:
+            prefix += f"{self.print(target.error_set)}!"
+        return prefix
+
+    def _pointer_prefix(self, target: TypeNode) -> str:
+        if target.pointer_size == PointerSize.MANY:
+            return f"[*{self._sentinel(target)}]"
+        if target.pointer_size == PointerSize.SLICE:
+            return f"[{self._sentinel(target)}]"
+        if target.pointer_size == PointerSize.C:
+            return "[*c]"
+        return "*"
+
+    @staticmethod
+    def _sentinel(target: TypeNode) -> str:
+        return "" if target.sentinel is None else f":{target.sentinel}"
 
     @staticmethod
     def target_type() -> type[TypeNode]:
@@ -15,12 +15,13 @@ class VariablePrinter(IDefaultPrintable):
                 (not target.is_const, "var "),
             ) if condition
         )
+        doc_comment = self._print_doc_comment(target.doc_comment)
         type_hint = ""
         if target.type_hint:
             type_hint = f": {self._dispatcher.print(target.type_hint)}"
         if target.is_extern or target.value is None:
-            return f"{modifiers}{target.name}{type_hint};"
-        return f"{modifiers}{target.name}{type_hint} = {target.value};"
+            return f"{doc_comment}{modifiers}{target.name}{type_hint};"
+        return f"{doc_comment}{modifiers}{target.name}{type_hint} = {target.value};"
 
     @staticmethod
     def target_type() -> type[VariableDeclaration]:
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, TextIO
 
 from .configuration import PrinterConfiguration
 
@@ -17,28 +18,130 @@ class IPrinter(ABC):
     def print(self, target: Any) -> str:
         """Produced output of the printer."""
 
+    def iter_print(self, target: Any) -> Iterator[str]:
+        """Produced output of the printer, in chunks that join into `print(target)`.
+        Printers of large targets override it so their output never has to be held at once.
+
+        .. versionadded:: 0.2.4
+        """
+        yield self.print(target)
+
 
 class PrinterDispatcher:
     """Collects printers and chooses the right one for each node.
 
     You can register printers with `add`, remove them with `remove`,
-    and use `print` to get code for any supported node."""
+    and use `print` to get code for any supported node.
+
+    A printer registered for a type is also used for its subclasses, unless they
+    have a printer of their own. The closest type in the MRO wins.
+
+    .. versionchanged:: 0.2.4
+        Subclasses of registered types are supported.
+    """
 
     def __init__(self, configuration: Optional[PrinterConfiguration] = None) -> None:
         self.configuration = configuration or PrinterConfiguration()
         self._printers: dict[type, IPrinter] = {}
+        # Printers resolved through the MRO, per concrete type. Cleared on every change.
+        self._resolved: dict[type, IPrinter] = {}
 
     def add(self, target_type: type, target_printer_type: type[IPrinter]) -> None:
         """Register a printer for the given node type."""
         self._printers[target_type] = target_printer_type(self)
+        self._resolved.clear()
 
     def remove(self, target_type: type) -> None:
         """Unregister the printer for the given node type."""
         del self._printers[target_type]
+        self._resolved.clear()
 
     def print(self, target: Any) -> str:
         """Produces source code for the given AST node."""
+        return self._printer_for(target).print(target)
+
+    def iter_print(self, target: Any) -> Iterator[str]:
+        """Produces source code for the given AST node in chunks.
+
+        .. versionadded:: 0.2.4
+        """
+        yield from self._printer_for(target).iter_print(target)
+
+    def write(self, target: Any, fp: TextIO) -> None:
+        """Writes source code for the given AST node into a text writer, chunk by chunk,
+        so the whole output is never held in memory.
+
+        .. versionadded:: 0.2.4
+        """
+        for chunk in self.iter_print(target):
+            fp.write(chunk)
+
+    def print_many(
+            self,
+            targets: Iterable[Any],
+            workers: Optional[int] = None,
+            executor: Optional[Executor] = None,
+    ) -> list[str]:
+        """Prints many targets concurrently. Outputs are returned in the order of `targets`.
+
+        Parameters
+        ----------
+        targets:
+            Nodes to print.
+        workers:
+            Number of threads to use. If None, the thread pool picks its own default.
+            Ignored when `executor` is given.
+        executor:
+            Executor to submit the work to instead of a new thread pool.
+            A process pool requires the dispatcher, its printers and the targets to be
+            picklable, so it only works with elements created in Python.
+
+        .. versionadded:: 0.2.4
+        """
+        return self._map(self.print, workers, executor, list(targets))
+
+    def write_many(
+            self,
+            targets: Sequence[Any],
+            destinations: Sequence[str],
+            workers: Optional[int] = None,
+            executor: Optional[Executor] = None,
+    ) -> None:
+        """Prints many targets concurrently, streaming each one straight into
+        the file at the matching destination path. Existing files are overwritten.
+
+        `workers` and `executor` work the same as in `print_many`.
+
+        .. versionadded:: 0.2.4
+        """
+        if len(targets) != len(destinations):
+            raise ValueError(
+                f"Got {len(targets)} targets, but {len(destinations)} destinations."
+            )
+        self._map(self._write_to_path, workers, executor, targets, destinations)
+
+    def _write_to_path(self, target: Any, destination: str) -> None:
+        with open(destination, "w", encoding="utf-8") as fp:
+            self.write(target, fp)
+
+    @staticmethod
+    def _map(
+            func: Callable[..., Any],
+            workers: Optional[int],
+            executor: Optional[Executor],
+            *iterables: Iterable[Any],
+    ) -> list[Any]:
+        if executor is not None:
+            return list(executor.map(func, *iterables))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, *iterables))
+
+    def _printer_for(self, target: Any) -> IPrinter:
         target_type = type(target)
-        if printer := self._printers.get(target_type):
-            return printer.print(target)
+        if printer := self._resolved.get(target_type):
+            return printer
+        for base in target_type.__mro__:
+            if printer := self._printers.get(base):
+                self._resolved[target_type] = printer
+                return printer
         raise KeyError(f"No printer registered for node: {target}.")
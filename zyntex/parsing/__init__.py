@@ -1,10 +1,29 @@
-from .source_module import SourceModule
+from .source_module import SourceModule, ScanOptions, ScanResult, SkippedFile, SkipReason
 from .source_file import SourceFile
 from .source_code import SourceCode
+from .syntax_check import check_syntax
+from .api_diff import api_diff, ApiDiff
+from .live_units import LiveUnits
+from .source_cache import SourceCache, CacheEntry
+from .discovery import discover_files, PathPattern, DEFAULT_INCLUDE, DEFAULT_EXCLUDE
 
 
 __all__ = (
     "SourceFile",
     "SourceModule",
+    "ScanOptions",
+    "ScanResult",
+    "SkippedFile",
+    "SkipReason",
     "SourceCode",
+    "check_syntax",
+    "api_diff",
+    "ApiDiff",
+    "LiveUnits",
+    "SourceCache",
+    "CacheEntry",
+    "discover_files",
+    "PathPattern",
+    "DEFAULT_INCLUDE",
+    "DEFAULT_EXCLUDE",
 )
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from .syntax import INodeElement, FunctionDeclaration
+
+
+@dataclass
+class ApiDiff:
+    """Differences between two versions of a set of declarations.
+
+    .. versionadded:: 0.2.4
+    """
+    added: list[INodeElement] = field(default_factory=list)
+    removed: list[INodeElement] = field(default_factory=list)
+    changed: list[tuple[INodeElement, INodeElement]] = field(default_factory=list)
+    """Pairs of ``(old, new)`` declarations whose hashes differ."""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _api_hash(element: INodeElement) -> Optional[int]:
+    if isinstance(element, FunctionDeclaration):
+        return element.signature_hash
+    return getattr(element, "structural_hash", None)
+
+
+def _index(elements: Iterable[INodeElement], public_only: bool) -> dict[tuple, INodeElement]:
+    index: dict[tuple, INodeElement] = {}
+    for element in elements:
+        name = getattr(element, "name", None)
+        if name is None or (public_only and not getattr(element, "is_public", False)):
+            continue
+        index[(type(element), name)] = element
+    return index
+
+
+def api_diff(
+        old: Iterable[INodeElement], new: Iterable[INodeElement], public_only: bool = True
+) -> ApiDiff:
+    """Compares two versions of a set of declarations by their structural hashes,
+    without rendering them.
+
+    Declarations are matched by their type and name. Functions are compared by
+    `signature_hash`, so changes to their bodies are not reported. Other declarations
+    are compared by `structural_hash`. Formatting and comments never cause a change.
+    Declarations that were not parsed from source have no hash and are always reported as changed.
+
+    Parameters
+    ----------
+    old:
+        Declarations of the previous version, e.g. ``SourceFile.content``.
+    new:
+        Declarations of the current version.
+    public_only:
+        If True, only `pub` declarations are compared. Tests are never public,
+        so they are only compared when this is False.
+
+    .. versionadded:: 0.2.4
+    """
+    old_index = _index(old, public_only)
+    new_index = _index(new, public_only)
+
+    diff = ApiDiff()
+    for key, old_element in old_index.items():
+        new_element = new_index.get(key)
+        if new_element is None:
+            diff.removed.append(old_element)
+        else:
+            old_hash = _api_hash(old_element)
+            if old_hash is None or old_hash != _api_hash(new_element):
+                diff.changed.append((old_element, new_element))
+    diff.added.extend(element for key, element in new_index.items() if key not in old_index)
+    return diff
@@ -1,9 +1,10 @@
 from .structures import (
     TranslationUnit, GenericSlice,
-    ASTNode, ASTToken, ErrorReport, NodeParam, PyString
+    ASTNode, ASTToken, ErrorReport, NodeParam, TypeRecord, PyString,
+    SignatureHeader, SignatureParam
 )
 from .translation_unit import PyTranslationUnit, TranslationUnitPtr
-from .enums import NodeTag, TokenTag, ErrorTag, PrimitiveType
+from .enums import NodeTag, TokenTag, ErrorTag, NodeModifier, PointerSize, PrimitiveType, ParseMode
 from .native import init_native_library, get_native_library
 from .ast_node import PyASTNode
 
@@ -15,13 +16,19 @@ __all__ = (
     "ASTToken",
     "ErrorReport",
     "NodeParam",
+    "TypeRecord",
+    "SignatureHeader",
+    "SignatureParam",
     "PyString",
     "PyTranslationUnit",
     "TranslationUnit",
     "NodeTag",
     "TokenTag",
     "ErrorTag",
+    "NodeModifier",
+    "PointerSize",
     "PrimitiveType",
+    "ParseMode",
     "PyASTNode",
     "init_native_library",
     "get_native_library"
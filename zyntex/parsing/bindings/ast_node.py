@@ -1,7 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, List
+from ctypes import byref
+from typing import TYPE_CHECKING, Any, Optional, List, Tuple
 
-from .structures import ASTNode, NodeParam, PyString
+from .structures import (
+    ASTNode, NodeParam, TypeRecord, PyString, SignatureHeader, SignatureParam
+)
+from .enums import NodeModifier
 
 if TYPE_CHECKING:
     from .translation_unit import PyTranslationUnit
@@ -16,21 +20,32 @@ class PyASTNode:
         self._parent = parent
         self._node = node
         self._lib = parent.lib
+        self._generation = parent.generation
 
     def __repr__(self) -> str:
         return f"PyASTNode(tag={self.tag})"
 
+    @property
+    def _ptr(self) -> Any:
+        # Node indices are only valid for the tree they were read from.
+        if self._generation != self._parent.generation:
+            raise RuntimeError(
+                f"Translation unit '{self._parent.path}' has been reset since this node "
+                f"was obtained."
+            )
+        return self._parent.ptr
+
     def is_public(self) -> bool:
         """True if the node is marked as pub."""
-        return self._lib.isNodePublic(self._parent.ptr, self._node)
+        return self._lib.isNodePublic(self._ptr, self._node)
 
     def is_extern(self) -> bool:
         """True if the node is marked as extern."""
-        return self._lib.isNodeExtern(self._parent.ptr, self._node)
+        return self._lib.isNodeExtern(self._ptr, self._node)
 
     def is_export(self) -> bool:
         """True if the node is marked as export."""
-        return self._lib.isNodeExport(self._parent.ptr, self._node)
+        return self._lib.isNodeExport(self._ptr, self._node)
 
     def is_container(self) -> bool:
         """True if the node is a container (Enum, Struct, Union, or Opaque)."""
@@ -38,77 +53,159 @@ class PyASTNode:
 
     def is_const(self) -> bool:
         """Whether the node is marked as const."""
-        return self._lib.isNodeConst(self._parent.ptr, self._node)
+        return self._lib.isNodeConst(self._ptr, self._node)
 
     def is_struct(self) -> bool:
         """Whether the node points to a struct."""
-        return self._lib.isNodeStruct(self._parent.ptr, self._node)
+        return self._lib.isNodeStruct(self._ptr, self._node)
 
     def is_union(self) -> bool:
         """Whether the node points to a union."""
-        return self._lib.isNodeUnion(self._parent.ptr, self._node)
+        return self._lib.isNodeUnion(self._ptr, self._node)
 
     def is_opaque(self) -> bool:
         """Whether the node points to an opaque."""
-        return self._lib.isNodeOpaque(self._parent.ptr, self._node)
+        return self._lib.isNodeOpaque(self._ptr, self._node)
 
     def is_enum(self) -> bool:
         """Whether the node points to an enum."""
-        return self._lib.isNodeEnum(self._parent.ptr, self._node)
+        return self._lib.isNodeEnum(self._ptr, self._node)
 
     def is_error_union(self) -> bool:
         """Whether the node is a part of an error union."""
-        return self._lib.isNodeErrorUnion(self._parent.ptr, self._node)
+        return self._lib.isNodeErrorUnion(self._ptr, self._node)
 
     @property
     def tag(self) -> NodeTag:
         """The node's tag."""
         return self._node.tag
 
+    @property
+    def tag_index(self) -> int:
+        """The node's tag as a plain integer, without creating a `NodeTag`.
+
+        .. versionadded:: 0.2.4
+        """
+        return self._node.tag_index
+
+    @property
+    def modifiers(self) -> NodeModifier:
+        """All modifier keywords of the node, fetched with a single native call.
+
+        .. versionadded:: 0.2.4
+        """
+        return NodeModifier(self._lib.getNodeModifiers(self._ptr, self._node))
+
     @property
     def spelling(self) -> str:
         """The node's spelling as a decoded UTF-8 string."""
-        return self._lib.getNodeSpelling(
-            self._parent.ptr, self._node
-        ).to_list(PyString)[0]
+        spelling = self._lib.getNodeSpelling(self._ptr, self._node).to_list(PyString)[0]
+        if self._parent.intern_table is not None:
+            return self._parent.intern_table.string(spelling)
+        return spelling
 
     @property
     def source(self) -> str:
         """Raw source of the node."""
-        return self._lib.getNodeSource(self._parent.ptr, self._node.index).to_list(PyString)[0]
+        return self._lib.getNodeSource(self._ptr, self._node.index).to_list(PyString)[0]
 
     @property
     def type(self) -> Optional[PyASTNode]:
         """The type node assigned to Node. For functions, it's the return type.
         For variable declarations, it specifies the type hint."""
-        node_type = self._lib.getNodeType(self._parent.ptr, self._node)
+        node_type = self._lib.getNodeType(self._ptr, self._node)
         if node_type.index != self._node.index:
             return PyASTNode(self.parent, node_type)
 
     @property
     def body(self) -> Optional[str]:
         """Node's raw body."""
-        body_slice = self._lib.getNodeBody(self._parent.ptr, self._node)
+        body_slice = self._lib.getNodeBody(self._ptr, self._node)
         if not body_slice.is_empty:
             return body_slice.to_list(PyString)[0]
 
+    @property
+    def doc_comment(self) -> Optional[str]:
+        """The `///` doc comment placed directly above the node, with the comment
+        markers stripped. None if the node is not documented."""
+        doc_slice = self._lib.getNodeDocComment(self._ptr, self._node)
+        if doc_slice.is_empty:
+            return None
+        lines = []
+        for line in doc_slice.to_list(PyString)[0].splitlines():
+            line = line.lstrip()
+            # The slice spans from the first to the last `///` token, so plain comments
+            # and blank lines between them are skipped. `////` is a plain comment too.
+            if not line.startswith("///") or line.startswith("////"):
+                continue
+            line = line[3:]
+            lines.append(line[1:] if line.startswith(" ") else line)
+        return "\n".join(lines)
+
     @property
     def params(self) -> List[NodeParam]:
         """A list of node's parameters. For functions, these are arguments"""
         result = []
-        params_count = self._lib.getNodeParamsCount(self._parent.ptr, self._node)
+        params_count = self._lib.getNodeParamsCount(self._ptr, self._node)
         if params_count == 0:
             return result
         buffer = (NodeParam * params_count)()
-        filled = self._lib.getNodeParams(self._parent.ptr, self._node, buffer, params_count)
+        filled = self._lib.getNodeParams(self._ptr, self._node, buffer, params_count)
         for i in range(filled):
             result.append(buffer[i])
         return result
 
+    @property
+    def structural_hash(self) -> int:
+        """Stable hash of the node's tokens, ignoring whitespace and comments.
+
+        .. versionadded:: 0.2.4
+        """
+        return self._lib.getNodeStructuralHash(self._ptr, self._node)
+
+    @property
+    def type_records(self) -> List[TypeRecord]:
+        """The whole type expression starting at this node, serialized in preorder.
+
+        .. versionadded:: 0.2.4
+        """
+        capacity = 8
+        while True:
+            buffer = (TypeRecord * capacity)()
+            count = self._lib.getNodeTypeRecords(self._ptr, self._node, buffer, capacity)
+            if count <= capacity:
+                return buffer[:count]
+            capacity = count
+
+    @property
+    def function_signature(
+            self
+    ) -> Optional[Tuple[SignatureHeader, List[SignatureParam], List[TypeRecord]]]:
+        """The whole prototype of a function node, fetched with a single native call
+        in the common case. Type records of the return type come first, followed by
+        the records of each parameter, in order. None if the node is not a function.
+
+        .. versionadded:: 0.2.4
+        """
+        params_capacity, records_capacity = 8, 32
+        while True:
+            header = SignatureHeader()
+            params = (SignatureParam * params_capacity)()
+            records = (TypeRecord * records_capacity)()
+            if not self._lib.getFunctionSignature(
+                    self._ptr, self._node, byref(header),
+                    params, params_capacity, records, records_capacity
+            ):
+                return None
+            if header.params_count <= params_capacity and header.records_count <= records_capacity:
+                return header, params[:header.params_count], records[:header.records_count]
+            params_capacity = max(params_capacity, header.params_count)
+            records_capacity = max(records_capacity, header.records_count)
+
     @property
     def align(self) -> Optional[str]:
         """The align value for the node."""
-        align_slice = self._lib.getNodeAlign(self._parent.ptr, self._node)
+        align_slice = self._lib.getNodeAlign(self._ptr, self._node)
         if not align_slice.is_empty:
             return align_slice.to_list(PyString)[0]
 
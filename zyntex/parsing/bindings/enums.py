@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntFlag
 
 
 # pylint: disable=invalid-name
@@ -379,6 +379,52 @@ class ErrorTag(Enum):
     INVALID_BYTE = 64
 
 
+class NodeModifier(IntFlag):
+    """
+    Modifier keywords of a node, as returned by `getNodeModifiers`.
+
+    .. versionadded:: 0.2.4
+    """
+    NONE = 0
+    PUBLIC = 1 << 0
+    EXTERN = 1 << 1
+    EXPORT = 1 << 2
+    CONST = 1 << 3
+    INLINE = 1 << 4
+    NOINLINE = 1 << 5
+    THREADLOCAL = 1 << 6
+
+
+class PointerSize(Enum):
+    """
+    Kinds of Zig pointers, matching `std.builtin.Type.Pointer.Size`.
+
+    .. versionadded:: 0.2.4
+    """
+    ONE = 0
+    MANY = 1
+    SLICE = 2
+    C = 3
+
+
+class ParseMode(Enum):
+    """
+    How much of a source is parsed, matching `TranslationUnit.ParseMode`.
+
+    .. versionadded:: 0.2.4
+    """
+    FULL = "full"
+    """The whole source is parsed."""
+    DECLARATIONS = "declarations"
+    """Function bodies are blanked out before parsing, which makes parsing
+    implementation-heavy files much cheaper. Positions and line numbers are kept."""
+
+    @property
+    def native_value(self) -> int:
+        """The value passed to the native library."""
+        return 0 if self is ParseMode.FULL else 1
+
+
 class PrimitiveType(Enum):
     """
     Bindings for Zig primitive types.
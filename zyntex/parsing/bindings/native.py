@@ -4,7 +4,9 @@ import os
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
-from .structures import ASTNode, GenericSlice, NodeParam
+from .structures import (
+    ASTNode, GenericSlice, NodeParam, TypeRecord, SignatureHeader, SignatureParam
+)
 from .translation_unit import TranslationUnitPtr
 
 _lib_instance: Optional[ctypes.CDLL] = None
@@ -20,26 +22,55 @@ class FunctionSignature:
 lib_functions = [
     FunctionSignature("createTranslationUnit", TranslationUnitPtr, (ctypes.c_char_p,)),
     FunctionSignature("createTranslationUnitFromSource", TranslationUnitPtr, (ctypes.c_char_p,)),
+    FunctionSignature("createTranslationUnitWithMode", TranslationUnitPtr,
+                      (ctypes.c_char_p, ctypes.c_uint8)),
+    FunctionSignature("createTranslationUnitFromSourceWithMode", TranslationUnitPtr,
+                      (ctypes.c_char_p, ctypes.c_uint8)),
+    FunctionSignature("resetTranslationUnit", ctypes.c_bool, (TranslationUnitPtr, ctypes.c_char_p)),
+    FunctionSignature("resetTranslationUnitFromSource", ctypes.c_bool,
+                      (TranslationUnitPtr, ctypes.c_char_p)),
+    FunctionSignature("createTranslationUnitsBatch", ctypes.c_size_t,
+                      (ctypes.POINTER(ctypes.c_char_p), ctypes.c_size_t, ctypes.c_size_t,
+                       ctypes.POINTER(TranslationUnitPtr))),
+    FunctionSignature("createTranslationUnitsBatchWithMode", ctypes.c_size_t,
+                      (ctypes.POINTER(ctypes.c_char_p), ctypes.c_size_t, ctypes.c_size_t,
+                       ctypes.c_uint8, ctypes.POINTER(TranslationUnitPtr))),
+    FunctionSignature("checkSyntaxBatch", None,
+                      (ctypes.POINTER(ctypes.c_char_p), ctypes.c_size_t, ctypes.c_size_t,
+                       ctypes.POINTER(ctypes.c_int64))),
     FunctionSignature("getTranslationUnitNodesCount", ctypes.c_size_t, (TranslationUnitPtr,)),
     FunctionSignature("getTranslationUnitNodes", GenericSlice, (TranslationUnitPtr,)),
     FunctionSignature("getTranslationUnitRootNodes", GenericSlice, (TranslationUnitPtr,)),
+    FunctionSignature("getTranslationUnitRootNodeStructs", GenericSlice, (TranslationUnitPtr,)),
     FunctionSignature("getTranslationUnitNodeFromIndex", ASTNode,
                       (TranslationUnitPtr, ctypes.c_uint32)),
     FunctionSignature("getTranslationUnitTokensCount", ctypes.c_size_t, (TranslationUnitPtr,)),
     FunctionSignature("getTranslationUnitTokens", GenericSlice, (TranslationUnitPtr,)),
     FunctionSignature("getTranslationUnitErrorsCount", ctypes.c_size_t, (TranslationUnitPtr,)),
     FunctionSignature("getTranslationUnitErrors", GenericSlice, (TranslationUnitPtr,)),
+    FunctionSignature("renderTranslationUnitErrors", GenericSlice, (TranslationUnitPtr,)),
+    FunctionSignature("renderTranslationUnit", GenericSlice, (TranslationUnitPtr,)),
     FunctionSignature("getTranslationUnitSource", GenericSlice, (TranslationUnitPtr,)),
+    FunctionSignature("getTranslationUnitParseTime", ctypes.c_uint64, (TranslationUnitPtr,)),
     FunctionSignature("freeTranslationUnit", None, (TranslationUnitPtr,)),
 
     FunctionSignature("getNodeSpelling", GenericSlice, (TranslationUnitPtr, ASTNode)),
     FunctionSignature("getNodeSource", GenericSlice, (TranslationUnitPtr, ctypes.c_uint32)),
     FunctionSignature("getNodeType", ASTNode, (TranslationUnitPtr, ASTNode)),
+    FunctionSignature("getNodeStructuralHash", ctypes.c_uint64, (TranslationUnitPtr, ASTNode)),
+    FunctionSignature("getNodeTypeRecords", ctypes.c_size_t,
+                      (TranslationUnitPtr, ASTNode, ctypes.POINTER(TypeRecord), ctypes.c_size_t)),
+    FunctionSignature("getFunctionSignature", ctypes.c_bool,
+                      (TranslationUnitPtr, ASTNode, ctypes.POINTER(SignatureHeader),
+                       ctypes.POINTER(SignatureParam), ctypes.c_size_t,
+                       ctypes.POINTER(TypeRecord), ctypes.c_size_t)),
     FunctionSignature("getNodeAlign", GenericSlice, (TranslationUnitPtr, ASTNode)),
     FunctionSignature("getNodeBody", GenericSlice, (TranslationUnitPtr, ASTNode)),
+    FunctionSignature("getNodeDocComment", GenericSlice, (TranslationUnitPtr, ASTNode)),
     FunctionSignature("getNodeParamsCount", ctypes.c_size_t, (TranslationUnitPtr, ASTNode)),
     FunctionSignature("getNodeParams", ctypes.c_size_t,
                       (TranslationUnitPtr, ASTNode, ctypes.POINTER(NodeParam), ctypes.c_size_t)),
+    FunctionSignature("getNodeModifiers", ctypes.c_uint32, (TranslationUnitPtr, ASTNode)),
     FunctionSignature("isNodeExtern", ctypes.c_bool, (TranslationUnitPtr, ASTNode)),
     FunctionSignature("isNodeExport", ctypes.c_bool, (TranslationUnitPtr, ASTNode)),
     FunctionSignature("isNodePublic", ctypes.c_bool, (TranslationUnitPtr, ASTNode)),
@@ -37,8 +37,26 @@ class GenericSlice(ctypes.Structure):
             buf = bytes((ctypes.c_char * self.len).from_address(self.ptr))
             return [buf.decode(encoding)]
 
-        ptr = ctypes.cast(self.ptr, ctypes.POINTER(ctype))
-        return [ptr[i] for i in range(self.len)]
+        # A single copy of the whole block, so the items stay valid after the unit is released.
+        array_type = ctype * self.len
+        size = ctypes.sizeof(array_type)
+        return list(array_type.from_buffer_copy(ctypes.string_at(self.ptr, size)))
+
+    def to_array(self, ctype: type) -> ctypes.Array:
+        """Return the slice as a ctypes array of `ctype`, in a single step.
+
+        The array shares the native memory, so it is only valid as long as
+        its translation unit is. It supports the buffer protocol, so
+        ``memoryview`` and ``bytes`` can read it without converting each item.
+        Use `to_list` to get the items as Python objects.
+
+        May raise a EOFError if the slice is empty.
+
+        .. versionadded:: 0.2.4
+        """
+        if self.is_empty:
+            raise EOFError("Slice is empty.")
+        return (ctype * self.len).from_address(self.ptr)
 
     @property
     def is_empty(self) -> bool:
@@ -122,3 +140,73 @@ class NodeParam(ctypes.Structure):
 
     def __repr__(self) -> str:
         return f"NodeParam(name={self.name}, type={self.type}, is_comptime={self.is_comptime})"
+
+
+class TypeRecord(ctypes.Structure):
+    """Represents a single layer of a serialized type expression.
+
+    .. versionadded:: 0.2.4
+    """
+
+    KIND_IDENTIFIER = 0
+    KIND_OPTIONAL = 1
+    KIND_ARRAY = 2
+    KIND_POINTER = 3
+    KIND_ERROR_UNION = 4
+    KIND_UNKNOWN = 5
+
+    FLAG_CONST = 1 << 0
+    FLAG_INFERRED_ERROR = 1 << 1
+
+    _fields_ = [
+        ("kind", ctypes.c_uint8),
+        ("flags", ctypes.c_uint8),
+        ("pointer_size", ctypes.c_uint8),
+        ("text", GenericSlice),
+        ("sentinel", GenericSlice),
+    ]
+
+    def __repr__(self) -> str:
+        return f"TypeRecord(kind={self.kind}, flags={self.flags}, pointer_size={self.pointer_size})"
+
+
+class SignatureHeader(ctypes.Structure):
+    """Represents the header of a function prototype written by `getFunctionSignature`.
+
+    .. versionadded:: 0.2.4
+    """
+
+    _fields_ = [
+        ("name", GenericSlice),
+        ("modifiers", ctypes.c_uint32),
+        ("calling_convention", GenericSlice),
+        ("params_count", ctypes.c_uint32),
+        ("records_count", ctypes.c_uint32),
+        ("return_type_records", ctypes.c_uint32),
+        ("signature_hash", ctypes.c_uint64),
+    ]
+
+    def __repr__(self) -> str:
+        return (
+            f"SignatureHeader(params_count={self.params_count}, "
+            f"records_count={self.records_count})"
+        )
+
+
+class SignatureParam(ctypes.Structure):
+    """Represents a function parameter written by `getFunctionSignature`.
+
+    .. versionadded:: 0.2.4
+    """
+
+    FLAG_COMPTIME = 1 << 0
+    FLAG_NOALIAS = 1 << 1
+
+    _fields_ = [
+        ("name", GenericSlice),
+        ("flags", ctypes.c_uint8),
+        ("type_records", ctypes.c_uint32),
+    ]
+
+    def __repr__(self) -> str:
+        return f"SignatureParam(flags={self.flags}, type_records={self.type_records})"
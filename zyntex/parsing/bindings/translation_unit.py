@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from ctypes import POINTER, CDLL, c_uint32
-from typing import Optional, Any
+from ctypes import POINTER, CDLL, c_char_p
+from typing import Optional, Any, Sequence, TYPE_CHECKING
 
 from .structures import ErrorReport, TranslationUnit, ASTNode, ASTToken, PyString
 from .ast_node import PyASTNode
+from .enums import ParseMode
+
+if TYPE_CHECKING:
+    from ..syntax import InternTable
 
 TranslationUnitPtr = POINTER(TranslationUnit)
 
@@ -16,27 +20,94 @@ class PyTranslationUnit:
     to the underlying translation unit's resources at a higher level.
     """
 
-    def __init__(self, lib: CDLL, tu_ptr: Any, path: Optional[str] = None) -> None:
+    def __init__(
+            self,
+            lib: CDLL,
+            tu_ptr: Any,
+            path: Optional[str] = None,
+            mode: ParseMode = ParseMode.FULL,
+    ) -> None:
         self._tu_ptr = tu_ptr
         self._lib = lib
         self._path = path or "null"
+        self._mode = mode
         self._released = False
+        self._generation = 0
+        self.intern_table: Optional[InternTable] = None
+        """Table used to share strings and types created from this unit.
+
+        .. versionadded:: 0.2.4
+        """
 
         if not self._tu_ptr:
-            raise RuntimeError(
-                f"Failed to parse translation unit from path: '{self._path}'. "
-                f"The file may be missing, unreadable, or contain unrecoverable syntax errors."
-            )
+            raise RuntimeError(self._parse_error_message(self._path))
+
+    @staticmethod
+    def _parse_error_message(path: str) -> str:
+        return (
+            f"Failed to parse translation unit from path: '{path}'. "
+            f"The file may be missing, unreadable, or contain unrecoverable syntax errors."
+        )
 
     @classmethod
-    def from_path(cls, lib: CDLL, path: str) -> PyTranslationUnit:
-        translation_unit_ptr = lib.createTranslationUnit(path.encode())
-        return cls(lib=lib, tu_ptr=translation_unit_ptr, path=path)
+    def from_path(
+            cls, lib: CDLL, path: str, mode: ParseMode = ParseMode.FULL
+    ) -> PyTranslationUnit:
+        """Parses a file.
+
+        .. versionchanged:: 0.2.4
+            Added the `mode` parameter.
+        """
+        translation_unit_ptr = lib.createTranslationUnitWithMode(path.encode(), mode.native_value)
+        return cls(lib=lib, tu_ptr=translation_unit_ptr, path=path, mode=mode)
+
+    @classmethod
+    def from_source(
+            cls, lib: CDLL, source: str, mode: ParseMode = ParseMode.FULL
+    ) -> PyTranslationUnit:
+        """Parses source code.
+
+        .. versionchanged:: 0.2.4
+            Added the `mode` parameter.
+        """
+        translation_unit_ptr = lib.createTranslationUnitFromSourceWithMode(
+            source.encode(), mode.native_value
+        )
+        return cls(lib=lib, tu_ptr=translation_unit_ptr, mode=mode)
 
     @classmethod
-    def from_source(cls, lib: CDLL, source: str) -> PyTranslationUnit:
-        translation_unit_ptr = lib.createTranslationUnitFromSource(source.encode())
-        return cls(lib=lib, tu_ptr=translation_unit_ptr)
+    def from_paths(
+            cls,
+            lib: CDLL,
+            paths: Sequence[str],
+            thread_count: int = 0,
+            mode: ParseMode = ParseMode.FULL,
+    ) -> list[PyTranslationUnit]:
+        """Parses many files in a single native call, using a native thread pool
+        of `thread_count` threads (0 picks the CPU count).
+        Units are returned in the same order as `paths`.
+
+        .. versionadded:: 0.2.4
+        """
+        count = len(paths)
+        if count == 0:
+            return []
+        pointers = (TranslationUnitPtr * count)()
+        lib.createTranslationUnitsBatchWithMode(
+            (c_char_p * count)(*(p.encode() for p in paths)), count, thread_count,
+            mode.native_value, pointers
+        )
+
+        units = [
+            PyTranslationUnit(lib=lib, tu_ptr=ptr, path=path, mode=mode)
+            for ptr, path in zip(pointers, paths) if ptr
+        ]
+        if len(units) != count:
+            for unit in units:
+                unit.release()
+            failed_path = next(path for ptr, path in zip(pointers, paths) if not ptr)
+            raise RuntimeError(cls._parse_error_message(failed_path))
+        return units
 
     def __del__(self) -> None:
         # Ensure resources are released when the instance is garbage collected.
@@ -47,38 +118,82 @@ class PyTranslationUnit:
 
     def nodes_count(self) -> int:
         """Gets the total number of AST nodes within this translation unit."""
-        return self._lib.getTranslationUnitNodesCount(self._tu_ptr)
+        return self._lib.getTranslationUnitNodesCount(self.ptr)
 
     def tokens_count(self) -> int:
         """Retrieves the count of tokens parsed in the translation unit."""
-        return self._lib.getTranslationUnitTokensCount(self._tu_ptr)
+        return self._lib.getTranslationUnitTokensCount(self.ptr)
 
     def errors_count(self) -> int:
         """Retrieves the count of errors parsed in the translation unit."""
-        return self._lib.getTranslationUnitErrorsCount(self._tu_ptr)
+        return self._lib.getTranslationUnitErrorsCount(self.ptr)
 
     def nodes(self) -> list[PyASTNode]:
         """A list of AST nodes parsed in the translation unit."""
-        nodes = self._lib.getTranslationUnitNodes(self._tu_ptr).to_list(ASTNode)
+        nodes = self._lib.getTranslationUnitNodes(self.ptr).to_list(ASTNode)
         return list(map(lambda n: PyASTNode(self, n), nodes))
 
     def root_nodes(self) -> list[PyASTNode]:
         """The root AST nodes parsed in the translation unit."""
-        root_nodes = []
-        index_list = self._lib.getTranslationUnitRootNodes(self._tu_ptr).to_list(c_uint32)
-        for index in index_list:
-            node = self._lib.getTranslationUnitNodeFromIndex(self._tu_ptr, index)
-            root_nodes.append(PyASTNode(self, node))
-        return root_nodes
+        nodes = self._lib.getTranslationUnitRootNodeStructs(self.ptr).to_list(ASTNode)
+        return [PyASTNode(self, node) for node in nodes]
 
     def tokens(self) -> list[ASTToken]:
         """A list of AST tokens parsed in the translation unit."""
-        return self._lib.getTranslationUnitTokens(self._tu_ptr).to_list(ASTToken)
+        return self._lib.getTranslationUnitTokens(self.ptr).to_list(ASTToken)
 
     def errors(self) -> list[ErrorReport]:
         """A list of ErrorReport instances for all errors encountered during parsing.
         Parsing continues despite errors, so this list may contain multiple reports."""
-        return self._lib.getTranslationUnitErrors(self._tu_ptr).to_list(ErrorReport)
+        return self._lib.getTranslationUnitErrors(self.ptr).to_list(ErrorReport)
+
+    def render_errors(self) -> str:
+        """All parsing errors formatted as `line:column: error: message` lines,
+        rendered natively in a single call. Empty if there are no errors."""
+        rendered = self._lib.renderTranslationUnitErrors(self.ptr)
+        if rendered.is_empty:
+            return ""
+        return rendered.to_list(PyString)[0]
+
+    def render(self) -> str:
+        """The whole source formatted by Zig's own renderer, like `zig fmt` would.
+        Comments and doc comments are preserved.
+
+        Raises a RuntimeError if the source has parsing errors.
+
+        .. versionadded:: 0.2.4
+        """
+        rendered = self._lib.renderTranslationUnit(self.ptr)
+        if rendered.is_empty:
+            raise RuntimeError(
+                f"Cannot render translation unit '{self._path}', because it has parsing errors."
+            )
+        return rendered.to_list(PyString)[0]
+
+    def reset_from_path(self, path: str) -> None:
+        """Reparses the unit from a file, reusing the memory of the previous parse.
+        Nodes obtained from this unit before the reset raise a RuntimeError afterwards.
+
+        .. versionadded:: 0.2.4
+        """
+        self._reset(self._lib.resetTranslationUnit, path.encode(), path)
+
+    def reset_from_source(self, source: str) -> None:
+        """Reparses the unit from source, reusing the memory of the previous parse.
+        Nodes obtained from this unit before the reset raise a RuntimeError afterwards.
+
+        .. versionadded:: 0.2.4
+        """
+        self._reset(self._lib.resetTranslationUnitFromSource, source.encode(), None)
+
+    def _reset(self, reset_func: Any, argument: bytes, path: Optional[str]) -> None:
+        if self._released:
+            raise RuntimeError("Cannot reset a translation unit that has been released.")
+        self._path = path or "null"
+        self._generation += 1
+        if not reset_func(self.ptr, argument):
+            # The unit still holds a valid, empty tree at this point.
+            raise RuntimeError(self._parse_error_message(self._path))
 
     def release(self) -> None:
         """Manually release TranslationUnit memory.
@@ -91,13 +206,39 @@ class PyTranslationUnit:
     @property
     def source(self) -> str:
         """Fetches the full source code as a decoded UTF-8 string."""
-        return self._lib.getTranslationUnitSource(self._tu_ptr).to_list(PyString)[0]
+        return self._lib.getTranslationUnitSource(self.ptr).to_list(PyString)[0]
+
+    @property
+    def parse_time(self) -> float:
+        """Seconds the native parser spent on the current source, measured natively,
+        so it is exact even for units parsed in a batch. Reading the file is not included.
+
+        .. versionadded:: 0.2.4
+        """
+        return self._lib.getTranslationUnitParseTime(self.ptr) / 1e9
+
+    @property
+    def generation(self) -> int:
+        """How many times the unit has been reset. Nodes remember the generation
+        they were obtained in and refuse to read a newer tree.
+
+        .. versionadded:: 0.2.4
+        """
+        return self._generation
 
     @property
     def path(self) -> str:
         """The original file path used for parsing."""
         return self._path
 
+    @property
+    def mode(self) -> ParseMode:
+        """How the source was parsed. Kept when the unit is reset.
+
+        .. versionadded:: 0.2.4
+        """
+        return self._mode
+
     @property
     def released(self) -> bool:
         """Whether the translation unit has been released."""
@@ -105,7 +246,13 @@ class PyTranslationUnit:
 
     @property
     def ptr(self) -> Any:
-        """Gets the low-level pointer to the translation unit."""
+        """Gets the low-level pointer to the translation unit.
+
+        .. versionchanged:: 0.2.4
+            Raises a RuntimeError if the unit has been released.
+        """
+        if self._released:
+            raise RuntimeError(f"Translation unit '{self._path}' has been released.")
         return self._tu_ptr
 
     @property
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import Iterable, Iterator, Optional, Sequence
+
+DEFAULT_INCLUDE: tuple[str, ...] = ("*.zig",)
+"""Patterns of the files discovered by default.
+
+.. versionadded:: 0.2.4
+"""
+
+DEFAULT_EXCLUDE: tuple[str, ...] = (".git", ".zig-cache", "zig-cache", "zig-out")
+"""Build outputs and VCS directories that never hold sources worth parsing.
+
+.. versionadded:: 0.2.4
+"""
+
+
+class PathPattern:
+    """A glob pattern with `.gitignore` semantics.
+
+    Patterns without a slash match the name of a file or directory at any depth.
+    Patterns with a slash (other than a trailing one) match the path relative to
+    the directory they are defined in. ``*`` and ``?`` never match a slash, while
+    ``**`` matches across directories. A trailing slash matches only directories,
+    and a leading ``!`` negates the pattern.
+
+    .. versionadded:: 0.2.4
+    """
+
+    __slots__ = ("pattern", "negated", "directories_only", "_anchored", "_regex")
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+        self.negated = pattern.startswith("!")
+        if self.negated:
+            pattern = pattern[1:]
+        self.directories_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        self._anchored = "/" in pattern
+        self._regex = re.compile(_translate(pattern.lstrip("/")))
+
+    def __repr__(self) -> str:
+        return f"PathPattern({self.pattern!r})"
+
+    def matches(self, relative_path: str, is_dir: bool) -> bool:
+        """Whether the pattern matches a ``/`` separated path relative to its directory."""
+        if self.directories_only and not is_dir:
+            return False
+        if self._anchored:
+            return self._regex.fullmatch(relative_path) is not None
+        return self._regex.fullmatch(relative_path.rpartition("/")[2]) is not None
+
+
+def _translate(pattern: str) -> str:
+    result = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            result.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            result.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "[":
+            translated, i = _translate_class(pattern, i)
+            result.append(translated)
+        else:
+            result.append(re.escape(char))
+        i += 1
+    return "".join(result)
+
+
+def _translate_class(pattern: str, start: int) -> tuple[str, int]:
+    """Translates the ``[...]`` class at ``start``. Returns it with the index of its
+    closing bracket, or an escaped ``[`` if the class is never closed."""
+    end = pattern.find("]", start + 2)
+    if end == -1:
+        return re.escape("["), start
+    body = pattern[start + 1:end]
+    if body.startswith("!"):
+        body = "^" + body[1:]
+    return "[" + body.replace("\\", "\\\\") + "]", end
+
+
+class _IgnoreRules:
+    """Patterns of a `.gitignore` file, applied to its directory and below.
+    Later patterns win, like in git."""
+
+    __slots__ = ("base", "patterns")
+
+    def __init__(self, base: str, patterns: list[PathPattern]) -> None:
+        self.base = base
+        self.patterns = patterns
+
+    @classmethod
+    def read(cls, base: str, file_path: str) -> Optional[_IgnoreRules]:
+        try:
+            with open(file_path, encoding="utf-8", errors="replace") as file:
+                lines = file.read().splitlines()
+        except OSError:
+            return None
+        patterns = [
+            PathPattern(line.rstrip())
+            for line in lines if line.strip() and not line.startswith("#")
+        ]
+        return cls(base, patterns) if patterns else None
+
+    def ignored(self, relative_path: str, is_dir: bool) -> Optional[bool]:
+        """None when no pattern decides, so outer rules still apply."""
+        if self.base:
+            relative_path = relative_path[len(self.base) + 1:]
+        for pattern in reversed(self.patterns):
+            if pattern.matches(relative_path, is_dir):
+                return not pattern.negated
+        return None
+
+
+def discover_files(
+        dir_path: str,
+        include: Sequence[str] = DEFAULT_INCLUDE,
+        exclude: Sequence[str] = DEFAULT_EXCLUDE,
+        use_gitignore: bool = True,
+) -> Iterator[str]:
+    """Lazily yields the files under ``dir_path`` that match any of the ``include``
+    patterns and none of the ``exclude`` patterns. Patterns follow `PathPattern`
+    and are relative to ``dir_path``.
+
+    Excluded and ignored directories are pruned without being listed, so build
+    outputs and dependency trees cost a single directory entry. Files of a directory
+    are yielded before its subdirectories, and both are sorted by name, so the order
+    is the same on every run.
+
+    If ``use_gitignore`` is True, `.gitignore` files found in ``dir_path`` and below
+    are honored for their own subtree. Symbolic links to directories are not followed.
+
+    .. versionadded:: 0.2.4
+    """
+    include_patterns = [PathPattern(pattern) for pattern in include]
+    exclude_patterns = [PathPattern(pattern) for pattern in exclude]
+    yield from _walk(dir_path, "", include_patterns, exclude_patterns, use_gitignore, [])
+
+
+def _walk(
+        directory: str,
+        relative_dir: str,
+        include: list[PathPattern],
+        exclude: list[PathPattern],
+        use_gitignore: bool,
+        ignore_rules: list[_IgnoreRules],
+) -> Iterator[str]:
+    try:
+        with os.scandir(directory) as iterator:
+            entries = sorted(iterator, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    if use_gitignore and any(entry.name == ".gitignore" for entry in entries):
+        rules = _IgnoreRules.read(relative_dir, os.path.join(directory, ".gitignore"))
+        if rules is not None:
+            ignore_rules = [*ignore_rules, rules]
+
+    subdirectories = []
+    for entry in entries:
+        relative_path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+        try:
+            # Symlinked directories are not followed, so links back up the tree
+            # can not yield the same files again.
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if _excluded(relative_path, is_dir, exclude, ignore_rules):
+            continue
+        if is_dir:
+            subdirectories.append((entry.path, relative_path))
+        elif any(pattern.matches(relative_path, False) for pattern in include):
+            yield entry.path
+
+    for path, relative_path in subdirectories:
+        yield from _walk(path, relative_path, include, exclude, use_gitignore, ignore_rules)
+
+
+def _excluded(
+        relative_path: str,
+        is_dir: bool,
+        exclude: Iterable[PathPattern],
+        ignore_rules: list[_IgnoreRules],
+) -> bool:
+    if any(pattern.matches(relative_path, is_dir) for pattern in exclude):
+        return True
+    # The innermost .gitignore that has a matching pattern decides.
+    for rules in reversed(ignore_rules):
+        ignored = rules.ignored(relative_path, is_dir)
+        if ignored is not None:
+            return ignored
+    return False
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .source_file import SourceFile
+
+
+class LiveUnits:
+    """Keeps at most `max_live_units` source files parsed at the same time.
+
+    Files report every access to their translation unit. When a file gets parsed
+    while the limit is reached, the least recently used file is released, and
+    parsed again only when it is accessed the next time. Elements obtained from
+    the released file are materialized first, see `SourceFile.release`.
+
+    .. versionadded:: 0.2.4
+    """
+
+    def __init__(self, max_live_units: int) -> None:
+        if max_live_units < 1:
+            raise ValueError("max_live_units must be at least 1.")
+        self.max_live_units = max_live_units
+        self._files: OrderedDict[int, SourceFile] = OrderedDict()
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"LiveUnits(live={len(self)}, max_live_units={self.max_live_units})"
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def touch(self, source_file: SourceFile) -> None:
+        """Marks the file as the most recently used one, releasing the least
+        recently used files over the limit."""
+        with self._lock:
+            key = id(source_file)
+            if key in self._files:
+                self._files.move_to_end(key)
+                return
+            self._files[key] = source_file
+            evicted = [
+                self._files.popitem(last=False)[1]
+                for _ in range(len(self._files) - self.max_live_units)
+            ]
+        # Released outside the lock, because releasing calls `discard`.
+        for file in evicted:
+            file.release()
+
+    def discard(self, source_file: SourceFile) -> None:
+        """Stops tracking the file, e.g. after it has been released."""
+        with self._lock:
+            self._files.pop(id(source_file), None)
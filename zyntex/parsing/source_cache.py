@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from hashlib import blake2b
+from threading import Lock
+from typing import Callable, Optional, TYPE_CHECKING
+
+from .bindings import PyTranslationUnit, ParseMode, get_native_library
+from .syntax import INodeElement, default_registry
+
+if TYPE_CHECKING:
+    from .syntax import InternTable
+
+
+class CacheEntry:
+    """A translation unit shared by every source with the same content.
+
+    .. versionadded:: 0.2.4
+    """
+
+    __slots__ = ("key", "unit", "references", "_content")
+
+    def __init__(self, key: tuple[bytes, ParseMode, int], unit: PyTranslationUnit) -> None:
+        self.key = key
+        self.unit = unit
+        self.references = 0
+        self._content: Optional[list[INodeElement]] = None
+
+    def __repr__(self) -> str:
+        return f"CacheEntry(references={self.references}, unit={self.unit})"
+
+    @property
+    def content(self) -> list[INodeElement]:
+        """Top-level elements of the unit, created once and shared."""
+        if self._content is None:
+            self._content = default_registry.elements(self.unit.root_nodes())
+        return self._content
+
+
+class SourceCache:
+    """Parses identical sources only once.
+
+    Pass the same cache to `SourceFile`, `SourceCode` or `SourceModule` instances.
+    Sources are looked up by a hash of their content, their parse mode and their
+    `InternTable`, so equal files at different paths and repeated snippets share one
+    translation unit and one list of elements. Both are shared, so they must be treated
+    as read-only. A unit parsed from a file keeps the path of the first file with
+    that content.
+
+    Every source holds a reference to its entry until it is released, and the
+    translation unit is released together with the last reference.
+
+    .. versionadded:: 0.2.4
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[bytes, ParseMode, int], CacheEntry] = {}
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"SourceCache(entries={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def acquire_path(
+            self, path: str, mode: ParseMode, intern_table: Optional[InternTable] = None
+    ) -> CacheEntry:
+        """Returns the entry for the content of a file, parsing it if no source
+        with the same content has been parsed yet. Adds a reference to the entry.
+        The content is only hashed in Python; the file is parsed natively from its path,
+        like `PyTranslationUnit.from_path`."""
+        with open(path, "rb") as file:
+            data = file.read()
+        return self._acquire(
+            data, mode, intern_table,
+            lambda: PyTranslationUnit.from_path(get_native_library(), path, mode),
+        )
+
+    def acquire_source(
+            self, source: str, mode: ParseMode, intern_table: Optional[InternTable] = None
+    ) -> CacheEntry:
+        """Like `acquire_path`, but for source code."""
+        return self._acquire(
+            source.encode(), mode, intern_table,
+            lambda: PyTranslationUnit.from_source(get_native_library(), source, mode),
+        )
+
+    def release(self, entry: CacheEntry) -> None:
+        """Removes a reference to the entry, releasing its unit with the last one."""
+        with self._lock:
+            entry.references -= 1
+            if entry.references > 0:
+                return
+            if self._entries.get(entry.key) is entry:
+                del self._entries[entry.key]
+        entry.unit.release()
+
+    def clear(self) -> None:
+        """Releases every unit of the cache, no matter how many references they have."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.unit.release()
+
+    def _acquire(
+            self,
+            data: bytes,
+            mode: ParseMode,
+            intern_table: Optional[InternTable],
+            parse: Callable[[], PyTranslationUnit],
+    ) -> CacheEntry:
+        # The entry's unit keeps its table alive, so the id is not reused while it exists.
+        key = (blake2b(data, digest_size=16).digest(), mode, id(intern_table))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.references += 1
+                return entry
+
+        # Parsed outside the lock, so different sources can be parsed concurrently.
+        unit = parse()
+        unit.intern_table = intern_table
+        with self._lock:
+            entry = self._entries.setdefault(key, CacheEntry(key, unit))
+            entry.references += 1
+        if entry.unit is not unit:
+            unit.release()  # Another thread parsed the same source first.
+        return entry
@@ -1,13 +1,11 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
 
-from .syntax import (
-    INodeElement,
-    FunctionDeclaration,
-    VariableDeclaration,
-    TestDeclaration,
-)
-from .bindings import PyTranslationUnit, ErrorReport, get_native_library
+from .syntax import INodeElement, InternTable, default_registry
+from .bindings import PyTranslationUnit, ErrorReport, ParseMode, get_native_library
+
+if TYPE_CHECKING:
+    from .source_cache import SourceCache, CacheEntry
 
 
 class SourceCode:
@@ -26,29 +24,126 @@ class SourceCode:
         unit or other derived properties (like `.content`) are first accessed.
 
         .. versionadded:: 0.1.3
+    intern_table:
+        Optional table shared with other sources, so equal identifiers and
+        structurally identical types are stored only once.
+
+        .. versionadded:: 0.2.4
+    cache:
+        Optional cache shared with other sources, so identical sources are parsed
+        once and share their translation unit and `content`.
+        The shared unit and elements must not be modified.
+
+        .. versionadded:: 0.2.4
     """
 
-    def __init__(self, source: str, lazy_parsing: bool = False) -> None:
+    def __init__(
+            self,
+            source: str,
+            lazy_parsing: bool = False,
+            intern_table: Optional[InternTable] = None,
+            cache: Optional[SourceCache] = None,
+    ) -> None:
+        self._setup(source, intern_table, cache, None)
+        if not lazy_parsing:
+            self._set_unit(self._parse(source))
+
+    def _setup(
+            self,
+            source: Optional[str],
+            intern_table: Optional[InternTable],
+            cache: Optional[SourceCache],
+            printer: Optional[Callable[[SourceCode], str]],
+    ) -> None:
         self._source = source
+        self._intern_table = intern_table
+        self._cache = cache
+        self._cache_entry: Optional[CacheEntry] = None
+        self._printer = printer
 
-        self._unit: Optional[PyTranslationUnit] = None if lazy_parsing else (
-            PyTranslationUnit.from_source(lib=get_native_library(), source=source)
-        )
+        self._unit: Optional[PyTranslationUnit] = None
         self._content: Optional[list[INodeElement]] = None
         self._errors: Optional[list[ErrorReport]] = None
+        self._diagnostics: Optional[list[str]] = None
+
+    @classmethod
+    def from_elements(
+            cls,
+            elements: Iterable[INodeElement],
+            printer: Callable[[SourceCode], str],
+            validate: bool = False,
+    ) -> SourceCode:
+        """Creates a SourceCode holding the given elements, without parsing anything.
+
+        The elements are printed and parsed only when the translation unit, errors
+        or diagnostics are accessed for the first time.
+
+        Parameters
+        ----------
+        elements:
+            Top-level elements, e.g. created directly in Python for code generation.
+        printer:
+            Renders the source code to Zig, e.g. ``DefaultCodePrinter().print``.
+        validate:
+            If True, the elements are printed and parsed once right away, and a
+            ValueError with the diagnostics is raised if the result is not valid Zig.
+
+        .. versionadded:: 0.2.4
+        """
+        source_code = cls.__new__(cls)
+        source_code._setup(None, None, None, printer)
+        source_code._content = list(elements)
+        if validate and source_code.diagnostics:
+            raise ValueError(
+                "Elements do not form valid Zig source:\n" + "\n".join(source_code.diagnostics)
+            )
+        return source_code
+
+    def _parse(self, source: str) -> PyTranslationUnit:
+        if self._cache is None:
+            return PyTranslationUnit.from_source(lib=get_native_library(), source=source)
+        self._cache_entry = self._cache.acquire_source(source, ParseMode.FULL, self._intern_table)
+        return self._cache_entry.unit
+
+    def _set_unit(self, unit: PyTranslationUnit) -> None:
+        if self._cache_entry is None:
+            unit.intern_table = self._intern_table
+        self._unit = unit
+
+    def release(self) -> None:
+        """Releases the translation unit, or the reference to a shared one.
+        Everything is parsed again on the next access. The elements of a source
+        created with `from_elements` are kept and printed again instead.
+
+        .. versionadded:: 0.2.4
+        """
+        if self._cache is not None and self._cache_entry is not None:
+            self._cache.release(self._cache_entry)
+            self._cache_entry = None
+        elif self._unit is not None:
+            self._unit.release()
+        self._unit = None
+        self._errors = None
+        self._diagnostics = None
+        if self._printer is None:
+            self._content = None
+        else:
+            self._source = None
 
     def __repr__(self) -> str:
+        if self._source is None:
+            return f"SourceCode(elements={len(self.content)})"
         return f"SourceFile(size={len(self._source)})"
 
     @property
     def content(self) -> list[INodeElement]:
         """A list of top-level elements parsed from the source string."""
         if self._content is None:
-            self._content = []
-            for node in self.unit.root_nodes():
-                for node_type in self.types:
-                    if node_type.is_node_valid(node):
-                        self._content.append(node_type.from_node(node))
+            unit = self.unit
+            if self._cache_entry is not None:
+                self._content = self._cache_entry.content
+            else:
+                self._content = default_registry.elements(unit.root_nodes())
         return self._content
 
     @property
@@ -58,6 +153,16 @@ class SourceCode:
             self._errors = self.unit.errors()
         return self._errors
 
+    @property
+    def diagnostics(self) -> list[str]:
+        """Human-readable parsing errors in the `line:column: error: message` format.
+
+        .. versionadded:: 0.2.4
+        """
+        if self._diagnostics is None:
+            self._diagnostics = self.unit.render_errors().splitlines()
+        return self._diagnostics
+
     @property
     def unit(self) -> PyTranslationUnit:
         """
@@ -65,13 +170,19 @@ class SourceCode:
 
         .. versionadded:: 0.1.3
         """
+        if self._source is None:
+            assert self._printer is not None
+            self._source = self._printer(self)
         if self._unit is None:
-            self._unit = PyTranslationUnit.from_source(
-                lib=get_native_library(), source=self._source
-            )
+            self._set_unit(self._parse(self._source))
+        assert self._unit is not None
         return self._unit
 
     @property
     def types(self) -> tuple[type[INodeElement], ...]:
-        """Supported top-level node element types."""
-        return TestDeclaration, FunctionDeclaration, VariableDeclaration
+        """Supported top-level node element types.
+
+        .. versionchanged:: 0.2.4
+            Types registered in `default_registry`.
+        """
+        return default_registry.element_types
@@ -1,8 +1,12 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Optional, Union, TYPE_CHECKING
 
-from .syntax import INodeElement, FunctionDeclaration, VariableDeclaration, TestDeclaration
-from .bindings import PyTranslationUnit, ErrorReport, get_native_library
+from .syntax import INodeElement, InternTable, default_registry
+from .bindings import PyTranslationUnit, ErrorReport, ParseMode, get_native_library
+
+if TYPE_CHECKING:
+    from .live_units import LiveUnits
+    from .source_cache import SourceCache, CacheEntry
 
 
 class SourceFile:
@@ -21,29 +25,145 @@ class SourceFile:
         unit or other derived properties (like `.content`) are first accessed.
 
         .. versionadded:: 0.1.3
+    intern_table:
+        Optional table shared with other files, so equal identifiers and
+        structurally identical types are stored only once.
+
+        .. versionadded:: 0.2.4
+    mode:
+        A `ParseMode` or its value. With ``"declarations"``, function bodies are
+        blanked out before parsing, so only declarations are parsed and kept in memory.
+        `FunctionDeclaration.body` then holds only whitespace.
+
+        .. versionadded:: 0.2.4
+    live_units:
+        Optional limit of parsed files shared with other files. When it is
+        reached, the least recently used file is released.
+
+        .. versionadded:: 0.2.4
+    cache:
+        Optional cache shared with other sources, so files with identical content
+        are parsed once and share their translation unit and `content`.
+        The shared unit and elements must not be modified.
+
+        .. versionadded:: 0.2.4
     """
 
-    def __init__(self, file_path: str, lazy_parsing: bool = False) -> None:
+    def __init__(
+            self,
+            file_path: str,
+            lazy_parsing: bool = False,
+            intern_table: Optional[InternTable] = None,
+            mode: Union[ParseMode, str] = ParseMode.FULL,
+            live_units: Optional[LiveUnits] = None,
+            cache: Optional[SourceCache] = None,
+    ) -> None:
         self._file_path = file_path
+        self._intern_table = intern_table
+        self._mode = ParseMode(mode)
+        self._live_units = live_units
+        self._cache = cache
+        self._cache_entry: Optional[CacheEntry] = None
 
-        self._unit: Optional[PyTranslationUnit] = None if lazy_parsing else (
-            PyTranslationUnit.from_path(lib=get_native_library(), path=file_path)
-        )
+        self._unit: Optional[PyTranslationUnit] = None
+        if not lazy_parsing:
+            self._set_unit(self._parse())
         self._content: Optional[list[INodeElement]] = None
         self._errors: Optional[list[ErrorReport]] = None
+        self._diagnostics: Optional[list[str]] = None
+
+    @classmethod
+    def from_unit(
+            cls, unit: PyTranslationUnit, intern_table: Optional[InternTable] = None
+    ) -> SourceFile:
+        """Creates a SourceFile around an already parsed translation unit.
+
+        .. versionadded:: 0.2.4
+        """
+        source_file = cls(
+            unit.path, lazy_parsing=True, intern_table=intern_table, mode=unit.mode
+        )
+        source_file._set_unit(unit)
+        return source_file
+
+    def _parse(self) -> PyTranslationUnit:
+        if self._cache is None:
+            return PyTranslationUnit.from_path(
+                lib=get_native_library(), path=self._file_path, mode=self._mode
+            )
+        self._cache_entry = self._cache.acquire_path(
+            self._file_path, self._mode, self._intern_table
+        )
+        return self._cache_entry.unit
+
+    def _set_unit(self, unit: PyTranslationUnit) -> None:
+        if self._cache_entry is None:
+            unit.intern_table = self._intern_table
+        self._unit = unit
+        if self._live_units is not None:
+            self._live_units.touch(self)
 
     def __repr__(self) -> str:
         return f"SourceFile(path={self.path})"
 
+    def reload(self) -> None:
+        """Parses the file again, reusing the memory of the current translation unit.
+        Elements obtained from `content` before reloading must not be used afterwards;
+        reading attributes they have not resolved yet raises a RuntimeError.
+
+        .. versionadded:: 0.2.4
+        """
+        if self._cache_entry is not None:
+            # A shared unit cannot be reset in place.
+            self.release()
+            return
+        if self._unit is None or self._unit.released:
+            self._unit = None
+        else:
+            self._unit.reset_from_path(self._file_path)
+        self._content = None
+        self._errors = None
+        self._diagnostics = None
+
+    def release(self) -> None:
+        """Releases the translation unit of the file. Everything is parsed again
+        on the next access. Elements obtained from `content` before releasing are
+        materialized first, so they stay fully usable without the unit.
+
+        .. versionadded:: 0.2.4
+        """
+        if self._content is not None and not self.released:
+            for element in self._content:
+                element.materialize()
+        if self._cache is not None and self._cache_entry is not None:
+            self._cache.release(self._cache_entry)
+            self._cache_entry = None
+        elif self._unit is not None:
+            self._unit.release()
+        self._unit = None
+        self._content = None
+        self._errors = None
+        self._diagnostics = None
+        if self._live_units is not None:
+            self._live_units.discard(self)
+
+    @property
+    def released(self) -> bool:
+        """Whether the file currently holds no parsed translation unit.
+
+        .. versionadded:: 0.2.4
+        """
+        return self._unit is None or self._unit.released
+
     @property
     def content(self) -> list[INodeElement]:
         """A list of top-level elements parsed from the file."""
         if self._content is None:
-            self._content = []
-            for node in self.unit.root_nodes():
-                for node_type in self.types:
-                    if node_type.is_node_valid(node):
-                        self._content.append(node_type.from_node(node))
+            unit = self.unit
+            if self._cache_entry is not None:
+                self._content = self._cache_entry.content
+            else:
+                self._content = default_registry.elements(unit.root_nodes())
         return self._content
 
     @property
@@ -58,6 +178,18 @@ class SourceFile:
             self._errors = self.unit.errors()
         return self._errors
 
+    @property
+    def diagnostics(self) -> list[str]:
+        """Human-readable parsing errors in the `path:line:column: error: message` format.
+
+        .. versionadded:: 0.2.4
+        """
+        if self._diagnostics is None:
+            self._diagnostics = [
+                f"{self._file_path}:{line}" for line in self.unit.render_errors().splitlines()
+            ]
+        return self._diagnostics
+
     @property
     def unit(self) -> PyTranslationUnit:
         """
@@ -66,12 +198,33 @@ class SourceFile:
         .. versionadded:: 0.1.3
         """
         if self._unit is None:
-            self._unit = PyTranslationUnit.from_path(
-                lib=get_native_library(), path=self._file_path
-            )
+            self._set_unit(self._parse())
+        elif self._live_units is not None:
+            self._live_units.touch(self)
+        assert self._unit is not None
         return self._unit
 
+    @property
+    def mode(self) -> ParseMode:
+        """How the file is parsed.
+
+        .. versionadded:: 0.2.4
+        """
+        return self._mode
+
+    @property
+    def intern_table(self) -> Optional[InternTable]:
+        """The table shared with other files, if any.
+
+        .. versionadded:: 0.2.4
+        """
+        return self._intern_table
+
     @property
     def types(self) -> tuple[type[INodeElement], ...]:
-        """Supported top-level node element types."""
-        return FunctionDeclaration, VariableDeclaration, TestDeclaration
+        """Supported top-level node element types.
+
+        .. versionchanged:: 0.2.4
+            Types registered in `default_registry`.
+        """
+        return default_registry.element_types
@@ -1,15 +1,136 @@
-from concurrent.futures import ThreadPoolExecutor
-from os import walk, path, cpu_count
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from enum import Enum
+from os import cpu_count, stat
+from queue import SimpleQueue
+from threading import Event
+from time import monotonic
 
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, Union, Sequence, cast
 
-from .bindings import init_native_library
+from .bindings import PyTranslationUnit, ParseMode, init_native_library, get_native_library
 from .source_file import SourceFile
+from .live_units import LiveUnits
+from .source_cache import SourceCache
+from .discovery import discover_files, DEFAULT_INCLUDE, DEFAULT_EXCLUDE
+from .syntax import InternTable
+
+
+class SkipReason(Enum):
+    """Why `SourceModule.scan` skipped a file.
+
+    .. versionadded:: 0.2.4
+    """
+    TOO_LARGE = "too_large"
+    TIMEOUT = "timeout"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class SkippedFile:
+    """A file that was discovered, but not parsed.
+
+    .. versionadded:: 0.2.4
+    """
+    path: str
+    reason: SkipReason
+
+
+@dataclass
+class ScanResult:
+    """Files parsed by `SourceModule.scan`, in discovery order, and the skipped ones.
+
+    .. versionadded:: 0.2.4
+    """
+    files: list[SourceFile] = field(default_factory=list)
+    skipped: list[SkippedFile] = field(default_factory=list)
+
+
+@dataclass
+class ScanOptions:
+    """Which files `SourceModule` discovers, and the budgets of an eager scan.
+
+    .. versionadded:: 0.2.4
+    """
+    include: Sequence[str] = DEFAULT_INCLUDE
+    """Glob patterns of the files to parse, relative to the module directory.
+    See `PathPattern` for the syntax."""
+    exclude: Sequence[str] = DEFAULT_EXCLUDE
+    """Glob patterns of files and directories to skip. Excluded directories are
+    not walked at all. Defaults to `.git` and Zig build outputs."""
+    use_gitignore: bool = True
+    """Whether files and directories ignored by `.gitignore` files are skipped too."""
+    largest_first: bool = True
+    """With threaded eager parsing, files are started from the largest to the smallest,
+    so a huge file picked last does not keep one thread busy while the others idle.
+    `SourceModule.files` keeps the discovery order either way. Sizes are only known once
+    the walk is complete, so set it to False to start parsing while the tree is walked,
+    which is faster for trees of many similar files.
+    The parse time of every file is available as `PyTranslationUnit.parse_time`."""
+    max_file_size: Optional[int] = None
+    """Files larger than this many bytes are skipped without being read,
+    like machine-generated tables. None means no limit."""
+    file_timeout: Optional[float] = None
+    """Seconds a file may take to parse. Slower files are skipped and the scan goes on
+    without them. Eager scans with a timeout always parse in a thread pool. Ignored
+    for lazy parsing, which parses nothing up front.
+
+    A running parse cannot be interrupted, so a timed-out parse keeps occupying its
+    worker until it finishes. One pathological file therefore still takes a worker
+    away for its whole parse time, and with ``max_workers=1`` it stalls the scan."""
+
+
+def _file_size(path: str) -> int:
+    try:
+        return stat(path).st_size
+    except OSError:
+        return 0  # Parsing reports the error.
+
+
+class _ScanObserver:
+    """Forwards scan events to the callbacks given to `SourceModule.scan`."""
+
+    def __init__(
+            self,
+            on_file_parsed: Optional[Callable[[SourceFile], None]],
+            on_progress: Optional[Callable[[int, Optional[int]], None]],
+    ) -> None:
+        self.on_file_parsed = on_file_parsed
+        self.on_progress = on_progress
+        self.processed = 0
+        self.total: Optional[int] = None
+
+    @property
+    def active(self) -> bool:
+        return self.on_file_parsed is not None or self.on_progress is not None
+
+    def parsed(self, file: SourceFile) -> None:
+        if self.on_file_parsed is not None:
+            self.on_file_parsed(file)
+        self._advance()
+
+    def skipped(self) -> None:
+        self._advance()
+
+    def _advance(self) -> None:
+        self.processed += 1
+        if self.on_progress is not None:
+            self.on_progress(self.processed, self.total)
+
+
+def _release_abandoned(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None and future.result() is not None:
+        future.result().release()
 
 
 class SourceModule:
     """Container that discovers and parses .zig files under a directory.
 
+    .. versionchanged:: 0.2.4
+        Files are discovered with `discover_files`, so build outputs and files
+        ignored by `.gitignore` are skipped, and the order no longer depends on the
+        file system: files of a directory come before its subdirectories, sorted by name.
+
     Parameters
     ----------
     dir_path:
@@ -27,6 +148,8 @@ class SourceModule:
         Controls whether parsing work is submitted to a thread pool.
         Using threads can significantly speed up parsing when there are many
         files, because parsing and native calls can run concurrently.
+        With eager parsing, the whole batch is parsed by a native thread pool
+        in a single call.
 
         .. versionadded:: 0.2.3
 
@@ -36,6 +159,38 @@ class SourceModule:
         files.
 
         .. versionadded:: 0.2.3
+
+    intern_table:
+        Table shared by every file of the module, so equal identifiers and
+        structurally identical types are stored only once across the module.
+        None disables interning.
+
+        .. versionadded:: 0.2.4
+
+    mode:
+        Parse mode of every file, see `SourceFile`.
+
+        .. versionadded:: 0.2.4
+
+    max_live_units:
+        Upper bound on the number of files holding a parsed translation unit at the
+        same time, which puts a ceiling on the native memory used by the module.
+        The least recently used files are released and parsed again on their next
+        access. Files are always parsed lazily when this is set. None means no limit.
+
+        .. versionadded:: 0.2.4
+
+    cache:
+        Cache shared by the files, so files with identical content, like vendored
+        copies of the same file, are parsed only once. See `SourceCache`.
+
+        .. versionadded:: 0.2.4
+
+    options:
+        Which files are discovered and the budgets of a scan, see `ScanOptions`.
+        Defaults to every `.zig` file outside of build outputs and ignored files.
+
+        .. versionadded:: 0.2.4
     """
 
     def __init__(
@@ -44,10 +199,20 @@ class SourceModule:
             lazy_parsing: bool = False,
             use_threading: bool = False,
             max_workers: Optional[int] = None,
+            intern_table: Optional[InternTable] = None,
+            mode: Union[ParseMode, str] = ParseMode.FULL,
+            max_live_units: Optional[int] = None,
+            cache: Optional[SourceCache] = None,
+            options: Optional[ScanOptions] = None,
     ) -> None:
         self.lazy_parsing = lazy_parsing
         self.use_threading = use_threading
         self.max_workers = None if max_workers is None else max_workers
+        self.intern_table = intern_table
+        self.mode = ParseMode(mode)
+        self.live_units = None if max_live_units is None else LiveUnits(max_live_units)
+        self.cache = cache
+        self.options = ScanOptions() if options is None else options
 
         self._dir_path = dir_path
 
@@ -57,34 +222,269 @@ class SourceModule:
             f"max_workers={self.max_workers}, lazy_parsing={self.lazy_parsing})"
         )
 
+    @property
+    def paths(self) -> list[str]:
+        """Paths of the files that `files` parses, in the same order.
+        Files larger than `ScanOptions.max_file_size` are left out.
+
+        .. versionadded:: 0.2.4
+        """
+        return list(self._discover())
+
+    def _discover(
+            self, result: Optional[ScanResult] = None, observer: Optional[_ScanObserver] = None
+    ) -> Iterator[str]:
+        options = self.options
+        paths = discover_files(
+            self._dir_path, options.include, options.exclude, options.use_gitignore
+        )
+        if options.max_file_size is None:
+            return paths
+        return self._within_size(paths, options.max_file_size, result, observer)
+
+    @staticmethod
+    def _within_size(
+            paths: Iterator[str],
+            max_file_size: int,
+            result: Optional[ScanResult],
+            observer: Optional[_ScanObserver],
+    ) -> Iterator[str]:
+        for path in paths:
+            if _file_size(path) <= max_file_size:
+                yield path
+                continue
+            if result is not None:
+                result.skipped.append(SkippedFile(path, SkipReason.TOO_LARGE))
+            if observer is not None:
+                observer.skipped()
+
     @property
     def files(self) -> list[SourceFile]:
-        """A list of SourceFile objects for every .zig file under ``dir_path``."""
-        paths: list[str] = []
-        for root, _, files in walk(self._dir_path):
-            for filename in files:
-                if filename.endswith(".zig"):
-                    full_path = path.join(root, filename)
-                    paths.append(full_path)
+        """A list of SourceFile objects for every .zig file under ``dir_path``.
+
+        .. versionchanged:: 0.2.4
+            Files skipped by the budgets are left out, see `scan`.
+        """
+        return self.scan().files
+
+    def scan(
+            self,
+            cancel: Optional[Event] = None,
+            on_file_parsed: Optional[Callable[[SourceFile], None]] = None,
+            on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> ScanResult:
+        """Discovers and parses the files, like `files`, and reports the files skipped
+        because of `ScanOptions.max_file_size`, `ScanOptions.file_timeout` or cancellation.
 
-        if not paths:
-            return []
+        Callbacks are called from the calling thread as soon as each file is done,
+        so results can be processed while the remaining files are still being parsed.
+        With callbacks, eager threaded scans use the Python thread pool instead of
+        the native batch, which only returns once every file is parsed.
 
-        # Sequential parsing path: simple and predictable
-        if not self.use_threading:
-            return [SourceFile(p, lazy_parsing=self.lazy_parsing) for p in paths]
+        Parameters
+        ----------
+        cancel:
+            Event that stops the scan once set. Files that are being parsed are
+            finished, the others are reported as cancelled. It can be set from a callback.
+        on_file_parsed:
+            Called with every parsed file, in completion order.
+            With lazy parsing, files are passed before they are parsed.
+        on_progress:
+            Called after every parsed or skipped file with the number of files
+            processed so far and the total number of files. The total is None while
+            files are still being discovered.
 
-        # Decide number of workers; explicit setting wins,
-        # otherwise compute a reasonable default.
-        max_workers = self.max_workers or min(len(paths), cpu_count() or 4)
+        .. versionadded:: 0.2.4
+        """
+        result = ScanResult()
+        observer = _ScanObserver(on_file_parsed, on_progress)
+        paths = self._discover(result, observer)
 
+        # Sequential parsing path: simple and predictable.
+        # Files with a live units limit are lazy, so there is nothing to parse up front.
+        lazy = self.lazy_parsing or self.live_units is not None
+        if lazy or (not self.use_threading and self.options.file_timeout is None):
+            for path in paths:
+                if cancel is not None and cancel.is_set():
+                    result.skipped.append(SkippedFile(path, SkipReason.CANCELLED))
+                    observer.skipped()
+                else:
+                    result.files.append(self._create_file(path))
+                    observer.parsed(result.files[-1])
+            return result
+
+        # Eager parsing is handed over to the native thread pool in one call,
+        # so Python-side scheduling and the GIL do not get in the way.
+        # The native batch cannot be interrupted, and cached files are looked up
+        # by content first, so those go through the Python pool below.
+        if (
+                self.cache is None and self.options.file_timeout is None and cancel is None
+                and not observer.active
+        ):
+            paths = list(paths)
+            if not paths:
+                return result
+            max_workers = self.max_workers or min(len(paths), cpu_count() or 4)
+            # Native workers pull files in the given order.
+            order = self._schedule(paths)
+            units = PyTranslationUnit.from_paths(
+                get_native_library(), [paths[i] for i in order], thread_count=max_workers,
+                mode=self.mode,
+            )
+            files: list[Optional[SourceFile]] = [None] * len(paths)
+            for index, unit in zip(order, units):
+                files[index] = SourceFile.from_unit(unit, intern_table=self.intern_table)
+            result.files.extend(cast(list[SourceFile], files))
+            return result
+
+        self._parse_in_pool(paths, result, cancel, observer)
+        return result
+
+    def _parse_in_pool(
+            self,
+            paths: Iterable[str],
+            result: ScanResult,
+            cancel: Optional[Event],
+            observer: _ScanObserver,
+    ) -> None:
         # Ensure native library is initialised before spawning workers to avoid
         # races during library load or global init.
         init_native_library()
 
-        with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            sources = list(ex.map(lambda p: SourceFile(p, lazy_parsing=self.lazy_parsing), paths))
-        return sources
+        if self.options.largest_first:
+            paths = list(paths)
+            observer.total = observer.processed + len(paths)
+            indexed = [(i, paths[i]) for i in self._schedule(paths)]
+        else:
+            # Paths are submitted while the walk goes on, so the first files are
+            # parsed before the whole tree has been discovered.
+            indexed = enumerate(paths)
+
+        started: dict[int, float] = {}
+
+        def parse(index: int, path: str) -> Optional[SourceFile]:
+            if cancel is not None and cancel.is_set():
+                return None
+            started[index] = monotonic()
+            return self._create_file(path)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers or cpu_count() or 4)
+        futures: dict[Future, tuple[int, str]] = {}
+        files: dict[int, Optional[SourceFile]] = {}
+        expired: list[tuple[int, str]] = []
+        try:
+            self._submit(executor, parse, indexed, futures, files, observer)
+            pending = {future for future, (index, _) in futures.items() if index not in files}
+            self._collect(pending, futures, started, expired, files, observer)
+        finally:
+            executor.shutdown(wait=not expired, cancel_futures=bool(expired))
+        self._fill_result(result, futures, files, expired)
+
+    def _submit(
+            self,
+            executor: ThreadPoolExecutor,
+            parse: Callable[[int, str], Optional[SourceFile]],
+            indexed: Iterable[tuple[int, str]],
+            futures: dict[Future, tuple[int, str]],
+            files: dict[int, Optional[SourceFile]],
+            observer: _ScanObserver,
+    ) -> None:
+        """Submits every path to the executor. Files that finish while later paths
+        are still being discovered are added to `files` and reported right away."""
+        finished: SimpleQueue[Future] = SimpleQueue()
+        processed_before = observer.processed
+        for index, path in indexed:
+            future = executor.submit(parse, index, path)
+            futures[future] = (index, path)
+            if observer.active:
+                future.add_done_callback(finished.put)
+                while not finished.empty():
+                    self._record(finished.get(), futures, files, observer)
+        observer.total = processed_before + len(futures)
+
+    def _collect(
+            self,
+            pending: set[Future],
+            futures: dict[Future, tuple[int, str]],
+            started: dict[int, float],
+            expired: list[tuple[int, str]],
+            files: dict[int, Optional[SourceFile]],
+            observer: _ScanObserver,
+    ) -> None:
+        """Waits for the pending futures and adds the parsed files to `files` by index,
+        None for cancelled ones. Files that run longer than the timeout go to `expired`."""
+        file_timeout = self.options.file_timeout
+        poll_interval = None if file_timeout is None else file_timeout / 10
+        while pending:
+            done, pending = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._record(future, futures, files, observer)
+            if file_timeout is not None:
+                for future in self._expired_futures(pending, futures, started, file_timeout):
+                    # A running parse cannot be interrupted, so it is abandoned instead.
+                    pending.discard(future)
+                    expired.append(futures[future])
+                    future.add_done_callback(_release_abandoned)
+                    observer.skipped()
+
+    @staticmethod
+    def _record(
+            future: Future,
+            futures: dict[Future, tuple[int, str]],
+            files: dict[int, Optional[SourceFile]],
+            observer: _ScanObserver,
+    ) -> None:
+        file = files[futures[future][0]] = future.result()
+        if file is None:
+            observer.skipped()
+        else:
+            observer.parsed(file)
+
+    @staticmethod
+    def _expired_futures(
+            pending: Iterable[Future],
+            futures: dict[Future, tuple[int, str]],
+            started: dict[int, float],
+            file_timeout: float,
+    ) -> list[Future]:
+        now = monotonic()
+        return [
+            future for future in pending
+            if now - started.get(futures[future][0], now) > file_timeout
+        ]
+
+    @staticmethod
+    def _fill_result(
+            result: ScanResult,
+            futures: dict[Future, tuple[int, str]],
+            files: dict[int, Optional[SourceFile]],
+            expired: list[tuple[int, str]],
+    ) -> None:
+        """Adds the files to `result` in discovery order, and the skipped ones."""
+        timed_out = {index for index, _ in expired}
+        for index, path in sorted(futures.values()):
+            if index in timed_out:
+                result.skipped.append(SkippedFile(path, SkipReason.TIMEOUT))
+            elif files[index] is None:
+                result.skipped.append(SkippedFile(path, SkipReason.CANCELLED))
+            else:
+                result.files.append(cast(SourceFile, files[index]))
+
+    def _schedule(self, paths: list[str]) -> list[int]:
+        """Indices of `paths` in the order they should be parsed."""
+        if not self.options.largest_first:
+            return list(range(len(paths)))
+        return sorted(range(len(paths)), key=lambda index: _file_size(paths[index]), reverse=True)
+
+    def _create_file(self, file_path: str) -> SourceFile:
+        return SourceFile(
+            file_path,
+            lazy_parsing=self.lazy_parsing or self.live_units is not None,
+            intern_table=self.intern_table,
+            mode=self.mode,
+            live_units=self.live_units,
+            cache=self.cache,
+        )
 
     @property
     def dir_path(self) -> str:
@@ -1,9 +1,11 @@
 from .function_declaration import FunctionDeclaration
 from .variable_declaration import VariableDeclaration
 from .test_declaration import TestDeclaration
-from .lazy_init import LazyInit, lazy_invoke
+from .lazy_init import LazyInit, lazy_invoke, lazy_property
 from .node_element import INodeElement
 from .type_node import TypeNode
+from .intern_table import InternTable
+from .registry import ElementRegistry, default_registry
 
 __all__ = (
     "INodeElement",
@@ -11,6 +13,10 @@ __all__ = (
     "VariableDeclaration",
     "TestDeclaration",
     "TypeNode",
+    "InternTable",
+    "ElementRegistry",
+    "default_registry",
     "LazyInit",
-    "lazy_invoke"
+    "lazy_invoke",
+    "lazy_property"
 )
@@ -1,8 +1,8 @@
 from typing import Optional, Union
 from dataclasses import dataclass
 
-from ..bindings import PyASTNode, NodeTag, PyString
-from .lazy_init import LazyInit, lazy_invoke
+from ..bindings import PyASTNode, NodeTag, NodeModifier, PyString, SignatureParam, GenericSlice
+from .lazy_init import LazyInit, lazy_property
 from .node_element import INodeElement
 from .type_node import TypeNode
 
@@ -10,11 +10,33 @@ from .type_node import TypeNode
 class FunctionDeclaration(INodeElement):
     """Represents a Zig function declaration."""
 
+    NODE_TAGS: tuple[NodeTag, ...] = (NodeTag.FN_DECL,)
+    """Tags of the nodes that are always function declarations.
+
+    .. versionadded:: 0.2.4
+    """
+
+    PROTOTYPE_TAGS: tuple[NodeTag, ...] = (
+        NodeTag.FN_PROTO,
+        NodeTag.FN_PROTO_ONE,
+        NodeTag.FN_PROTO_SIMPLE,
+        NodeTag.FN_PROTO_MULTI,
+    )
+    """Tags of prototypes without a body, which are declarations only if extern.
+
+    .. versionadded:: 0.2.4
+    """
+
+    _source: Optional[LazyInit] = None
+    """Marker of the parsed node, kept to hash the declaration on demand."""
+
     @dataclass
     class FunctionParam:
         name: str
         type: TypeNode
         is_comptime: bool
+        is_noalias: bool = False
+        """.. versionadded:: 0.2.4"""
 
     def __init__(
             self,
@@ -25,6 +47,7 @@ class FunctionDeclaration(INodeElement):
             is_public: Union[bool, LazyInit] = False,
             is_extern: Union[bool, LazyInit] = False,
             is_export: Union[bool, LazyInit] = False,
+            doc_comment: Union[str, None, LazyInit] = None,
     ) -> None:
         self._name = name
         self._body = body
@@ -33,45 +56,39 @@ class FunctionDeclaration(INodeElement):
         self._is_public = is_public
         self._is_extern = is_extern
         self._is_export = is_export
+        self._doc_comment = doc_comment
 
     @classmethod
     def from_node(cls, node: PyASTNode) -> "FunctionDeclaration":
         assert cls.is_node_valid(node), "Provided node is not a function declaration."
         lazy = LazyInit(node)
-        return cls(
+        element = cls(
             name=lazy,
             body=lazy,
             return_type=lazy,
             is_public=lazy,
             is_extern=lazy,
             is_export=lazy,
-            params=lazy
+            params=lazy,
+            doc_comment=lazy,
         )
+        element._source = lazy
+        return element
 
     @staticmethod
     def is_node_valid(node: PyASTNode) -> bool:
-        if node.tag == NodeTag.FN_DECL:
+        tag = node.tag
+        if tag in FunctionDeclaration.NODE_TAGS:
             return True
-        return node.is_extern and node.tag in (
-            NodeTag.FN_PROTO,
-            NodeTag.FN_PROTO_ONE,
-            NodeTag.FN_PROTO_SIMPLE,
-            NodeTag.FN_PROTO_MULTI
-        )
+        return tag in FunctionDeclaration.PROTOTYPE_TAGS and node.is_extern()
 
-    @property
-    @lazy_invoke
+    @lazy_property
     def name(self) -> str:
         assert isinstance(self._name, LazyInit)
-        self._name = self._name.node.spelling
+        self._name = self._string(self._name, self._name.signature[0].name)
         return self._name
 
-    @name.setter
-    def name(self, value: str) -> None:
-        self._name = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def body(self) -> Optional[str]:
         """Raw body of the function declaration. None if the function is declared with extern."""
         assert isinstance(self._body, LazyInit)
@@ -81,77 +98,95 @@ class FunctionDeclaration(INodeElement):
             self._body = None
         return self._body
 
-    @body.setter
-    def body(self, value: Optional[str]) -> None:
-        self._body = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def return_type(self) -> TypeNode:
         assert isinstance(self._return_type, LazyInit)
-        return_type: Optional[PyASTNode] = self._return_type.node.type
-        assert return_type is not None, "The function doesn't have a return type."
+        header, _, records = self._return_type.signature
+        assert header.return_type_records, "The function doesn't have a return type."
 
-        self._return_type = TypeNode.from_node(return_type)
+        self._return_type = TypeNode.from_records(
+            iter(records), self._return_type.node.parent.intern_table
+        )
         return self._return_type
 
-    @return_type.setter
-    def return_type(self, value: TypeNode) -> None:
-        self._return_type = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def params(self) -> list[FunctionParam]:
         """List of function parameters."""
         assert isinstance(self._params, LazyInit)
-        result = []
-        for param_data in self._params.node.params:
-            result.append(
-                FunctionDeclaration.FunctionParam(
-                    name=param_data.name.to_list(PyString)[0],
-                    type=TypeNode.from_node(PyASTNode(self._params.node.parent, param_data.type)),
-                    is_comptime=param_data.is_comptime,
-                )
+        header, params, records = self._params.signature
+        intern_table = self._params.node.parent.intern_table
+        remaining_records = iter(records[header.return_type_records:])
+        self._params = [
+            FunctionDeclaration.FunctionParam(
+                name=self._string(self._params, param.name),
+                type=TypeNode.from_records(remaining_records, intern_table),
+                is_comptime=bool(param.flags & SignatureParam.FLAG_COMPTIME),
+                is_noalias=bool(param.flags & SignatureParam.FLAG_NOALIAS),
             )
-        self._params = result
+            for param in params
+        ]
         return self._params
 
-    @params.setter
-    def params(self, value: list[FunctionParam]) -> None:
-        self._params = value
+    @lazy_property
+    def calling_convention(self) -> Optional[str]:
+        """Raw argument of `callconv(...)`, like `.c`. None if not specified.
 
-    @property
-    @lazy_invoke
+        .. versionadded:: 0.2.4
+        """
+        if self._source is None:
+            return None
+        calling_convention = self._source.signature[0].calling_convention
+        return None if calling_convention.is_empty else calling_convention.to_list(PyString)[0]
+
+    @lazy_property
     def is_public(self) -> bool:
         """Whether the function is marked as pub."""
         assert isinstance(self._is_public, LazyInit)
-        self._is_public = self._is_public.node.is_public()
+        self._is_public = NodeModifier.PUBLIC in self._is_public.modifiers
         return self._is_public
 
-    @is_public.setter
-    def is_public(self, value: bool) -> None:
-        self._is_public = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def is_extern(self) -> bool:
         """True, if the function is declared with extern."""
         assert isinstance(self._is_extern, LazyInit)
-        self._is_extern = self._is_extern.node.is_extern()
+        self._is_extern = NodeModifier.EXTERN in self._is_extern.modifiers
         return self._is_extern
 
-    @is_extern.setter
-    def is_extern(self, value: bool) -> None:
-        self._is_extern = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def is_export(self) -> bool:
         """True, if the function is declared with export."""
         assert isinstance(self._is_export, LazyInit)
-        self._is_export = self._is_export.node.is_export()
+        self._is_export = NodeModifier.EXPORT in self._is_export.modifiers
         return self._is_export
 
-    @is_export.setter
-    def is_export(self, value: bool) -> None:
-        self._is_export = value
+    @lazy_property
+    def doc_comment(self) -> Optional[str]:
+        """The `///` doc comment of the function, without the comment markers."""
+        assert isinstance(self._doc_comment, LazyInit)
+        self._doc_comment = self._doc_comment.node.doc_comment
+        return self._doc_comment
+
+    @staticmethod
+    def _string(lazy: LazyInit, text: GenericSlice) -> str:
+        value = text.to_list(PyString)[0]
+        intern_table = lazy.node.parent.intern_table
+        return value if intern_table is None else intern_table.string(value)
+
+    @property
+    def structural_hash(self) -> Optional[int]:
+        """Stable hash of the parsed declaration, ignoring whitespace and comments.
+        None for declarations that were not parsed from source.
+        It is not updated when attributes are reassigned.
+
+        .. versionadded:: 0.2.4
+        """
+        return None if self._source is None else self._source.structural_hash
+
+    @property
+    def signature_hash(self) -> Optional[int]:
+        """Like `structural_hash`, but the body is left out, so only changes
+        to the prototype of the function are visible.
+
+        .. versionadded:: 0.2.4
+        """
+        return None if self._source is None else self._source.signature[0].signature_hash
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class InternTable:
+    """Shares equal strings and structurally identical types between parsed files.
+
+    Pass the same table to every `SourceFile` (or to a `SourceModule`) to let
+    identifiers, `TypeNode` and `TypeNode.CustomType` instances be reused instead of
+    created per occurrence. Shared types can then be compared by identity.
+    Shared `TypeNode` and `TypeNode.CustomType` instances are read-only,
+    use `copy.copy` to get a modifiable one.
+
+    .. versionadded:: 0.2.4
+    """
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._objects: dict[Hashable, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"InternTable(strings={len(self._strings)}, objects={len(self._objects)})"
+
+    def __len__(self) -> int:
+        return len(self._strings) + len(self._objects)
+
+    def string(self, value: str) -> str:
+        """Returns the shared instance of a string equal to `value`."""
+        return self._strings.setdefault(value, value)
+
+    def shared(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Returns the object stored under `key`, creating it with `factory` on first use."""
+        value = self._objects.get(key)
+        if value is None:
+            value = self._objects.setdefault(key, factory())
+        return value
+
+    def clear(self) -> None:
+        """Drops every shared object."""
+        self._strings.clear()
+        self._objects.clear()
@@ -1,20 +1,69 @@
 from __future__ import annotations
 
 from functools import wraps
-from typing import Callable, TYPE_CHECKING
+from typing import Any, Callable, Generic, Optional, TypeVar, TYPE_CHECKING, overload
+
+from ..bindings import NodeModifier
 
 if TYPE_CHECKING:
-    from ..bindings import PyASTNode
+    from ..bindings import PyASTNode, SignatureHeader, SignatureParam, TypeRecord
+
+T = TypeVar("T")
+_MISSING = object()
 
 
 class LazyInit:
     """Marker object that carries a PyASTNode to support lazy attribute init.
 
     Instances of this class are stored on objects to indicate that the real
-    attribute value should be computed later from the provided AST node."""
+    attribute value should be computed later from the provided AST node.
+    A single marker is shared by all lazy fields of an element, so it also caches
+    node data that several fields are resolved from."""
+
+    __slots__ = ("node", "_modifiers", "_signature", "_structural_hash")
 
     def __init__(self, node: PyASTNode) -> None:
         self.node = node
+        self._modifiers: Optional[NodeModifier] = None
+        self._signature: Optional[
+            tuple[SignatureHeader, list[SignatureParam], list[TypeRecord]]
+        ] = None
+        self._structural_hash: Optional[int] = None
+
+    @property
+    def modifiers(self) -> NodeModifier:
+        """Modifier keywords of the node. Fetched once on first access.
+
+        .. versionadded:: 0.2.4
+        """
+        if self._modifiers is None:
+            self._modifiers = self.node.modifiers
+        return self._modifiers
+
+    @property
+    def signature(self) -> tuple[SignatureHeader, list[SignatureParam], list[TypeRecord]]:
+        """Prototype of a function node, see `PyASTNode.function_signature`.
+        Fetched once on first access, together with the modifiers.
+
+        .. versionadded:: 0.2.4
+        """
+        if self._signature is None:
+            signature = self.node.function_signature
+            assert signature is not None, "The node is not a function."
+            self._signature = signature
+            if self._modifiers is None:
+                self._modifiers = NodeModifier(signature[0].modifiers)
+        return self._signature
+
+    @property
+    def structural_hash(self) -> int:
+        """See `PyASTNode.structural_hash`. Fetched once on first access.
+
+        .. versionadded:: 0.2.4
+        """
+        if self._structural_hash is None:
+            self._structural_hash = self.node.structural_hash
+        return self._structural_hash
 
 
 def lazy_invoke(func: Callable):
@@ -37,3 +86,49 @@ def lazy_invoke(func: Callable):
         return value
 
     return wrapper
+
+
+class lazy_property(Generic[T]):  # pylint: disable=invalid-name
+    """A replacement for `@property` stacked on `@lazy_invoke` and a trivial setter.
+
+    Until the first read, the value is kept in the private attribute `_<property_name>`.
+    If it is a `LazyInit` marker, the decorated method runs once to produce the value.
+    The value is then cached in the instance under the property name itself, and the
+    private attribute is dropped. This is a non-data descriptor, so later reads are
+    plain instance attribute lookups that never call into Python code, and assigning
+    to the property simply writes that same instance attribute.
+
+    .. versionadded:: 0.2.4
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.attr_name = f"_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.attr_name = f"_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> lazy_property[T]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> T: ...
+
+    def __get__(self, instance: Optional[object], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        values = instance.__dict__
+        value = values.get(self.attr_name, _MISSING)
+        if value.__class__ is LazyInit or value is _MISSING:
+            value = self.func(instance)
+        values.pop(self.attr_name, None)
+        values[self.name] = value
+        return value
+
+    if TYPE_CHECKING:
+        # Only declared for type checkers, so assignments type check. Defining it at
+        # runtime would turn this into a data descriptor and slow down every read.
+        def __set__(self, instance: object, value: T) -> None: ...
@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from inspect import getmembers
+
+from .lazy_init import lazy_property
 
 
 class INodeElement(ABC):
@@ -20,3 +24,20 @@ class INodeElement(ABC):
     @abstractmethod
     def is_node_valid(node) -> bool:
         raise NotImplementedError
+
+    def materialize(self) -> None:
+        """Resolves every lazy attribute, so the element keeps working after its
+        translation unit has been released.
+
+        .. versionadded:: 0.2.4
+        """
+        for name in _resolved_attributes(type(self)):
+            getattr(self, name)
+
+
+@lru_cache(maxsize=None)
+def _resolved_attributes(element_type: type) -> tuple[str, ...]:
+    return tuple(
+        name for name, attribute in getmembers(element_type)
+        if isinstance(attribute, (lazy_property, property))
+    )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional
+
+from ..bindings import PyASTNode, NodeTag
+from .node_element import INodeElement
+from .function_declaration import FunctionDeclaration
+from .variable_declaration import VariableDeclaration
+from .test_declaration import TestDeclaration
+
+NodePredicate = Callable[[PyASTNode], bool]
+
+
+class ElementRegistry:
+    """Maps node tags to the element types created from top-level nodes.
+
+    Finding the element type of a node is a single list lookup by its tag,
+    no matter how many element types are registered. Register your own
+    `INodeElement` types in `default_registry` to have them included in
+    `SourceFile.content` and `SourceCode.content`.
+
+    .. versionadded:: 0.2.4
+    """
+
+    def __init__(self) -> None:
+        size = max(tag.value for tag in NodeTag) + 1
+        self._candidates: list[tuple[tuple[type[INodeElement], Optional[NodePredicate]], ...]] = (
+            [()] * size
+        )
+        self._element_types: dict[type[INodeElement], None] = {}
+
+    def __repr__(self) -> str:
+        return f"ElementRegistry(types={self.element_types})"
+
+    def register(
+            self,
+            element_type: type[INodeElement],
+            tags: Iterable[NodeTag],
+            predicate: Optional[NodePredicate] = None,
+    ) -> None:
+        """Creates `element_type` from nodes with one of the given tags.
+
+        If `predicate` is given, it is called for matching nodes and must return
+        True too. Types registered earlier for the same tag are tried first.
+        """
+        for tag in tags:
+            self._candidates[tag.value] += ((element_type, predicate),)
+        self._element_types[element_type] = None
+
+    def unregister(self, element_type: type[INodeElement]) -> None:
+        """Removes every registration of `element_type`."""
+        self._candidates = [
+            tuple(entry for entry in candidates if entry[0] is not element_type)
+            for candidates in self._candidates
+        ]
+        self._element_types.pop(element_type, None)
+
+    def element_type(self, node: PyASTNode) -> Optional[type[INodeElement]]:
+        """The element type for the node, or None if no registered type matches it."""
+        for element_type, predicate in self._candidates[node.tag_index]:
+            if predicate is None or predicate(node):
+                return element_type
+        return None
+
+    def elements(self, nodes: Iterable[PyASTNode]) -> list[INodeElement]:
+        """Creates elements from the nodes that have a registered type, skipping the rest."""
+        candidates = self._candidates
+        elements: list[INodeElement] = []
+        for node in nodes:
+            for element_type, predicate in candidates[node.tag_index]:
+                if predicate is None or predicate(node):
+                    elements.append(element_type.from_node(node))
+                    break
+        return elements
+
+    @property
+    def element_types(self) -> tuple[type[INodeElement], ...]:
+        """All registered element types, in registration order."""
+        return tuple(self._element_types)
+
+
+default_registry = ElementRegistry()
+"""Registry used by `SourceFile` and `SourceCode` to build their content."""
+
+default_registry.register(FunctionDeclaration, FunctionDeclaration.NODE_TAGS)
+default_registry.register(
+    FunctionDeclaration, FunctionDeclaration.PROTOTYPE_TAGS, PyASTNode.is_extern
+)
+default_registry.register(VariableDeclaration, VariableDeclaration.NODE_TAGS)
+default_registry.register(TestDeclaration, TestDeclaration.NODE_TAGS)
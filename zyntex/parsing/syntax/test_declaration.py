@@ -1,14 +1,27 @@
 from typing import Union, Optional
 
 from ..bindings import PyASTNode, NodeTag
-from .lazy_init import LazyInit, lazy_invoke
+from .lazy_init import LazyInit, lazy_property
 from .node_element import INodeElement
 
 
 class TestDeclaration(INodeElement):
     """Represents a Zig test declaration."""
 
-    def __init__(self, name: Union[str, None, LazyInit], body: Union[str, LazyInit]) -> None:
+    NODE_TAGS: tuple[NodeTag, ...] = (NodeTag.TEST_DECL,)
+    """Tags of the nodes that are test declarations.
+
+    .. versionadded:: 0.2.4
+    """
+
+    _source: Optional[LazyInit] = None
+    """Marker of the parsed node, kept to hash the declaration on demand."""
+
+    def __init__(
+            self,
+            name: Union[str, None, LazyInit],
+            body: Union[str, LazyInit],
+    ) -> None:
         self._name = name
         self._body = body
 
@@ -16,14 +29,15 @@ class TestDeclaration(INodeElement):
     def from_node(cls, node: PyASTNode) -> "TestDeclaration":
         assert cls.is_node_valid(node), "Provided node is not a test declaration."
         lazy = LazyInit(node)
-        return cls(name=lazy, body=lazy)
+        element = cls(name=lazy, body=lazy)
+        element._source = lazy
+        return element
 
     @staticmethod
     def is_node_valid(node: PyASTNode) -> bool:
-        return node.tag == NodeTag.TEST_DECL
+        return node.tag in TestDeclaration.NODE_TAGS
 
-    @property
-    @lazy_invoke
+    @lazy_property
     def name(self) -> Optional[str]:
         """Test name, or `None` for anonymous tests (e.g. `test { ... }`)."""
         assert isinstance(self._name, LazyInit)
@@ -32,12 +46,7 @@ class TestDeclaration(INodeElement):
             self._name = None
         return self._name
 
-    @name.setter
-    def name(self, value: Optional[str]) -> None:
-        self._name = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def body(self) -> str:
         """Raw body of the test."""
         assert isinstance(self._body, LazyInit)
@@ -47,6 +56,12 @@ class TestDeclaration(INodeElement):
         self._body = body
         return self._body
 
-    @body.setter
-    def body(self, value: str) -> None:
-        self._body = value
+    @property
+    def structural_hash(self) -> Optional[int]:
+        """Stable hash of the parsed declaration, ignoring whitespace and comments.
+        None for declarations that were not parsed from source.
+        It is not updated when attributes are reassigned.
+
+        .. versionadded:: 0.2.4
+        """
+        return None if self._source is None else self._source.structural_hash
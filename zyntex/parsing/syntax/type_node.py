@@ -1,11 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, cast, Union
+from hashlib import blake2b
+from typing import Any, Iterator, Optional, cast, Union, TYPE_CHECKING
 
-from ..bindings import PyASTNode, NodeTag, PrimitiveType
+from ..bindings import (
+    PyASTNode, NodeTag, PointerSize, PrimitiveType, TypeRecord, PyString, GenericSlice
+)
 from .node_element import INodeElement
-from .lazy_init import LazyInit, lazy_invoke
+
+if TYPE_CHECKING:
+    from .intern_table import InternTable
+
+_WRAPPER_KINDS = (TypeRecord.KIND_OPTIONAL, TypeRecord.KIND_POINTER, TypeRecord.KIND_ERROR_UNION)
+_READ_ONLY_MESSAGE = (
+    "This {type} is shared through an InternTable and is read-only. "
+    "Modify a copy made with copy.copy() instead."
+)
+
+
+def _record_text(text: GenericSlice) -> Optional[str]:
+    return None if text.is_empty else text.to_list(PyString)[0]
 
 
 class TypeNode(INodeElement):
@@ -13,52 +28,189 @@ class TypeNode(INodeElement):
 
     Provides methods to check if a type is an array, optional,
     pointer, or constant, and to access related subtypes.
-    Distinguishes between primitive and custom (user-defined) types."""
+    Distinguishes between primitive and custom (user-defined) types.
+
+    .. versionchanged:: 0.2.4
+        Nodes shared through an `InternTable` are read-only, because other
+        declarations use them too. `copy.copy` returns a modifiable node.
+    """
 
     @dataclass
     class CustomType:
-        """Represents a non-primitive (user-defined) type name."""
+        """Represents a non-primitive (user-defined) type name.
+
+        .. versionchanged:: 0.2.4
+            Instances shared through an `InternTable` are read-only.
+            `copy.copy` returns a modifiable one.
+        """
         value: str
 
+        def __setattr__(self, name: str, value: Any) -> None:
+            if self.__dict__.get("_shared"):
+                raise AttributeError(_READ_ONLY_MESSAGE.format(type="CustomType"))
+            super().__setattr__(name, value)
+
+        def __copy__(self) -> TypeNode.CustomType:
+            return TypeNode.CustomType(self.value)
+
     def __init__(
             self,
-            array_type: Union[TypeNode, None, LazyInit] = None,
-            array_length: Union[str, None, LazyInit] = None,
-            optional_type: Union[TypeNode, None, LazyInit] = None,
-            pointer_type: Union[TypeNode, None, LazyInit] = None,
-            type: Union[PrimitiveType, CustomType, None, LazyInit] = None,
-            is_const: Union[bool, LazyInit] = False,
-            is_error_union: Union[bool, LazyInit] = False,
+            array_type: Optional[TypeNode] = None,
+            array_length: Optional[str] = None,
+            optional_type: Optional[TypeNode] = None,
+            pointer_type: Optional[TypeNode] = None,
+            type: Union[PrimitiveType, CustomType, None] = None,
+            is_const: bool = False,
+            is_error_union: bool = False,
+            pointer_size: Optional[PointerSize] = None,
+            sentinel: Optional[str] = None,
+            error_set: Optional[TypeNode] = None,
     ) -> None:
-        self._array_type = array_type
-        self._array_length = array_length
-        self._optional_type = optional_type
-        self._pointer_type = pointer_type
-        self._type = type
-        self._is_const = is_const
-        self._is_error_union = is_error_union
+        self.array_type = array_type
+        """Type node of the array, or None if not an array."""
+        self.array_length = array_length
+        """Declared length of the array. None if the type node is not an array.
+
+        The value is returned as a string because it may represent
+        either a numeric literal or a symbolic name (variable/expression)."""
+        self.optional_type = optional_type
+        """The inner type of optional, or None if not optional."""
+        self.pointer_type = pointer_type
+        """The pointed-to type, or None if not a pointer. Slices are pointers too."""
+        self.type = type
+        """Immediate type as PrimitiveType or CustomType, if identifier.
+        Field access and unsupported expressions are kept as CustomType with their source."""
+        self.is_const = is_const
+        """Whether the type is pointed to as const, like `u8` in `[]const u8`."""
+        self.is_error_union = is_error_union
+        """Whether the type is an error union, either inferred (`!T`) or explicit (`E!T`).
+        The node itself describes the payload type `T`."""
+        self.pointer_size = pointer_size
+        """Kind of the pointer, or None if not a pointer.
+
+        .. versionadded:: 0.2.4"""
+        self.sentinel = sentinel
+        """Sentinel value of an array or a pointer, like `0` in `[:0]const u8`.
+
+        .. versionadded:: 0.2.4"""
+        self.error_set = error_set
+        """Error set of an explicit error union (`E` in `E!T`), or None.
+
+        .. versionadded:: 0.2.4"""
 
     @classmethod
     def from_node(cls, node: PyASTNode) -> "TypeNode":
-        assert cls.is_node_valid(node), "Provided node is not a type."
-        lazy = LazyInit(node)
-        return cls(
-            array_type=lazy,
-            array_length=lazy,
-            optional_type=lazy,
-            pointer_type=lazy,
-            type=lazy,
-            is_const=lazy,
-            is_error_union=lazy,
-        )
+        """Builds the whole type tree of the node with a single native call.
+        If the node's translation unit has an `InternTable`, structurally identical
+        types are shared instead of created again. Expressions that `is_node_valid`
+        does not accept, like `@TypeOf(x)` or `struct { ... }`, are kept as CustomType
+        with their source, like in function signatures."""
+        return cls._from_records(iter(node.type_records), node.parent.intern_table)
+
+    @classmethod
+    def from_records(
+            cls, records: Iterator[TypeRecord], intern_table: Optional[InternTable] = None
+    ) -> TypeNode:
+        """Builds a single type tree, consuming exactly its records from `records`.
+        Further records are left for the next call, so several types serialized
+        one after another (like in `PyASTNode.function_signature`) can be read in order.
+
+        .. versionadded:: 0.2.4
+        """
+        return cls._from_records(records, intern_table)
+
+    @classmethod
+    def _from_records(
+            cls,
+            records: Iterator[TypeRecord],
+            table: Optional[InternTable],
+            is_const: bool = False,
+            error_set: Optional[TypeNode] = None,
+    ) -> TypeNode:
+        record = next(records)
+        if record.kind == TypeRecord.KIND_ERROR_UNION:
+            # `E!T` is its payload marked with the error set, like `!T` is marked as inferred.
+            error_set = cls._from_records(records, table)
+            return cls._from_records(records, table, is_const, error_set)
+
+        children = cls._decode_children(record, records, table)
+        text = _record_text(record.text)
+        sentinel = _record_text(record.sentinel)
+
+        def build() -> TypeNode:
+            return cls(
+                is_const=is_const,
+                is_error_union=error_set is not None
+                or bool(record.flags & TypeRecord.FLAG_INFERRED_ERROR),
+                sentinel=sentinel,
+                error_set=error_set,
+                **cls._decode_fields(record, text, children, table),
+            )
+
+        if table is None:
+            return build()
+        # Children are already shared, so their identities fully describe them. The text
+        # of wrapper kinds is their raw source, so it is left out to ignore formatting.
+        key_text = None if record.kind in _WRAPPER_KINDS else text
+        key = (TypeNode, record.kind, record.flags, record.pointer_size, key_text, sentinel,
+               is_const, id(error_set), *map(id, children))
+        return table.shared(key, lambda: _share(build()))
+
+    @classmethod
+    def _decode_children(
+            cls, record: TypeRecord, records: Iterator[TypeRecord], table: Optional[InternTable]
+    ) -> list[TypeNode]:
+        if record.kind in (TypeRecord.KIND_OPTIONAL, TypeRecord.KIND_ARRAY):
+            return [cls._from_records(records, table)]
+        if record.kind == TypeRecord.KIND_POINTER:
+            child_is_const = bool(record.flags & TypeRecord.FLAG_CONST)
+            return [cls._from_records(records, table, is_const=child_is_const)]
+        return []
+
+    @classmethod
+    def _decode_fields(
+            cls,
+            record: TypeRecord,
+            text: Optional[str],
+            children: list[TypeNode],
+            table: Optional[InternTable],
+    ) -> dict[str, Any]:
+        """Constructor arguments specific to the kind of the record."""
+        if record.kind == TypeRecord.KIND_IDENTIFIER:
+            assert text is not None
+            try:
+                return {"type": PrimitiveType(text)}
+            except ValueError:
+                return {"type": cls._custom_type(text, table)}
+        if record.kind == TypeRecord.KIND_OPTIONAL:
+            return {"optional_type": children[0]}
+        if record.kind == TypeRecord.KIND_ARRAY:
+            return {"array_length": text, "array_type": children[0]}
+        if record.kind == TypeRecord.KIND_POINTER:
+            return {"pointer_size": PointerSize(record.pointer_size), "pointer_type": children[0]}
+        return {"type": cls._custom_type(cast(str, text), table)}
+
+    @classmethod
+    def _custom_type(cls, value: str, table: Optional[InternTable]) -> TypeNode.CustomType:
+        if table is None:
+            return cls.CustomType(value)
+        return table.shared((TypeNode.CustomType, value), lambda: _share_custom_type(
+            cls.CustomType(table.string(value))
+        ))
 
     @staticmethod
     def is_node_valid(node: PyASTNode) -> bool:
         return node.tag in (
             NodeTag.OPTIONAL_TYPE,
             NodeTag.ARRAY_TYPE,
+            NodeTag.ARRAY_TYPE_SENTINEL,
             NodeTag.IDENTIFIER,
-            NodeTag.PTR_TYPE_ALIGNED
+            NodeTag.FIELD_ACCESS,
+            NodeTag.PTR_TYPE_ALIGNED,
+            NodeTag.PTR_TYPE_SENTINEL,
+            NodeTag.PTR_TYPE,
+            NodeTag.PTR_TYPE_BIT_RANGE,
+            NodeTag.ERROR_UNION,
         )
 
     def is_array(self) -> bool:
@@ -70,119 +222,12 @@ class TypeNode(INodeElement):
     def is_pointer(self) -> bool:
         return self.pointer_type is not None
 
+    def is_slice(self) -> bool:
+        return self.pointer_size == PointerSize.SLICE
+
     def is_type(self) -> bool:
         return self.type is not None
 
-    @property
-    @lazy_invoke
-    def is_const(self) -> bool:
-        assert isinstance(self._is_const, LazyInit)
-        self._is_const = self._is_const.node.is_const()
-        return self._is_const
-
-    @is_const.setter
-    def is_const(self, value: bool) -> None:
-        self._is_const = value
-
-    @property
-    @lazy_invoke
-    def is_error_union(self) -> bool:
-        assert isinstance(self._is_error_union, LazyInit)
-        self._is_error_union = self._is_error_union.node.is_error_union()
-        return self._is_error_union
-
-    @is_error_union.setter
-    def is_error_union(self, value: bool) -> None:
-        self._is_error_union = value
-
-    @property
-    @lazy_invoke
-    def array_length(self) -> Optional[str]:
-        """Declared length of the array. None if the type node is not an array.
-
-        The value is returned as a string because it may represent
-        either a numeric literal or a symbolic name (variable/expression)."""
-        assert isinstance(self._array_length, LazyInit)
-        if self._array_length.node.tag == NodeTag.ARRAY_TYPE:
-            self._array_length = self._array_length.node.body
-        else:
-            self._array_length = None
-        return self._array_length
-
-    @array_length.setter
-    def array_length(self, value: Optional[str]) -> None:
-        self._array_length = value
-
-    @property
-    @lazy_invoke
-    def array_type(self) -> Optional[TypeNode]:
-        """Type node of the array, or None if not an array."""
-        assert isinstance(self._array_type, LazyInit)
-        if self._array_type.node.tag == NodeTag.ARRAY_TYPE:
-            node_type = self._array_type.node.type
-            assert node_type
-            self._array_type = TypeNode.from_node(node_type)
-        else:
-            self._array_type = None
-        return self._array_type
-
-    @array_type.setter
-    def array_type(self, value: Optional[TypeNode]) -> None:
-        self._array_type = value
-
-    @property
-    @lazy_invoke
-    def optional_type(self) -> Optional[TypeNode]:
-        """The inner type of optional, or None if not optional."""
-        assert isinstance(self._optional_type, LazyInit)
-        if self._optional_type.node.tag == NodeTag.OPTIONAL_TYPE:
-            node_type = self._optional_type.node.type
-            assert node_type is not None
-            self._optional_type = TypeNode.from_node(node_type)
-        else:
-            self._optional_type = None
-        return self._optional_type
-
-    @optional_type.setter
-    def optional_type(self, value: Optional[TypeNode]) -> None:
-        self._optional_type = value
-
-    @property
-    @lazy_invoke
-    def pointer_type(self) -> Optional[TypeNode]:
-        """The pointed-to type, or None if not a pointer."""
-        assert isinstance(self._pointer_type, LazyInit)
-        if self._pointer_type.node.tag == NodeTag.PTR_TYPE_ALIGNED:
-            node_type = self._pointer_type.node.type
-            assert node_type is not None
-            self._pointer_type = TypeNode.from_node(node_type)
-        else:
-            self._pointer_type = None
-        return self._pointer_type
-
-    @pointer_type.setter
-    def pointer_type(self, value: Optional[TypeNode]) -> None:
-        self._pointer_type = value
-
-    @property
-    @lazy_invoke
-    def type(self) -> Optional[PrimitiveType | CustomType]:
-        """Immediate type as PrimitiveType or CustomType, if identifier."""
-        assert isinstance(self._type, LazyInit)
-        if self._type.node.tag == NodeTag.IDENTIFIER:
-            value = self._type.node.spelling
-            try:
-                self._type = PrimitiveType(value)
-            except ValueError:
-                self._type = self.CustomType(value)
-        else:
-            self._type = None
-        return self._type
-
-    @type.setter
-    def type(self, value: Optional[PrimitiveType | CustomType]) -> None:
-        self._type = value
-
     @property
     def absolute_type(self) -> Union[TypeNode.CustomType, PrimitiveType]:
         """Resolve the absolute base type.
@@ -202,3 +247,60 @@ class TypeNode(INodeElement):
                 current_node = cast(TypeNode, current_node.pointer_type)
             else:
                 raise NotImplementedError(f"Type node ({current_node}) is not supported.")
+
+    @property
+    def structural_hash(self) -> int:
+        """Stable hash of the type structure. Structurally identical types have equal
+        hashes, whether they were parsed or created, and the hash is the same across runs.
+
+        .. versionadded:: 0.2.4
+        """
+        digest = blake2b(repr(_structure(self)).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+
+def _structure(node: TypeNode) -> tuple:
+    children = (node.optional_type, node.array_type, node.pointer_type)
+    child = next((child for child in children if child is not None), None)
+    return (
+        type(node.type).__name__, None if node.type is None else node.type.value,
+        node.is_optional(), node.array_length, node.pointer_size, node.sentinel,
+        node.is_const, node.is_error_union,
+        None if node.error_set is None else _structure(node.error_set),
+        None if child is None else _structure(child),
+    )
+
+
+class _SharedTypeNode(TypeNode):
+    """A TypeNode shared through an InternTable, which must not change."""
+
+    def __repr__(self) -> str:
+        return "INodeElement.TypeNode"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(_READ_ONLY_MESSAGE.format(type="TypeNode"))
+
+    def __copy__(self) -> TypeNode:
+        node = TypeNode.__new__(TypeNode)
+        vars(node).update(vars(self))
+        vars(node).pop("_structural_hash", None)
+        return node
+
+    @property
+    def structural_hash(self) -> int:
+        # Shared nodes cannot change, so their hash is computed only once.
+        values = vars(self)
+        if "_structural_hash" not in values:
+            values["_structural_hash"] = super().structural_hash
+        return values["_structural_hash"]
+
+
+def _share(node: TypeNode) -> TypeNode:
+    # Swapping the class keeps plain nodes free of any per-assignment check.
+    object.__setattr__(node, "__class__", _SharedTypeNode)
+    return node
+
+
+def _share_custom_type(custom_type: TypeNode.CustomType) -> TypeNode.CustomType:
+    object.__setattr__(custom_type, "_shared", True)
+    return custom_type
@@ -1,8 +1,8 @@
 from typing import Optional, Union
 
-from ..bindings import PyASTNode, NodeTag
+from ..bindings import PyASTNode, NodeTag, NodeModifier
 
-from .lazy_init import LazyInit, lazy_invoke
+from .lazy_init import LazyInit, lazy_property
 from .node_element import INodeElement
 from .type_node import TypeNode
 
@@ -10,6 +10,20 @@ from .type_node import TypeNode
 class VariableDeclaration(INodeElement):
     """Represents a Zig variable declaration."""
 
+    NODE_TAGS: tuple[NodeTag, ...] = (
+        NodeTag.SIMPLE_VAR_DECL,
+        NodeTag.LOCAL_VAR_DECL,
+        NodeTag.GLOBAL_VAR_DECL,
+        NodeTag.ALIGNED_VAR_DECL,
+    )
+    """Tags of the nodes that are variable declarations.
+
+    .. versionadded:: 0.2.4
+    """
+
+    _source: Optional[LazyInit] = None
+    """Marker of the parsed node, kept to hash the declaration on demand."""
+
     def __init__(
             self,
             name: Union[str, LazyInit],
@@ -20,6 +34,7 @@ class VariableDeclaration(INodeElement):
             is_const: Union[bool, LazyInit] = False,
             is_extern: Union[bool, LazyInit] = False,
             is_export: Union[bool, LazyInit] = False,
+            doc_comment: Union[str, None, LazyInit] = None,
     ) -> None:
         self._name = name
         self._value = value
@@ -29,13 +44,14 @@ class VariableDeclaration(INodeElement):
         self._is_const = is_const
         self._is_extern = is_extern
         self._is_export = is_export
+        self._doc_comment = doc_comment
         self._is_const = is_const
 
     @classmethod
     def from_node(cls, node: PyASTNode) -> "VariableDeclaration":
         assert cls.is_node_valid(node), "Provided node is not a variable declaration."
         lazy = LazyInit(node)
-        return cls(
+        element = cls(
             name=lazy,
             value=lazy,
             type_hint=lazy,
@@ -43,31 +59,23 @@ class VariableDeclaration(INodeElement):
             is_public=lazy,
             is_const=lazy,
             is_extern=lazy,
-            is_export=lazy
+            is_export=lazy,
+            doc_comment=lazy,
         )
+        element._source = lazy
+        return element
 
     @staticmethod
     def is_node_valid(node: PyASTNode) -> bool:
-        return node.tag in (
-            NodeTag.SIMPLE_VAR_DECL,
-            NodeTag.LOCAL_VAR_DECL,
-            NodeTag.GLOBAL_VAR_DECL,
-            NodeTag.ALIGNED_VAR_DECL
-        )
+        return node.tag in VariableDeclaration.NODE_TAGS
 
-    @property
-    @lazy_invoke
+    @lazy_property
     def name(self) -> str:
         assert isinstance(self._name, LazyInit)
         self._name = self._name.node.spelling
         return self._name
 
-    @name.setter
-    def name(self, value: str) -> None:
-        self._name = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def type_hint(self) -> Optional[TypeNode]:
         """The explicit Zig type annotation for the variable, if present."""
         assert isinstance(self._type_hint, LazyInit)
@@ -78,12 +86,7 @@ class VariableDeclaration(INodeElement):
             self._type_hint = None
         return self._type_hint
 
-    @type_hint.setter
-    def type_hint(self, value: Optional[TypeNode]) -> None:
-        self._type_hint = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def alignment(self) -> Optional[str]:
         """The explicit Zig alignment for the variable, if present."""
         assert isinstance(self._alignment, LazyInit)
@@ -97,12 +100,7 @@ class VariableDeclaration(INodeElement):
             self._alignment = None
         return self._alignment
 
-    @alignment.setter
-    def alignment(self, value: Optional[str]) -> None:
-        self._alignment = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def value(self) -> Optional[str]:
         """The raw value of the variable. None if the variable is declared with extern."""
         assert isinstance(self._value, LazyInit)
@@ -112,54 +110,48 @@ class VariableDeclaration(INodeElement):
             self._value = None
         return self._value
 
-    @value.setter
-    def value(self, value: Optional[str]) -> None:
-        self._value = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def is_public(self) -> bool:
         """Whether the variable is marked as pub."""
         assert isinstance(self._is_public, LazyInit)
-        self._is_public = self._is_public.node.is_public()
+        self._is_public = NodeModifier.PUBLIC in self._is_public.modifiers
         return self._is_public
 
-    @is_public.setter
-    def is_public(self, value: bool) -> None:
-        self._is_public = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def is_const(self) -> bool:
         """Whether the variable is declared with const."""
         assert isinstance(self._is_const, LazyInit)
-        self._is_const = self._is_const.node.is_const()
+        self._is_const = NodeModifier.CONST in self._is_const.modifiers
         return self._is_const
 
-    @is_const.setter
-    def is_const(self, value: bool) -> None:
-        self._is_const = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def is_extern(self) -> bool:
         """True, if the variable is declared with extern."""
         assert isinstance(self._is_extern, LazyInit)
-        self._is_extern = self._is_extern.node.is_extern()
+        self._is_extern = NodeModifier.EXTERN in self._is_extern.modifiers
         return self._is_extern
 
-    @is_extern.setter
-    def is_extern(self, value: bool) -> None:
-        self._is_extern = value
-
-    @property
-    @lazy_invoke
+    @lazy_property
     def is_export(self) -> bool:
         """True, if the variable is declared with export."""
         assert isinstance(self._is_export, LazyInit)
-        self._is_export = self._is_export.node.is_export()
+        self._is_export = NodeModifier.EXPORT in self._is_export.modifiers
         return self._is_export
 
-    @is_export.setter
-    def is_export(self, value: bool) -> None:
-        self._is_export = value
+    @lazy_property
+    def doc_comment(self) -> Optional[str]:
+        """The `///` doc comment of the variable, without the comment markers.
+        Containers (e.g. `const Point = struct { ... }`) are variable declarations too."""
+        assert isinstance(self._doc_comment, LazyInit)
+        self._doc_comment = self._doc_comment.node.doc_comment
+        return self._doc_comment
+
+    @property
+    def structural_hash(self) -> Optional[int]:
+        """Stable hash of the parsed declaration, ignoring whitespace and comments.
+        None for declarations that were not parsed from source.
+        It is not updated when attributes are reassigned.
+
+        .. versionadded:: 0.2.4
+        """
+        return None if self._source is None else self._source.structural_hash
@@ -0,0 +1,38 @@
+import ctypes
+
+from typing import Iterable, Optional
+
+from .bindings import get_native_library
+
+
+def check_syntax(paths: Iterable[str], workers: Optional[int] = None) -> list[Optional[int]]:
+    """Counts parsing errors of many files in a single native call.
+
+    Unlike :class:`SourceFile`, no translation unit is built: each file is parsed,
+    its errors are counted and all memory is released straight away, which makes
+    this the cheapest way to tell whether files are syntactically valid.
+
+    Parameters
+    ----------
+    paths:
+        Paths of the Zig source files to check.
+    workers:
+        Number of native threads used for parsing. If None, uses the CPU count.
+
+    Returns
+    -------
+    A list aligned with ``paths``, holding the number of errors of each file
+    (``0`` means the file is valid), or None if the file could not be read.
+
+    .. versionadded:: 0.2.4
+    """
+    encoded_paths = [p.encode() for p in paths]
+    if not encoded_paths:
+        return []
+
+    count = len(encoded_paths)
+    results = (ctypes.c_int64 * count)()
+    get_native_library().checkSyntaxBatch(
+        (ctypes.c_char_p * count)(*encoded_paths), count, workers or 0, results
+    )
+    return [None if errors_count < 0 else errors_count for errors_count in results]